@@ -0,0 +1,90 @@
+"""
+Script to compare the bytes sent by full and changed-zone SVAR writes in a coupling
+loop. At each iteration, the values of a fraction of the cells are changed, either in
+a few zones or spread over all the zones, and uploaded with
+SolutionVariableData.set_data() and SolutionVariableData.set_changed_zones_data().
+The requests are serialized as they would be sent to Fluent.
+Changes are detected per zone and changed zones are sent in full, so there are no
+per-cell savings: the spread scenario, or any scenario with --zones 1, sends as many
+bytes as the full writes.
+Usage: python devel/benchmark_svar_changed_zone_writes.py --zones 50 --cells 20000 --fraction 0.02
+"""
+
+import argparse
+
+import numpy as np
+
+from ansys.api.fluent.v0 import svar_pb2 as SvarProtoModule
+from ansys.fluent.core.services.solution_variables import (
+    SolutionVariableData,
+    SolutionVariableInfo,
+)
+
+
+class _CountingSolutionVariableService:
+    def __init__(self, zone_count: int, cell_count: int):
+        self.zone_count = zone_count
+        self.cell_count = cell_count
+        self.bytes_sent = 0
+
+    def get_zones_info(self, request):
+        response = SvarProtoModule.GetZonesInfoResponse()
+        response.domainsInfo.add(name="mixture", domainId=1)
+        for zone_id in range(self.zone_count):
+            response.zonesInfo.add(
+                name=f"zone-{zone_id}", zoneId=zone_id
+            ).partitionsInfo.add(count=self.cell_count)
+        return response
+
+    def set_data(self, requests):
+        for request in requests:
+            self.bytes_sent += len(request.SerializeToString())
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--zones", type=int, default=50)
+parser.add_argument("--cells", type=int, default=20000, help="Cells per zone")
+parser.add_argument("--fraction", type=float, default=0.02, help="Changed cells")
+parser.add_argument("--iterations", type=int, default=10)
+args = parser.parse_args()
+
+rng = np.random.default_rng(0)
+zone_names = [f"zone-{zone_id}" for zone_id in range(args.zones)]
+changed_count = int(args.fraction * args.zones * args.cells)
+scenarios = {
+    # The changed cells are in as few zones as possible, e.g. a source region.
+    "localized": lambda: np.arange(changed_count),
+    # The changed cells are spread over all the zones.
+    "spread": lambda: rng.choice(args.zones * args.cells, changed_count, False),
+}
+
+print(
+    f"{args.zones} zones x {args.cells} cells, {args.fraction:.1%} of the cells "
+    f"changed at each of {args.iterations} iterations"
+)
+for scenario, get_changed_cells in scenarios.items():
+    bytes_sent = {}
+    for mode in ("full", "changed zones"):
+        service = _CountingSolutionVariableService(args.zones, args.cells)
+        solution_variable_data = SolutionVariableData(
+            service, SolutionVariableInfo(service)
+        )
+        data = np.zeros((args.zones, args.cells))
+        solution_variable_data.set_changed_zones_data(
+            "SV_UDM_I", dict(zip(zone_names, data))
+        )
+        service.bytes_sent = 0
+        for iteration in range(1, args.iterations + 1):
+            data.reshape(-1)[get_changed_cells()] = iteration
+            if mode == "full":
+                solution_variable_data.set_data("SV_UDM_I", dict(zip(zone_names, data)))
+            else:
+                solution_variable_data.set_changed_zones_data(
+                    "SV_UDM_I", dict(zip(zone_names, data))
+                )
+        bytes_sent[mode] = service.bytes_sent
+    print(
+        f"{scenario:>10}: full {bytes_sent['full'] / 2**20:9.2f} MiB, "
+        f"changed zones {bytes_sent['changed zones'] / 2**20:9.2f} MiB "
+        f"({bytes_sent['changed zones'] / bytes_sent['full']:.1%})"
+    )
@@ -89,12 +89,28 @@ DATAMODEL_USE_STATE_CACHE = True
 # Whether to use datamodel attribute caching
 DATAMODEL_USE_ATTR_CACHE = True
 
+# Whether to cache the attributes of settings objects. The cache is cleared by any
+# change made through the settings API and by the case-read, data-read, initialized
+# and settings-cleared events.
+SETTINGS_USE_ATTR_CACHE = False
+
+# Whether to cache the settings static info on disk, per Fluent version and build id,
+# when the generated settings classes are not available
+SETTINGS_USE_STATIC_INFO_CACHE = True
+
 # Whether to stream and cache commands state
 DATAMODEL_USE_NOCOMMANDS_DIFF_STATE = True
 
 # Whether to return the state changes on mutating datamodel rpcs
 DATAMODEL_RETURN_STATE_CHANGES = True
 
+# Whether to cache field information in solver sessions. Only the scalar and vector
+# fields are cached, surfaces are always fetched from Fluent.
+FIELD_INFO_USE_CACHE = True
+
+# Whether to cache zones and solution variables information in solver sessions
+SOLUTION_VARIABLE_INFO_USE_CACHE = True
+
 # Whether to use remote gRPC file transfer service
 USE_FILE_TRANSFER_SERVICE = False
 
@@ -4,6 +4,7 @@ import hashlib
 from io import StringIO
 import keyword
 import pickle
+import shutil
 import time
 from typing import IO
 
@@ -261,6 +262,45 @@ def _write_data(cls_name: str, python_name: str, data: dict, f: IO, f_stub: IO |
         f_stub.write(s_stub.getvalue())
 
 
+def _write_shards(output_dir, version: str, data: dict, header: str, shash: str):
+    # The root class is written to the index module of the shards directory and
+    # each child class of the root class is written to its own module. The child
+    # classes are imported on first access, see flobject._LazyChildClasses.
+    shards_dir = output_dir / f"settings_{version}_shards"
+    if shards_dir.exists():
+        shutil.rmtree(shards_dir)
+    shards_dir.mkdir()
+    for k, v in data["child_classes"].items():
+        _NAME_BY_HASH.clear()
+        _CLASS_WRITTEN.clear()
+        name = _get_unique_name(v["name"])
+        _NAME_BY_HASH[_gethash(v)] = name
+        with open(shards_dir / f"{k}.py", "w") as f:
+            f.write(header)
+            _write_data(name, to_python_name(v["fluent_name"]), v, f, None)
+            f.write(f"shard_root = {name}\n")
+    _NAME_BY_HASH.clear()
+    _CLASS_WRITTEN.clear()
+    name = data["name"]
+    root_data = data | {"child_classes": {}, "child_object_type": None}
+    with open(shards_dir / "__init__.py", "w") as f:
+        f.write(header)
+        f.write("import os\n\n")
+        f.write("from ansys.fluent.core.solver.flobject import _LazyChildClasses\n\n")
+        f.write(f'SHASH = "{shash}"\n\n')
+        _write_data(name, name, root_data, f, None)
+        f.write(f"{name}._child_classes = _LazyChildClasses(\n")
+        f.write("    os.path.dirname(__file__),\n")
+        f.write("    __name__,\n")
+        f.write(f"    {list(data['child_classes'])},\n")
+        names_by_fluent_name = {
+            v["fluent_name"]: k for k, v in data["child_classes"].items()
+        }
+        f.write(f"    {names_by_fluent_name},\n")
+        f.write(")\n")
+    return shards_dir
+
+
 def generate(version: str, static_infos: dict) -> None:
     """Generate the classes corresponding to the Fluent settings API."""
     start_time = time.time()
@@ -299,6 +339,7 @@ def generate(version: str, static_infos: dict) -> None:
         name = data["name"]
         _NAME_BY_HASH[_gethash(data)] = name
         _write_data(name, name, data, f, f_stub)
+    shards_dir = _write_shards(output_dir, version, data, header.getvalue(), shash)
     file_size = output_file.stat().st_size / 1024 / 1024
     file_size_stub = output_stub_file.stat().st_size / 1024 / 1024
     print(
@@ -306,6 +347,10 @@ def generate(version: str, static_infos: dict) -> None:
     )
     print(f"{output_file.name} size: {file_size:.2f} MB")
     print(f"{output_stub_file.name} size: {file_size_stub:.2f} MB")
+    print(
+        f"Generated {len(data['child_classes'])} modules in {shards_dir.name} "
+        "for lazy loading."
+    )
     return {"<solver_session>": api_tree}
 
 
@@ -1,11 +1,16 @@
 """Module to manage datamodel cache."""
 
-from collections import abc, defaultdict
+from collections import abc, defaultdict, deque
 from contextlib import contextmanager
 import copy
+from dataclasses import dataclass
 from enum import Enum
-from threading import RLock
-from typing import Any, Dict, List, Optional
+import functools
+import itertools
+from pathlib import Path
+from threading import Condition, Lock
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from ansys.api.fluent.v0.variant_pb2 import Variant
 from ansys.fluent.core.utils.fluent_version import FluentVersion
@@ -35,6 +40,294 @@ class NameKey(Enum):
         return lst[~lst.index(self)]
 
 
+class _FrozenDict(dict):
+    """Read-only dict of the datamodel cache.
+
+    Frozen dicts only contain frozen values, so they can be shared with the callers of
+    ``DataModelCache.get_state()`` without copying. The cache replaces a frozen dict
+    with a mutable copy before modifying it, so a frozen state is a snapshot which
+    is not affected by later updates of the cache.
+    """
+
+    __slots__ = ("_transformed",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # State with the other name key, see _CacheImpl.transform()
+        self._transformed = None
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "Cached datamodel state is read-only, use copy.deepcopy() to get a "
+            "mutable copy."
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return _FrozenDict, (dict(self),)
+
+
+class _FrozenList(list):
+    """Read-only list of the datamodel cache."""
+
+    __slots__ = ()
+
+    _read_only = _FrozenDict._read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return _FrozenList, (list(self),)
+
+
+def _freeze(value: Any, index: Optional["_NameIndex"] = None) -> Any:
+    """Get a frozen version of a cached value.
+
+    ``index`` is the index of ``value`` if it is a dict, whose nested indexes are
+    updated to the frozen dicts.
+    """
+    if isinstance(value, (_FrozenDict, _FrozenList)):
+        return value
+    if isinstance(value, dict):
+        children = index._children if index is not None else {}
+        items = {}
+        for k, v in value.items():
+            child_index = children.get(k)
+            if child_index is not None and child_index.container is not v:
+                child_index = None
+            items[k] = _freeze(v, child_index)
+        frozen = _FrozenDict(items)
+        if index is not None:
+            index.container = frozen
+        return frozen
+    if isinstance(value, list):
+        return _FrozenList(_freeze(v) for v in value)
+    return value
+
+
+# Value of a missing key
+_MISSING = object()
+# Previous value of a key which is not known
+_UNKNOWN = object()
+
+
+def _is_changed(old: Any, new: Any) -> bool:
+    """Check whether the value of a key has changed."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        # Changes of nested values are recorded when they are set.
+        return new is not old and not new and bool(old)
+    if isinstance(old, list) and isinstance(new, list):
+        return old != new
+    return type(old) is not type(new) or old != new
+
+
+class _ChangeJournal:
+    """Version and bounded journal of the changes of the cached state of rules.
+
+    Entries are the version and path of each change, in increasing order of
+    versions.
+    """
+
+    def __init__(self, max_length: int):
+        self.version = 0
+        self._entries = deque(maxlen=max_length)
+        # Highest version of the entries which were dropped from the journal
+        self._dropped_version = 0
+        # Held while a change is recorded and its version is set in the indexes
+        self.lock = Lock()
+
+    def new_version(self) -> int:
+        """Start a new version."""
+        with self.lock:
+            self.version += 1
+            return self.version
+
+    def record(self, path: str) -> int:
+        """Record a change and return its version.
+
+        This must be called with ``lock`` held.
+        """
+        if len(self._entries) == self._entries.maxlen:
+            self._dropped_version = self._entries[0][0]
+        self._entries.append((self.version, path))
+        return self.version
+
+    def changes_since(self, version: int) -> List[str] | None:
+        """Get the paths changed after a version, or ``None`` if they are not all
+        in the journal."""
+        with self.lock:
+            if version < self._dropped_version:
+                return None
+            paths = set()
+            for entry_version, path in reversed(self._entries):
+                if entry_version <= version:
+                    break
+                paths.add(path)
+            return sorted(paths)
+
+
+class _NameIndex:
+    """Index of the named objects in a dict of the datamodel cache.
+
+    Named objects are stored with ``<type>:<name>`` keys, where the name is either
+    the internal or the display name depending on the configuration. The index maps
+    the type and the internal and display names of each named object to its key, so
+    that the object can be found from either name without iterating over the dict.
+    Indexes of nested dicts are created on first access. ``update()`` must be
+    called whenever a key of the indexed dict is set or deleted.
+
+    The index also tracks where the dict is stored, in the parent index or in the
+    ``holder`` dict for the root of the cache, so that a frozen dict can be replaced
+    by a mutable copy with ``thaw()`` before it is modified.
+
+    ``version`` is the version of the last change in the dict, and the versions of
+    the last changes of its keys are kept as well. Changes which happened before the
+    index was created have the version of the key in the parent index.
+    """
+
+    __slots__ = (
+        "container",
+        "version",
+        "_holder",
+        "_key",
+        "_journal",
+        "_base_version",
+        "_versions",
+        "_keys",
+        "_entries",
+        "_children",
+    )
+
+    def __init__(
+        self,
+        container: dict[str, Any],
+        holder: Union["_NameIndex", dict[str, Any]],
+        key: str,
+        journal: _ChangeJournal | None = None,
+    ):
+        self.container = container
+        self._holder = holder
+        self._key = key
+        if isinstance(holder, _NameIndex):
+            self._journal = holder._journal
+            self._base_version = holder.get_version(key)
+        else:
+            self._journal = journal
+            self._base_version = journal.version
+        self.version = self._base_version
+        self._versions = {}
+        self._keys = {}
+        self._entries = {}
+        self._children = {}
+        for k in container:
+            self._add(k)
+
+    def _add(self, key: str):
+        value = self.container.get(key)
+        if not isinstance(value, abc.Mapping) or ":" not in key:
+            return
+        type_ = key.split(":", maxsplit=1)[0]
+        entries = [
+            (type_, name_key, value[name_key.value])
+            for name_key in NameKey
+            if name_key.value in value
+        ]
+        for entry in entries:
+            self._keys.setdefault(entry, key)
+        self._entries[key] = entries
+
+    def update(self, key: str, old: Any = _UNKNOWN):
+        """Update the index after the value of a key is set or deleted.
+
+        ``old`` is the previous value of the key, the change is only recorded if the
+        value is different.
+        """
+        for entry in self._entries.pop(key, ()):
+            if self._keys.get(entry) == key:
+                del self._keys[entry]
+        if key in self.container:
+            self._add(key)
+        else:
+            self._children.pop(key, None)
+        if old is _UNKNOWN or _is_changed(old, self.container.get(key, _MISSING)):
+            self._record_change(key)
+
+    def _get_path(self, key: str) -> str:
+        keys = [key]
+        index = self
+        while isinstance(index._holder, _NameIndex):
+            keys.append(index._key)
+            index = index._holder
+        return "/".join(reversed(keys))
+
+    def _record_change(self, key: str):
+        with self._journal.lock:
+            self._set_version(key, self._journal.record(self._get_path(key)))
+
+    def _set_version(self, key: str, version: int):
+        index = self
+        while True:
+            if key in index.container:
+                index._versions[key] = version
+            else:
+                index._versions.pop(key, None)
+            if index.version == version:
+                # The parent indexes already have this version.
+                break
+            index.version = version
+            if not isinstance(index._holder, _NameIndex):
+                break
+            index, key = index._holder, index._key
+
+    def get_version(self, key: str) -> int:
+        """Get the version of the last change of the value of a key."""
+        return self._versions.get(key, self._base_version)
+
+    def find(self, type_: str, name_key: NameKey, name: str) -> str | None:
+        """Find the key of a named object from its type and name."""
+        return self._keys.get((type_, name_key, name))
+
+    def child(self, key: str) -> "_NameIndex":
+        """Get the index of a nested dict."""
+        value = self.container[key]
+        index = self._children.get(key)
+        if index is None or index.container is not value:
+            index = self._children[key] = _NameIndex(value, self, key)
+        return index
+
+    def thaw(self) -> dict[str, Any]:
+        """Get the indexed dict to modify it, copying it first if it is frozen."""
+        if isinstance(self.container, _FrozenDict):
+            holder = self._holder
+            if isinstance(holder, _NameIndex):
+                holder = holder.thaw()
+            self.container = holder[self._key] = dict(self.container)
+        return self.container
+
+    def freeze(self) -> _FrozenDict:
+        """Freeze the indexed dict so that it can be shared without copying."""
+        if not isinstance(self.container, _FrozenDict):
+            holder = self._holder
+            if isinstance(holder, _NameIndex):
+                holder = holder.container
+            holder[self._key] = _freeze(self.container, self)
+        return self.container
+
+
 class _CacheImpl:
     def __init__(self, name_key: NameKey):
         self.name_key = name_key
@@ -49,33 +342,35 @@ class _CacheImpl:
             if NameKey.INTERNAL.value in v and v[NameKey.INTERNAL.value] != name_in_key:
                 v[NameKey.DISPLAY.value] = name_in_key
 
-    def find(self, d: dict[str, Any], key: str, default: Any) -> tuple[str, Any]:
-        """Find in dict."""
+    def find(self, index: _NameIndex, key: str, default: Any) -> tuple[str, Any]:
+        """Find in indexed dict.
+
+        If the key is not found, it is returned with ``default`` so that a new
+        named object is keyed by the name in ``key``.
+        """
+        d = index.container
         if key in d:
             return key, d[key]
         if ":" in key:
             type_, name = key.split(":")
-            for k, v in d.items():
-                if (
-                    isinstance(v, abc.Mapping)
-                    and ":" in k
-                    and type_ == k.split(":")[0]
-                    and name == v.get((~self.name_key).value, None)
-                ):
-                    return k, v
-            return None, default
+            k = index.find(type_, ~self.name_key, name)
+            if k is not None:
+                return k, d[k]
         return key, default
 
+    def _transform_key(self, k_in: str, v_in: dict[str, Any]) -> str:
+        return (
+            f'{k_in.split(":")[0]}:{v_in[(~self.name_key).value]}'
+            if ":" in k_in
+            else k_in
+        )
+
     def transform(self, d_in: dict[str, Any], add_missing_name_keys=False):
         """Transform dict."""
         d_out = {}
         for k_in, v_in in d_in.items():
             if isinstance(v_in, abc.Mapping):
-                k_out = (
-                    f'{k_in.split(":")[0]}:{v_in[(~self.name_key).value]}'
-                    if ":" in k_in
-                    else k_in
-                )
+                k_out = self._transform_key(k_in, v_in)
                 v_out = self.transform(v_in, add_missing_name_keys)
                 if add_missing_name_keys:
                     _CacheImpl.add_missing_name_keys(k_in, v_out)
@@ -84,12 +379,31 @@ class _CacheImpl:
                 d_out[k_in] = v_in
         return d_out
 
-    def update(self, d: dict[str, Any], d1: dict[str, Any]):
-        """Update dict."""
+    def transform_frozen(self, d_in: _FrozenDict) -> _FrozenDict:
+        """Transform frozen dict.
+
+        The transformed dict is kept with the frozen dict, so that it is only
+        computed again for the dicts which are modified in the cache.
+        """
+        transformed = d_in._transformed
+        if transformed is None or transformed[0] != self.name_key:
+            d_out = {}
+            for k_in, v_in in d_in.items():
+                if isinstance(v_in, abc.Mapping):
+                    d_out[self._transform_key(k_in, v_in)] = self.transform_frozen(v_in)
+                else:
+                    d_out[k_in] = v_in
+            transformed = d_in._transformed = (self.name_key, _FrozenDict(d_out))
+        return transformed[1]
+
+    def update(self, index: _NameIndex, d1: dict[str, Any]):
+        """Update indexed dict."""
+        d = index.thaw()
         for k1, v1 in d1.items():
-            k, v = self.find(d, k1, None)
+            k, v = self.find(index, k1, None)
+            old = d.get(k, _MISSING)
             if isinstance(v, abc.Mapping) and isinstance(v1, abc.Mapping):
-                self.update(v, v1)
+                self.update(index.child(k), v1)
             else:
                 if isinstance(v1, abc.Mapping):
                     k = (
@@ -99,58 +413,367 @@ class _CacheImpl:
                     )
                     v1 = _CacheImpl(~self.name_key).transform(v1, True)
                     _CacheImpl.add_missing_name_keys(k1, v1)
+                    old = d.get(k, _MISSING)
                 d[k] = v1
+            index.update(k, old)
+
+
+@dataclass
+class LockStatistics:
+    """Contention statistics of the accesses to the datamodel cache.
+
+    Times are in seconds.
+    """
+
+    acquisitions: int = 0
+    contended_acquisitions: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    hold_time: float = 0.0
+    max_hold_time: float = 0.0
+
+    def _record(self, wait_time: float, hold_time: float, contended: bool):
+        self.acquisitions += 1
+        self.contended_acquisitions += contended
+        self.wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        self.hold_time += hold_time
+        self.max_hold_time = max(self.max_hold_time, hold_time)
+
+
+# Compatible modes of the multiple granularity locks: intention shared (IS),
+# intention exclusive (IX), shared (S) and exclusive (X).
+_compatible_lock_modes = {
+    "IS": ("IS", "IX", "S"),
+    "IX": ("IS", "IX"),
+    "S": ("IS", "S"),
+    "X": (),
+}
+
+
+class _IntentLock:
+    """Multiple granularity lock.
+
+    Requests are granted in arrival order: a request waits for the held modes and
+    for the earlier requests which are incompatible with it, so that writers are not
+    starved by readers.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._condition = Condition(self._lock)
+        self._held = dict.fromkeys(_compatible_lock_modes, 0)
+        self._waiting = {}
+        self._tickets = itertools.count()
+
+    def _can_acquire(self, ticket: int, mode: str) -> bool:
+        compatible_modes = _compatible_lock_modes[mode]
+        for held_mode, count in self._held.items():
+            if count and held_mode not in compatible_modes:
+                return False
+        for waiting_ticket, waiting_mode in self._waiting.items():
+            if waiting_ticket == ticket:
+                return True
+            if waiting_mode not in compatible_modes:
+                return False
+        return True
+
+    def acquire(self, mode: str) -> bool:
+        """Acquire the lock in a mode and return whether the request had to wait."""
+        with self._condition:
+            ticket = next(self._tickets)
+            self._waiting[ticket] = mode
+            contended = False
+            try:
+                while not self._can_acquire(ticket, mode):
+                    contended = True
+                    self._condition.wait()
+            finally:
+                del self._waiting[ticket]
+            self._held[mode] += 1
+            return contended
+
+    def try_acquire(self, mode: str) -> bool:
+        """Acquire the lock in a mode without waiting and return whether it was
+        acquired.
+
+        The lock is not acquired if it is held in an incompatible mode or if any
+        request waits for it.
+        """
+        with self._lock:
+            if self._waiting:
+                return False
+            compatible_modes = _compatible_lock_modes[mode]
+            for held_mode, count in self._held.items():
+                if count and held_mode not in compatible_modes:
+                    return False
+            self._held[mode] += 1
+            return True
+
+    def release(self, mode: str):
+        """Release the lock held in a mode."""
+        with self._lock:
+            self._held[mode] -= 1
+            if self._waiting:
+                self._condition.notify_all()
+
+
+class _RulesLocks:
+    """Locks of the cached state of datamodel rules.
+
+    The top-level objects of the state are locked by type, e.g. all the
+    ``TaskObject`` objects share a lock, under an intention lock of the whole state.
+    Readers of a type proceed concurrently with each other and with the accesses
+    to other types. Writers are serialized by the writer lock, as they all modify
+    the root dict of the state and its index, which are shared by all types.
+    """
+
+    def __init__(self):
+        self.root = _IntentLock()
+        self.stripes = {}
+        self.writer = Lock()
+        # Serializes the changes of the cache structure, such as the replacement of
+        # cached dicts by frozen or mutable copies, which concurrent accesses make.
+        self.structure = Lock()
+        self.statistics = {}
+        self.statistics_lock = Lock()
+
+    def stripe(self, name: str) -> _IntentLock:
+        """Get the lock of a top-level type."""
+        lock = self.stripes.get(name)
+        if lock is None:
+            lock = self.stripes.setdefault(name, _IntentLock())
+        return lock
+
+    def record(
+        self,
+        names: List[str],
+        access: str,
+        wait_time: float,
+        hold_time: float,
+        contended: bool,
+    ):
+        """Record the statistics of an access."""
+        with self.statistics_lock:
+            for name in names:
+                statistics = self.statistics.get(name)
+                if statistics is None:
+                    statistics = self.statistics[name] = {
+                        "read": LockStatistics(),
+                        "write": LockStatistics(),
+                    }
+                statistics[access]._record(wait_time, hold_time, contended)
+
+
+class _DictParameterTypes:
+    """Memoized checks of whether the paths of datamodel rules are dict types."""
+
+    def __init__(self, root: type):
+        self._root = root
+        self._is_dict_by_path = {}
+
+    def is_dict(self, rules_path: str) -> bool:
+        """Check if a parameter is a dict type."""
+        is_dict = self._is_dict_by_path.get(rules_path)
+        if is_dict is None:
+            is_dict = self._is_dict_by_path[rules_path] = self._check(rules_path)
+        return is_dict
+
+    def _check(self, rules_path: str) -> bool:
+        from ansys.fluent.core.services.datamodel_se import (
+            PyDictionary,
+            PyNamedObjectContainer,
+            PyParameter,
+        )
+
+        cls = self._root
+        comps = rules_path.split("/")
+        for i, comp in enumerate(comps):
+            if hasattr(cls, comp):
+                cls = getattr(cls, comp)
+                if issubclass(cls, PyParameter) and i < len(comps) - 1:
+                    return False
+                if issubclass(cls, PyNamedObjectContainer):
+                    cls = getattr(cls, f"_{comp}")
+        return issubclass(cls, PyDictionary)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_dict_parameter_types(
+    codegen_outdir: Path, version: FluentVersion, rules: str
+) -> _DictParameterTypes:
+    from ansys.fluent.core.utils import load_module
+
+    module = load_module(
+        rules, codegen_outdir / f"datamodel_{version.number}" / f"{rules}.py"
+    )
+    return _DictParameterTypes(module.Root)
 
 
 def _is_dict_parameter_type(version: FluentVersion, rules: str, rules_path: str):
     """Check if a parameter is a dict type."""
     from ansys.fluent.core import CODEGEN_OUTDIR
-    from ansys.fluent.core.services.datamodel_se import (
-        PyDictionary,
-        PyNamedObjectContainer,
-        PyParameter,
-    )
-    from ansys.fluent.core.utils import load_module
 
     try:
-        module = load_module(
-            rules, CODEGEN_OUTDIR / f"datamodel_{version.number}" / f"{rules}.py"
-        )
+        dict_parameter_types = _get_dict_parameter_types(CODEGEN_OUTDIR, version, rules)
     except FileNotFoundError:  # no codegen or during codegen
         return False
-    cls = module.Root
-    comps = rules_path.split("/")
-    for i, comp in enumerate(comps):
-        if hasattr(cls, comp):
-            cls = getattr(cls, comp)
-            if issubclass(cls, PyParameter) and i < len(comps) - 1:
-                return False
-            if issubclass(cls, PyNamedObjectContainer):
-                cls = getattr(cls, f"_{comp}")
-    return issubclass(cls, PyDictionary)
+    return dict_parameter_types.is_dict(rules_path)
 
 
 class DataModelCache:
     """Class to manage datamodel cache."""
 
     use_display_name = False
+    # Maximum number of changes kept in the change journal of each datamodel rules
+    journal_max_length = 10000
+    # Whether the contention statistics of the accesses to the cached state are
+    # collected, which are returned by get_lock_statistics()
+    collect_lock_statistics = False
 
     def __init__(self):
         """Initialize datamodel cache."""
         self.rules_str_to_cache = defaultdict(dict)
         self.rules_str_to_config = {}
+        self._rules_str_to_index = {}
+        self._rules_str_to_journal = {}
         self._locks = {}
 
+    def _get_locks(self, rules: str) -> _RulesLocks:
+        locks = self._locks.get(rules)
+        if locks is None:
+            locks = self._locks.setdefault(rules, _RulesLocks())
+        return locks
+
     @contextmanager
-    def _with_lock(self, rules: str):
-        if rules not in self._locks:
-            self._locks[rules] = RLock()
-        with self._locks[rules]:
-            yield
+    def _with_lock(self, rules: str, stripes: Iterable[str] | None, write: bool):
+        """Lock the cached state of rules.
+
+        ``stripes`` are the top-level types which are accessed, or ``None`` to lock
+        the whole state. Writers of different types do not run concurrently.
+        """
+        locks = self._get_locks(rules)
+        acquired = []
+        if stripes is None:
+            names = [""]
+            requests = [(locks.root, "X" if write else "S")]
+        else:
+            names = sorted(set(stripes))
+            if not write and locks.root.try_acquire("S"):
+                # No writer holds or waits for the state: the state is read as a
+                # whole, which needs no lock of the types.
+                acquired.append((locks.root, "S"))
+                requests = []
+            else:
+                requests = [(locks.root, "IX" if write else "IS")]
+                requests += [
+                    (locks.stripe(name), "X" if write else "S") for name in names
+                ]
+        collect_statistics = self.collect_lock_statistics
+        if collect_statistics:
+            start = perf_counter()
+        contended = False
+        writer_locked = False
+        completed = False
+        try:
+            if write and stripes is not None:
+                contended = not locks.writer.acquire(blocking=False)
+                if contended:
+                    locks.writer.acquire()
+                writer_locked = True
+            for lock, mode in requests:
+                contended |= lock.acquire(mode)
+                acquired.append((lock, mode))
+            completed = True
+            if collect_statistics:
+                locked = perf_counter()
+            if write and stripes is not None:
+                # The whole state is thawed once, as readers of other types may
+                # freeze their parts of it concurrently.
+                with locks.structure:
+                    self._get_index(rules).thaw()
+            yield locks
+        finally:
+            for lock, mode in reversed(acquired):
+                lock.release(mode)
+            if writer_locked:
+                locks.writer.release()
+            if collect_statistics and completed:
+                locks.record(
+                    names,
+                    "write" if write else "read",
+                    locked - start,
+                    perf_counter() - locked,
+                    contended,
+                )
+
+    @staticmethod
+    def _get_stripes(comps: List[str]) -> List[str] | None:
+        return [comps[0].split(":", maxsplit=1)[0]] if comps else None
+
+    def get_lock_statistics(self, rules: str) -> Dict[str, Dict[str, LockStatistics]]:
+        """Get the contention statistics of the accesses to the cached state.
+
+        The statistics are only collected while ``collect_lock_statistics`` is
+        enabled.
+
+        Parameters
+        ----------
+        rules : str
+            datamodel rules
+
+        Returns
+        -------
+        Dict[str, Dict[str, LockStatistics]]
+            statistics of the ``"read"`` and ``"write"`` accesses for each
+            top-level type of the state, ``""`` being the accesses to the whole
+            state
+        """
+        locks = self._get_locks(rules)
+        with locks.statistics_lock:
+            return copy.deepcopy(locks.statistics)
+
+    def reset_lock_statistics(self, rules: str):
+        """Reset the contention statistics of the accesses to the cached state.
+
+        Parameters
+        ----------
+        rules : str
+            datamodel rules
+        """
+        locks = self._get_locks(rules)
+        with locks.statistics_lock:
+            locks.statistics.clear()
+
+    def _get_journal(self, rules: str) -> _ChangeJournal:
+        journal = self._rules_str_to_journal.get(rules)
+        if journal is None:
+            journal = self._rules_str_to_journal.setdefault(
+                rules, _ChangeJournal(self.journal_max_length)
+            )
+        return journal
+
+    def _get_index(self, rules: str) -> _NameIndex:
+        cache = self.rules_str_to_cache[rules]
+        index = self._rules_str_to_index.get(rules)
+        if index is None or index.container is not cache:
+            journal = self._get_journal(rules)
+            if cache:
+                # The cached state has been replaced.
+                journal.new_version()
+                with journal.lock:
+                    journal.record("")
+            index = self._rules_str_to_index[rules] = _NameIndex(
+                cache, self.rules_str_to_cache, rules, journal
+            )
+        return index
 
     class Empty:
         """Class representing unassigned cached state."""
 
+    class Unchanged:
+        """Class representing cached state which has not changed."""
+
     @staticmethod
     def is_unassigned(state: Any) -> bool:
         """Check whether a cached state is unassigned.
@@ -203,17 +826,21 @@ class DataModelCache:
     def _update_cache_from_variant_state(
         self,
         rules: str,
-        source: Dict[str, StateType],
+        index: _NameIndex,
         key: str,
         state: Variant,
         updater_fn,
         rules_str: str,
         version,
     ):
+        source = index.thaw()
+        old = source.get(key, _MISSING)
+
         # Helper function to update the source with the state value
         def update_source_with_state(state_field):
             if state.HasField(state_field):
                 updater_fn(source, key, getattr(state, state_field))
+                index.update(key, old)
                 return True
             return False
 
@@ -237,13 +864,14 @@ class DataModelCache:
             for item in state.variant_vector_state.item:
                 self._update_cache_from_variant_state(
                     rules,
-                    source,
+                    index,
                     key,
                     item,
                     lambda d, k, v: d[k].append(v),
                     rules_str + "/" + key.split(":", maxsplit=1)[0],
                     version,
                 )
+            index.update(key, old)
             return
 
         # Handle variant map state
@@ -256,8 +884,9 @@ class DataModelCache:
             if ":" in key:
                 type_, iname = key.split(":", maxsplit=1)
                 key = self._determine_key(
-                    source, internal_names_as_keys, key, state, type_, iname
+                    index, internal_names_as_keys, key, state, type_, iname
                 )
+                old = source[key]
             else:
                 if key not in source:
                     source[key] = {}
@@ -267,11 +896,11 @@ class DataModelCache:
 
             # Update the source with items from the variant map state
             if state.variant_map_state.item:
-                source = source[key]
+                child_index = index.child(key)
                 for k, v in state.variant_map_state.item.items():
                     self._update_cache_from_variant_state(
                         rules,
-                        source,
+                        child_index,
                         k,
                         v,
                         dict.__setitem__,
@@ -280,14 +909,16 @@ class DataModelCache:
                     )
             else:
                 source[key] = {}
+            index.update(key, old)
 
         # Default case when no fields are matched
         else:
             updater_fn(source, key, None)
+            index.update(key, old)
 
     def _determine_key(
         self,
-        source: Dict[str, StateType],
+        index: _NameIndex,
         internal_names_as_keys: bool,
         key: str,
         state: Variant,
@@ -295,23 +926,22 @@ class DataModelCache:
         iname: str,
     ) -> str:
         """Determine the appropriate key based on internal naming conventions."""
-        for k1, v1 in source.items():
-            if (internal_names_as_keys and k1 == key) or (
-                (not internal_names_as_keys)
-                and isinstance(v1, dict)
-                and v1.get(NameKey.INTERNAL.value) == iname
-            ):
-                return k1  # Found a matching key
-
-        # If no match found and internal naming is used
+        source = index.thaw()
         if internal_names_as_keys:
-            source[key] = {}
+            if key not in source:
+                source[key] = {}
+                index.update(key)
             return key
 
+        found_key = index.find(type_, NameKey.INTERNAL, iname)
+        if found_key is not None:
+            return found_key
+
         # If no match found and external naming is used
         name = state.variant_map_state.item[NameKey.DISPLAY.value].string_state
         new_key = f"{type_}:{name}"
         source[new_key] = {NameKey.INTERNAL.value: iname}
+        index.update(new_key)
 
         return new_key
 
@@ -331,21 +961,26 @@ class DataModelCache:
         version : FluentVersion, optional
             Fluent version
         """
-        cache = self.rules_str_to_cache[rules]
-
-        with self._with_lock(rules):
+        stripes = {k.split(":", maxsplit=1)[0] for k in state.variant_map_state.item}
+        for deleted_path in deleted_paths:
+            comps = [x for x in deleted_path.split("/") if x]
+            if comps:
+                stripes.update(DataModelCache._get_stripes(comps))
+        with self._with_lock(rules, stripes, write=True):
+            index = self._get_index(rules)
+            self._get_journal(rules).new_version()
             internal_names_as_keys = (
                 self.get_config(rules, "name_key") == NameKey.INTERNAL
             )
 
             # Process deleted paths
-            self._process_deleted_paths(cache, deleted_paths, internal_names_as_keys)
+            self._process_deleted_paths(index, deleted_paths, internal_names_as_keys)
 
             # Update cache with new state items
             for k, v in state.variant_map_state.item.items():
                 self._update_cache_from_variant_state(
                     rules,
-                    cache,
+                    index,
                     k,
                     v,
                     dict.__setitem__,
@@ -355,53 +990,57 @@ class DataModelCache:
 
     def _process_deleted_paths(
         self,
-        cache: Dict[str, Any],
+        index: _NameIndex,
         deleted_paths: List[str],
         internal_names_as_keys: bool,
     ):
         """Process and delete paths from the cache based on the deleted paths list."""
         for deleted_path in deleted_paths:
             comps = [x for x in deleted_path.split("/") if x]
-            self._delete_from_cache(cache, comps, internal_names_as_keys)
+            self._delete_from_cache(index, comps, internal_names_as_keys)
 
     def _delete_from_cache(
-        self, sub_cache: Dict[str, Any], comps: List[str], internal_names_as_keys: bool
+        self, index: _NameIndex, comps: List[str], internal_names_as_keys: bool
     ):
         """Recursively delete components from the cache."""
         for i, comp in enumerate(comps):
+            sub_cache = index.container
             if ":" in comp:
-                _, iname = comp.split(":", maxsplit=1)
+                type_, iname = comp.split(":", maxsplit=1)
                 key_to_del = self._find_key_to_delete(
-                    sub_cache, comp, iname, i == len(comps) - 1, internal_names_as_keys
+                    index,
+                    comp,
+                    type_,
+                    iname,
+                    i == len(comps) - 1,
+                    internal_names_as_keys,
                 )
                 if key_to_del:
-                    del sub_cache[key_to_del]
+                    del index.thaw()[key_to_del]
+                    index.update(key_to_del)
                     return  # Exit after deletion
             else:
-                if comp in sub_cache:
-                    sub_cache = sub_cache[comp]
+                if isinstance(sub_cache.get(comp), abc.Mapping):
+                    index = index.child(comp)
                 else:
                     break
 
     def _find_key_to_delete(
         self,
-        sub_cache: Dict[str, Any],
+        index: _NameIndex,
         comp: str,
+        type_: str,
         iname: str,
         is_last_component: bool,
         internal_names_as_keys: bool,
     ) -> Optional[str]:
         """Find the key to delete from the sub-cache."""
-        for k, v in sub_cache.items():
-            if (internal_names_as_keys and k == comp) or (
-                (not internal_names_as_keys)
-                and isinstance(v, dict)
-                and v.get(NameKey.INTERNAL.value) == iname
-            ):
-                return (
-                    k if is_last_component else None
-                )  # Return key if it's the last component
-        return None  # No key found to delete
+        if internal_names_as_keys:
+            key = comp if comp in index.container else None
+        else:
+            key = index.find(type_, NameKey.INTERNAL, iname)
+        # Return key if it's the last component
+        return key if is_last_component else None
 
     @staticmethod
     def _dm_path_comp(comp):
@@ -412,10 +1051,18 @@ class DataModelCache:
         return [DataModelCache._dm_path_comp(comp) for comp in obj.path]
 
     def get_state(
-        self, rules: str, obj: object, name_key: NameKey | None = None
+        self,
+        rules: str,
+        obj: object,
+        name_key: NameKey | None = None,
+        deep_copy: bool = False,
     ) -> Any:
         """Retrieve state from datamodel cache.
 
+        Dicts and lists in the returned state are read-only and shared with the
+        cache, so that the state is returned without copying. They are a snapshot
+        of the cache, which is not modified by later updates.
+
         Parameters
         ----------
         rules : str
@@ -426,34 +1073,146 @@ class DataModelCache:
             if NameKey.INTERNAL, the returned state will contain internal names in keys.
             if NameKey.DISPLAY, the returned state will contain display names in keys.
             Default value is picked from configuration.
+        deep_copy : bool, optional
+            whether to return a mutable deep copy of the cached state.
+            The default is ``False``.
 
         Returns
         -------
         Any
             cached state
         """
+        return self._get_state(rules, obj, name_key, deep_copy)[1]
+
+    def get_state_if_changed(
+        self,
+        rules: str,
+        obj: object,
+        since_version: int | None,
+        name_key: NameKey | None = None,
+        deep_copy: bool = False,
+    ) -> Tuple[int, Any]:
+        """Retrieve state from datamodel cache if it has changed since a version.
+
+        Parameters
+        ----------
+        rules : str
+            datamodel rules
+        obj : object
+            datamodel object
+        since_version : int, optional
+            version returned by a previous call, or by ``get_version()``. If
+            ``None``, the state is always returned.
+        name_key : NameKey, optional
+            if NameKey.INTERNAL, the returned state will contain internal names in keys.
+            if NameKey.DISPLAY, the returned state will contain display names in keys.
+            Default value is picked from configuration.
+        deep_copy : bool, optional
+            whether to return a mutable deep copy of the cached state.
+            The default is ``False``.
+
+        Returns
+        -------
+        Tuple[int, Any]
+            current version of the cached state and the cached state, or
+            ``DataModelCache.Unchanged`` if it has not changed since
+            ``since_version``
+        """
+        return self._get_state(rules, obj, name_key, deep_copy, since_version)
+
+    def _get_state(
+        self,
+        rules: str,
+        obj: object,
+        name_key: NameKey | None,
+        deep_copy: bool,
+        since_version: int | None = None,
+    ) -> Tuple[int, Any]:
         name_key_in_config = self.get_config(rules, "name_key")
         if name_key is None:
             name_key = name_key_in_config
-        cache = self.rules_str_to_cache[rules]
-        with self._with_lock(rules):
-            if not len(cache):
-                return DataModelCache.Empty
-            comps = DataModelCache._dm_path_comp_list(obj)
+        impl = _CacheImpl(name_key_in_config)
+        comps = DataModelCache._dm_path_comp_list(obj)
+        stripes = DataModelCache._get_stripes(comps)
+        with self._with_lock(rules, stripes, write=False) as locks:
+            index = self._rules_str_to_index.get(rules)
+            if index is None or index.container is not self.rules_str_to_cache[rules]:
+                with locks.structure:
+                    index = self._get_index(rules)
+            version = self._get_journal(rules).version
+            if not len(index.container):
+                return version, DataModelCache.Empty
+            parent_index = key = None
             for comp in comps:
+                if index is None:  # path below a leaf
+                    return version, DataModelCache.Empty
                 if name_key == name_key_in_config:
-                    cache = cache.get(comp, None)
+                    key, cache = comp, index.container.get(comp, None)
                 else:
-                    _, cache = _CacheImpl(name_key_in_config).find(cache, comp, None)
+                    key, cache = impl.find(index, comp, None)
                 if cache is None:
-                    return DataModelCache.Empty
+                    return version, DataModelCache.Empty
+                parent_index = index
+                index = index.child(key) if isinstance(cache, abc.Mapping) else None
 
-            if not isinstance(cache, abc.Mapping) or name_key == name_key_in_config:
-                return copy.deepcopy(cache)
-            else:
-                if not cache:
-                    return DataModelCache.Empty
-                return _CacheImpl(name_key_in_config).transform(cache)
+            if since_version is not None:
+                if index is not None:
+                    state_version = index.version
+                else:
+                    state_version = parent_index.get_version(key)
+                if state_version <= since_version:
+                    return version, DataModelCache.Unchanged
+
+            state = index.container if index is not None else cache
+            if isinstance(state, (dict, list)) and not isinstance(
+                state, (_FrozenDict, _FrozenList)
+            ):
+                # Only the first reader of a state freezes it.
+                with locks.structure:
+                    if index is not None:
+                        state = index.freeze()
+                    else:
+                        state = _freeze(cache)
+                        if state is not cache:
+                            parent_index.container[key] = state
+            if isinstance(state, abc.Mapping) and name_key != name_key_in_config:
+                if not state:
+                    return version, DataModelCache.Empty
+                state = impl.transform_frozen(state)
+            return version, copy.deepcopy(state) if deep_copy else state
+
+    def get_version(self, rules: str) -> int:
+        """Get the current version of the cached state.
+
+        Parameters
+        ----------
+        rules : str
+            datamodel rules
+
+        Returns
+        -------
+        int
+            version, which is increased by each update of the cached state
+        """
+        return self._get_journal(rules).version
+
+    def changes_since(self, rules: str, version: int) -> List[str] | None:
+        """Get the paths of the cached state which changed since a version.
+
+        Parameters
+        ----------
+        rules : str
+            datamodel rules
+        version : int
+            version returned by ``get_version()`` or ``get_state_if_changed()``
+
+        Returns
+        -------
+        List[str] | None
+            sorted paths of the keys which were set or deleted, ``""`` meaning the
+            whole state, or ``None`` if the changes are no longer in the journal
+        """
+        return self._get_journal(rules).changes_since(version)
 
     def set_state(self, rules: str, obj: object, value: Any):
         """Set datamodel cache state.
@@ -467,18 +1226,25 @@ class DataModelCache:
         value : Any
             state
         """
-        name_key_in_config = self.get_config(rules, "name_key")
-        cache = self.rules_str_to_cache[rules]
-        with self._with_lock(rules):
-            comps = DataModelCache._dm_path_comp_list(obj)
+        impl = _CacheImpl(self.get_config(rules, "name_key"))
+        comps = DataModelCache._dm_path_comp_list(obj)
+        stripes = DataModelCache._get_stripes(comps)
+        with self._with_lock(rules, stripes, write=True):
+            index = self._get_index(rules)
+            self._get_journal(rules).new_version()
+            # Indexes, keys and previous values along the path, which are updated
+            # once the value is set
+            path_indexes = []
             for i, comp in enumerate(comps):
-                key, next_cache = _CacheImpl(name_key_in_config).find(cache, comp, None)
+                key, next_cache = impl.find(index, comp, None)
+                path_indexes.append((index, key, index.container.get(key, _MISSING)))
                 if i == len(comps) - 1 and not isinstance(value, abc.Mapping):
-                    cache[key] = value
-                    return
-                if isinstance(next_cache, abc.Mapping):
-                    cache = next_cache
-                else:
-                    cache[key] = {}
-                    cache = cache[key]
-            _CacheImpl(name_key_in_config).update(cache, value)
+                    index.thaw()[key] = value
+                    break
+                if not isinstance(next_cache, abc.Mapping):
+                    index.thaw()[key] = {}
+                index = index.child(key)
+            else:
+                impl.update(index, value)
+            for index, key, old in reversed(path_indexes):
+                index.update(key, old)
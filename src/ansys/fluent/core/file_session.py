@@ -9,7 +9,11 @@ from ansys.api.fluent.v0.field_data_pb2 import DataLocation
 from ansys.fluent.core import PyFluentDeprecationWarning
 from ansys.fluent.core.filereader.case_file import CaseFile
 from ansys.fluent.core.filereader.data_file import DataFile
-from ansys.fluent.core.services.field_data import SurfaceDataType
+from ansys.fluent.core.services.field_data import (
+    SurfaceDataType,
+    _get_connectivity_csr,
+    _validate_connectivity_format,
+)
 from ansys.fluent.core.utils.deprecate import deprecate_argument, deprecate_arguments
 
 
@@ -377,6 +381,7 @@ class FileFieldData:
         data_types: List[SurfaceDataType] | List[str],
         surfaces: List[int | str],
         overset_mesh: bool | None = False,
+        connectivity_format: str | None = "list",
     ):
         """Get surface data (vertices and faces connectivity).
 
@@ -388,6 +393,10 @@ class FileFieldData:
             List of surface IDS or surface names for the surface data.
         overset_mesh : bool, optional
             Whether to provide the overset method. The default is ``False``.
+        connectivity_format : str, optional
+            Format of the faces connectivity data. ``"list"`` provides a list of
+            arrays, one per face. ``"csr"`` provides a ``ConnectivityCSR`` object
+            holding the offsets and indices arrays. The default is ``"list"``.
 
         Returns
         -------
@@ -397,6 +406,7 @@ class FileFieldData:
              vertices, connectivity data, and normal or centroid data is returned.
         """
 
+        _validate_connectivity_format(connectivity_format)
         for d_type in data_types:
             if isinstance(d_type, str):
                 data_types.remove(d_type)
@@ -420,20 +430,18 @@ class FileFieldData:
                 surface: self._get_faces_connectivity_data(
                     self._file_session._case_file.get_mesh().get_connectivity(
                         surface_ids[count]
-                    )
+                    ),
+                    connectivity_format,
                 )
                 for count, surface in enumerate(surfaces)
             }
 
     @staticmethod
-    def _get_faces_connectivity_data(data):
-        faces_data = []
-        i = 0
-        while i < len(data):
-            end = i + 1 + data[i]
-            faces_data.append(data[i + 1 : end])
-            i = end
-        return faces_data
+    def _get_faces_connectivity_data(data, connectivity_format: str = "list"):
+        connectivity = _get_connectivity_csr(data)
+        if connectivity_format == "csr":
+            return connectivity
+        return connectivity.to_list()
 
     @deprecate_argument(
         old_arg="surface_name",
@@ -0,0 +1,466 @@
+"""Asyncio-native wrappers over FieldData gRPC service of Fluent."""
+
+import asyncio
+from typing import AsyncIterator, Dict, List, Tuple
+
+import grpc
+import numpy as np
+
+from ansys.api.fluent.v0 import field_data_pb2_grpc as FieldGrpcModule
+from ansys.fluent.core.services.field_data import (
+    ChunkParser,
+    ConnectivityCSR,
+    FieldData,
+    FieldTransaction,
+    SurfaceDataType,
+    _get_surface_ids,
+    _split_fields_request,
+    _validate_connectivity_format,
+)
+from ansys.fluent.core.services.interceptors import (
+    AsyncErrorStateInterceptor,
+    AsyncGrpcErrorInterceptor,
+    AsyncTracingInterceptor,
+)
+
+
+def _get_aio_channel(address: str, fluent_error_state) -> grpc.aio.Channel:
+    # Deferred import to avoid a circular import with fluent_connection
+    from ansys.fluent.core.fluent_connection import _get_max_c_int_limit
+
+    # Same maximum message length is used in the server
+    max_message_length = _get_max_c_int_limit()
+    return grpc.aio.insecure_channel(
+        address,
+        options=[
+            ("grpc.max_send_message_length", max_message_length),
+            ("grpc.max_receive_message_length", max_message_length),
+        ],
+        interceptors=[
+            AsyncGrpcErrorInterceptor(),
+            AsyncErrorStateInterceptor(fluent_error_state),
+            AsyncTracingInterceptor(),
+        ],
+    )
+
+
+class AsyncFieldDataService:
+    """FieldData service of Fluent on an asyncio gRPC channel.
+
+    Parameters
+    ----------
+    channel : grpc.aio.Channel
+        Asyncio gRPC channel connected to Fluent.
+    metadata : List[Tuple[str, str]]
+        Metadata sent with each call.
+    """
+
+    def __init__(self, channel: grpc.aio.Channel, metadata: List[Tuple[str, str]]):
+        """__init__ method of AsyncFieldDataService class."""
+        self._channel = channel
+        self._stub = FieldGrpcModule.FieldDataStub(channel)
+        self._metadata = metadata
+
+    async def get_scalar_field_range(self, request):
+        """GetRange RPC of FieldData service."""
+        return await self._stub.GetRange(request, metadata=self._metadata)
+
+    async def get_scalar_fields_info(self, request):
+        """GetFieldsInfo RPC of FieldData service."""
+        return await self._stub.GetFieldsInfo(request, metadata=self._metadata)
+
+    async def get_vector_fields_info(self, request):
+        """GetVectorFieldsInfo RPC of FieldData service."""
+        return await self._stub.GetVectorFieldsInfo(request, metadata=self._metadata)
+
+    async def get_surfaces_info(self, request):
+        """GetSurfacesInfo RPC of FieldData service."""
+        return await self._stub.GetSurfacesInfo(request, metadata=self._metadata)
+
+    def get_fields(self, request):
+        """GetFields RPC of FieldData service.
+
+        Returns
+        -------
+        grpc.aio.UnaryStreamCall
+            Call which is iterated asynchronously over the chunks of the stream.
+        """
+        return self._stub.GetFields(request, metadata=self._metadata)
+
+    async def close(self) -> None:
+        """Close the channel."""
+        await self._channel.close()
+
+
+class AsyncFieldTransaction(FieldTransaction):
+    """Populates Fluent field data on surfaces asynchronously.
+
+    Requests are added with the same methods as ``FieldTransaction``. The data is
+    then received with ``await transaction.get_fields()``.
+    """
+
+    async def get_fields(
+        self, contiguous: bool = False, num_streams: int = 1
+    ) -> Dict[int | Tuple, Dict[int, Dict[str, np.array]]]:
+        """Get data for previously added requests and then clear all requests.
+
+        The chunks are decoded as they arrive, so other tasks of the event loop
+        run while the data is being received.
+
+        Parameters
+        ----------
+        contiguous : bool, optional
+            Whether to assemble all the fields into a single contiguous buffer and
+            return them as read-only views over it. The default is ``False``.
+        num_streams : int, optional
+            Number of concurrent streams used to transfer the data. The requests are
+            split between the streams by surface. The default is ``1``.
+
+        Returns
+        -------
+        Dict[int, Dict[int, Dict[str, np.array]]]
+            Data is returned as dictionary of dictionaries in the following structure:
+            tag int | Tuple-> surface_id [int] -> field_name [str] -> field_data[np.array]
+        """
+        if self._cache is None:
+            return await self._fetch_fields_async(contiguous, num_streams)
+        key = self._get_cache_key(contiguous)
+        generation = self._cache.generation
+        fields = self._cache.get(key)
+        if fields is None:
+            fields = self._cache.put(
+                key,
+                await self._fetch_fields_async(contiguous, num_streams),
+                generation,
+            )
+        return fields
+
+    async def iter_fields(
+        self,
+    ) -> AsyncIterator[Tuple[int | Tuple, int, str, np.array]]:
+        """Iterate asynchronously over the data of previously added requests as it
+        arrives.
+
+        See ``FieldTransaction.iter_fields()``.
+        """
+        async for payload in ChunkParser.iter_fields_async(
+            self._service.get_fields(self._fields_request)
+        ):
+            yield payload
+
+    async def _fetch_fields_async(self, contiguous: bool, num_streams: int):
+        fields_requests = _split_fields_request(self._fields_request, num_streams)
+        all_fields = await asyncio.gather(
+            *(
+                ChunkParser(contiguous=contiguous).extract_fields_async(
+                    self._service.get_fields(fields_request)
+                )
+                for fields_request in fields_requests
+            )
+        )
+        if len(all_fields) == 1:
+            return all_fields[0]
+        fields = {}
+        for stream_fields in all_fields:
+            for tag, payload_data in stream_fields.items():
+                fields.setdefault(tag, {}).update(payload_data)
+        return fields
+
+    def __call__(self):
+        return self.get_fields()
+
+
+class AsyncFieldData:
+    """Provides asynchronous access to Fluent field data on surfaces.
+
+    The methods mirror those of ``FieldData`` and return awaitables. Field and
+    surface names are validated against the field information of the session,
+    which is cached after its first use.
+
+    Parameters
+    ----------
+    service : AsyncFieldDataService
+        FieldData service on an asyncio gRPC channel.
+    field_data : FieldData
+        Field data of the session, providing the field information and the cache.
+    """
+
+    def __init__(self, service: AsyncFieldDataService, field_data: FieldData):
+        """__init__ method of AsyncFieldData class."""
+        self._service = service
+        self._field_data = field_data
+
+    @classmethod
+    def from_connection(
+        cls, fluent_connection, field_data: FieldData
+    ) -> "AsyncFieldData":
+        """Create asynchronous field data for a Fluent connection.
+
+        This must be called from a running event loop, to which the asyncio gRPC
+        channel is bound.
+
+        Raises
+        ------
+        RuntimeError
+            If the connection was created from a user-provided channel, whose address
+            is not known.
+        """
+        if fluent_connection._channel_str is None:
+            raise RuntimeError(
+                "Asynchronous field data requires a connection created from an IP "
+                "address and a port."
+            )
+        return cls(
+            AsyncFieldDataService(
+                _get_aio_channel(
+                    fluent_connection._channel_str, fluent_connection._error_state
+                ),
+                fluent_connection._metadata,
+            ),
+            field_data,
+        )
+
+    async def close(self) -> None:
+        """Close the asyncio gRPC channel."""
+        await self._service.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def new_transaction(self) -> AsyncFieldTransaction:
+        """Create a new asynchronous field transaction."""
+        field_data = self._field_data
+        return AsyncFieldTransaction(
+            self._service,
+            field_data._field_info,
+            field_data._allowed_surface_ids,
+            field_data._allowed_surface_names,
+            field_data._allowed_scalar_field_names,
+            field_data._allowed_vector_field_names,
+            field_data.cache,
+        )
+
+    def _get_surface_ids(self, surfaces: List[int | str]) -> List[int]:
+        return _get_surface_ids(
+            field_info=self._field_data._field_info,
+            allowed_surface_names=self._field_data._allowed_surface_names,
+            surfaces=surfaces,
+        )
+
+    async def _new_transaction(
+        self,
+        surfaces: List[int | str],
+        add_request,
+        *args,
+        check_surfaces: bool = False,
+        **kwargs,
+    ) -> Tuple[List[int], AsyncFieldTransaction]:
+        # The surface IDs are resolved and the request is validated in a worker
+        # thread, as they may need the field information, which is obtained through
+        # blocking RPCs the first time.
+        def _prepare():
+            surface_ids = self._get_surface_ids(surfaces)
+            if check_surfaces:
+                for surface_id in surface_ids:
+                    self._field_data.scheme_eval.string_eval(f"(surface? {surface_id})")
+            transaction = self.new_transaction()
+            getattr(transaction, add_request)(*args, surfaces=surface_ids, **kwargs)
+            return surface_ids, transaction
+
+        return await asyncio.to_thread(_prepare)
+
+    async def get_scalar_field_data(
+        self,
+        field_name: str,
+        surfaces: List[int | str],
+        node_value: bool | None = True,
+        boundary_value: bool | None = True,
+    ) -> Dict[int | str, np.array]:
+        """Get scalar field data on a surface.
+
+        Parameters
+        ----------
+        field_name : str
+            Name of the scalar field.
+        surfaces : List[int | str]
+            List of surface IDS or surface names for the surface data.
+        node_value : bool, optional
+            Whether to provide data for the nodal location. The default is ``True``.
+            When ``False``, data is provided for the element location.
+        boundary_value : bool, optional
+            Whether to provide slip velocity at the wall boundaries. The default is
+            ``True``. When ``True``, no slip velocity is provided.
+
+        Returns
+        -------
+        Dict[int | str, np.array]
+            Returns a map of surface IDs (or names) to scalar field data.
+        """
+        surface_ids, transaction = await self._new_transaction(
+            surfaces,
+            "add_scalar_fields_request",
+            field_name=field_name,
+            node_value=node_value,
+            boundary_value=boundary_value,
+        )
+        fields = await transaction.get_fields()
+        scalar_field_data = next(iter(fields.values()), {})
+        return {
+            surface: scalar_field_data[surface_ids[count]][field_name]
+            for count, surface in enumerate(surfaces)
+        }
+
+    async def get_surface_data(
+        self,
+        data_types: List[SurfaceDataType],
+        surfaces: List[int | str],
+        overset_mesh: bool | None = False,
+        connectivity_format: str | None = "list",
+    ) -> Dict[
+        int | str, Dict[SurfaceDataType, np.array | List[np.array] | ConnectivityCSR]
+    ]:
+        """Get surface data (vertices, faces connectivity, centroids, and normals).
+
+        Parameters
+        ----------
+        data_types : List[SurfaceDataType],
+            SurfaceDataType Enum members.
+        surfaces : List[int | str]
+            List of surface IDS or surface names for the surface data.
+        overset_mesh : bool, optional
+            Whether to provide the overset method. The default is ``False``.
+        connectivity_format : str, optional
+            Format of the faces connectivity data, ``"list"`` or ``"csr"``. The
+            default is ``"list"``.
+
+        Returns
+        -------
+        Dict[int | str, Dict[SurfaceDataType, np.array | List[np.array] | ConnectivityCSR]]
+             Returns a map of surface IDs (or names) to face
+             vertices, connectivity data, and normal or centroid data.
+
+        Raises
+        ------
+        ValueError
+            If the connectivity format is not supported.
+        """
+        _validate_connectivity_format(connectivity_format)
+        surface_ids, transaction = await self._new_transaction(
+            surfaces,
+            "add_surfaces_request",
+            data_types=data_types,
+            overset_mesh=overset_mesh,
+        )
+        fields = await transaction.get_fields()
+        surface_data = next(iter(fields.values()), {})
+
+        ret_surf_data = {}
+        for count, surface in enumerate(surfaces):
+            ret_surf_data[surface] = {}
+            for data_type in data_types:
+                data_type = SurfaceDataType(data_type)
+                data = surface_data[surface_ids[count]][data_type.value]
+                if data_type == SurfaceDataType.FacesConnectivity:
+                    ret_surf_data[surface][data_type] = (
+                        FieldData._get_faces_connectivity_data(
+                            data, connectivity_format
+                        )
+                    )
+                else:
+                    ret_surf_data[surface][data_type] = data.reshape(-1, 3)
+        return ret_surf_data
+
+    async def get_vector_field_data(
+        self,
+        field_name: str,
+        surfaces: List[int | str],
+    ) -> Dict[int | str, np.array]:
+        """Get vector field data on a surface.
+
+        Parameters
+        ----------
+        field_name : str
+            Name of the vector field.
+        surfaces : List[int | str]
+            List of surface IDS or surface names for the surface data.
+
+        Returns
+        -------
+        Dict[int | str, np.array]
+            Returns a  map of surface IDs (or names) to vector field data.
+        """
+        surface_ids, transaction = await self._new_transaction(
+            surfaces,
+            "add_vector_fields_request",
+            field_name=field_name,
+            check_surfaces=True,
+        )
+        fields = await transaction.get_fields()
+        vector_field_data = next(iter(fields.values()), {})
+        return {
+            surface: vector_field_data[surface_ids[count]][field_name].reshape(-1, 3)
+            for count, surface in enumerate(surfaces)
+        }
+
+    async def get_pathlines_field_data(
+        self,
+        field_name: str,
+        surfaces: List[int | str],
+        additional_field_name: str | None = "",
+        provide_particle_time_field: bool | None = False,
+        node_value: bool | None = True,
+        steps: int | None = 500,
+        step_size: float | None = 500,
+        skip: int | None = 0,
+        reverse: bool | None = False,
+        accuracy_control_on: bool | None = False,
+        tolerance: float | None = 0.001,
+        coarsen: int | None = 1,
+        velocity_domain: str | None = "all-phases",
+        zones: list | None = None,
+    ) -> Dict:
+        """Get the pathlines field data on a surface.
+
+        The parameters are the same as those of
+        ``FieldData.get_pathlines_field_data``.
+
+        Returns
+        -------
+        Dict
+            Dictionary containing a map of surface IDs to the pathline data.
+            For example, pathlines connectivity, vertices, and field.
+        """
+        surface_ids, transaction = await self._new_transaction(
+            surfaces,
+            "add_pathlines_fields_request",
+            field_name=field_name,
+            additional_field_name=additional_field_name,
+            provide_particle_time_field=provide_particle_time_field,
+            node_value=node_value,
+            steps=steps,
+            step_size=step_size,
+            skip=skip,
+            reverse=reverse,
+            accuracy_control_on=accuracy_control_on,
+            tolerance=tolerance,
+            coarsen=coarsen,
+            velocity_domain=velocity_domain,
+            zones=zones,
+        )
+        fields = await transaction.get_fields()
+        pathlines_data = next(iter(fields.values()), {})
+
+        path_lines_dict = {}
+        for count, surface in enumerate(surfaces):
+            surface_pathlines_data = pathlines_data[surface_ids[count]]
+            path_lines_dict[surface] = {
+                "vertices": surface_pathlines_data["vertices"].reshape(-1, 3),
+                "lines": FieldData._get_faces_connectivity_data(
+                    surface_pathlines_data["lines"]
+                ),
+                field_name: surface_pathlines_data[field_name],
+            }
+        return path_lines_dict
@@ -3,7 +3,7 @@
 import inspect
 import logging
 from types import ModuleType
-from typing import TypeVar
+from typing import Callable, TypeVar
 import weakref
 
 from google.protobuf.message import Message
@@ -154,6 +154,7 @@ class BatchOps:
             instance = super(BatchOps, cls).__new__(cls)
             instance._service: BatchOpsService = session._batch_ops_service
             instance._ops: list[BatchOps.Op] = []
+            instance._executed_callbacks: dict[Callable[[], None], None] = {}
             instance.batching = False
             cls._instance = weakref.ref(instance)
         return cls.instance()
@@ -168,11 +169,17 @@ class BatchOps:
         """Exiting from the with block."""
         network_logger.debug("Executing batch operations")
         self.batching = False
-        if not exc_type:
-            requests = (x._request for x in self._ops)
-            responses = self._service.execute(requests)
-            for i, response in enumerate(responses):
-                self._ops[i].update_result(response.status, response.response_body)
+        try:
+            if not exc_type:
+                requests = (x._request for x in self._ops)
+                responses = self._service.execute(requests)
+                for i, response in enumerate(responses):
+                    self._ops[i].update_result(response.status, response.response_body)
+        finally:
+            callbacks = list(self._executed_callbacks)
+            self._executed_callbacks.clear()
+            for callback in callbacks:
+                callback()
 
     def add_op(self, package: str, service: str, method: str, request: Message) -> Op:
         """Queue a single batch operation. Only the non-getter operations will be
@@ -204,6 +211,21 @@ class BatchOps:
             op.queued = True
         return op
 
+    def add_executed_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback to be called once, when exiting the ``with`` block.
+
+        The callback is called after the queued operations have been executed, for
+        example to invalidate data cached while the operations were queued. A
+        callback registered several times is called once.
+
+        Parameters
+        ----------
+        callback : Callable[[], None]
+            Callback to be called.
+        """
+        self._executed_callbacks[callback] = None
+
     def clear_ops(self) -> None:
         """Clear all queued batch operations."""
         self._ops.clear()
+        self._executed_callbacks.clear()
@@ -1007,7 +1007,11 @@ class PyStateContainer(PyCallableStateObject):
     def get_state(self) -> Any:
         """Get state."""
         if self.service.cache is not None:
-            state = self.service.cache.get_state(self.rules, self, NameKey.DISPLAY)
+            # The state is handed to users, who may modify it and set it back, so a
+            # mutable copy of the read-only cached state is returned.
+            state = self.service.cache.get_state(
+                self.rules, self, NameKey.DISPLAY, deep_copy=True
+            )
             if self.service.cache.is_unassigned(state):
                 state = self.get_remote_state()
         else:
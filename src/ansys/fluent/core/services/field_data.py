@@ -1,11 +1,27 @@
 """Wrappers over FieldData gRPC service of Fluent."""
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import copy
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import reduce
+from functools import cached_property, reduce
 import io
+from itertools import chain
 import logging
-from typing import Callable, Dict, List, Tuple
+import mmap
+import os
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Tuple,
+)
 import weakref
 
 import grpc
@@ -13,7 +29,9 @@ import numpy as np
 
 from ansys.api.fluent.v0 import field_data_pb2 as FieldDataProtoModule
 from ansys.api.fluent.v0 import field_data_pb2_grpc as FieldGrpcModule
+import ansys.fluent.core as pyfluent
 from ansys.fluent.core.exceptions import DisallowedValuesError
+from ansys.fluent.core.services.field_data_export import get_fields_writer
 from ansys.fluent.core.services.interceptors import (
     BatchInterceptor,
     ErrorStateInterceptor,
@@ -138,14 +156,86 @@ class FieldInfo:
         Get surfaces information (surface name, ID, and type).
     """
 
+    # Events after which the cached field information is no longer valid.
+    _metadata_invalidating_events = (
+        "ABOUT_TO_LOAD_CASE",
+        "CASE_LOADED",
+        "ABOUT_TO_LOAD_DATA",
+        "DATA_LOADED",
+    )
+
     def __init__(
         self,
         service: FieldDataService,
         is_data_valid: Callable[[], bool],
+        events_manager=None,
     ):
         """__init__ method of FieldInfo class."""
         self._service = service
         self._is_data_valid = is_data_valid
+        self._metadata = {}
+        self._metadata_version = 0
+        self._metadata_lock = threading.Lock()
+        # The field information is cached only if it can be invalidated by events,
+        # which is not the case in meshing mode where the surfaces change as the mesh
+        # is generated.
+        self._is_metadata_cache_supported = events_manager is not None and all(
+            event_name in events_manager._event_type.__members__
+            for event_name in self._metadata_invalidating_events
+        )
+        if self._is_metadata_cache_supported:
+            for event_name in self._metadata_invalidating_events:
+                events_manager.register_callback(
+                    events_manager._event_type[event_name], self._on_metadata_changed
+                )
+
+    @property
+    def _use_metadata_cache(self) -> bool:
+        return self._is_metadata_cache_supported and pyfluent.FIELD_INFO_USE_CACHE
+
+    @property
+    def metadata_version(self) -> int:
+        """Version of the cached field information.
+
+        The version is incremented each time the cached field information is
+        invalidated.
+        """
+        return self._metadata_version
+
+    def refresh(self) -> None:
+        """Invalidate the cached field information.
+
+        The field information is fetched again from Fluent on the next access.
+        """
+        with self._metadata_lock:
+            self._metadata = {}
+            self._metadata_version += 1
+
+    def _on_metadata_changed(self, session, event_info):
+        self.refresh()
+
+    def _refresh_on_miss(self) -> bool:
+        """Invalidate the cached field information after a failed name lookup.
+
+        Returns whether the field information was cached, in which case the lookup
+        should be retried, for example, to find a newly defined custom field.
+        """
+        if self._use_metadata_cache and self._metadata:
+            self.refresh()
+            return True
+        return False
+
+    def _get_metadata(self, key: str, fetch: Callable[[], Any]) -> Any:
+        if not self._use_metadata_cache:
+            return fetch()
+        version = self._metadata_version
+        metadata = self._metadata.get(key)
+        if metadata is None:
+            metadata = fetch()
+            with self._metadata_lock:
+                if version == self._metadata_version:
+                    self._metadata[key] = metadata
+        return metadata
 
     def get_scalar_field_range(
         self, field: str, node_value: bool = False, surface_ids: List[int] = None
@@ -182,17 +272,34 @@ class FieldInfo:
         -------
         Dict
         """
-        request = FieldDataProtoModule.GetFieldsInfoRequest()
-        response = self._service.get_scalar_fields_info(request)
-        return {
-            field_info.solverName: {
-                "display_name": field_info.displayName,
-                "section": field_info.section,
-                "domain": field_info.domain,
-                "quantity_name": field_info.quantity_name,
+        return copy.deepcopy(self._get_scalar_fields_info())
+
+    def _get_scalar_fields_info(self) -> Dict[str, Dict]:
+        def _fetch():
+            request = FieldDataProtoModule.GetFieldsInfoRequest()
+            response = self._service.get_scalar_fields_info(request)
+            return {
+                field_info.solverName: {
+                    "display_name": field_info.displayName,
+                    "section": field_info.section,
+                    "domain": field_info.domain,
+                    "quantity_name": field_info.quantity_name,
+                }
+                for field_info in response.fieldInfo
             }
-            for field_info in response.fieldInfo
-        }
+
+        return self._get_metadata("scalar_fields", _fetch)
+
+    def _get_mesh_scalar_field_names(self) -> frozenset[str]:
+        """Get the names of the scalar fields available without solution data."""
+        return self._get_metadata(
+            "mesh_scalar_fields",
+            lambda: frozenset(
+                name
+                for name, info in self._get_scalar_fields_info().items()
+                if info["section"] in _mesh_field_sections
+            ),
+        )
 
     def get_vector_fields_info(self) -> Dict[str, Dict]:
         """Get vector fields information (vector components).
@@ -201,16 +308,22 @@ class FieldInfo:
         -------
         Dict
         """
-        request = FieldDataProtoModule.GetVectorFieldsInfoRequest()
-        response = self._service.get_vector_fields_info(request)
-        return {
-            vector_field_info.displayName: {
-                "x-component": vector_field_info.xComponent,
-                "y-component": vector_field_info.yComponent,
-                "z-component": vector_field_info.zComponent,
+        return copy.deepcopy(self._get_vector_fields_info())
+
+    def _get_vector_fields_info(self) -> Dict[str, Dict]:
+        def _fetch():
+            request = FieldDataProtoModule.GetVectorFieldsInfoRequest()
+            response = self._service.get_vector_fields_info(request)
+            return {
+                vector_field_info.displayName: {
+                    "x-component": vector_field_info.xComponent,
+                    "y-component": vector_field_info.yComponent,
+                    "z-component": vector_field_info.zComponent,
+                }
+                for vector_field_info in response.vectorFieldInfo
             }
-            for vector_field_info in response.vectorFieldInfo
-        }
+
+        return self._get_metadata("vector_fields", _fetch)
 
     def get_surfaces_info(self) -> Dict[str, Dict]:
         """Get surfaces information (surface name, ID, and type).
@@ -219,9 +332,15 @@ class FieldInfo:
         -------
         Dict
         """
+        return self._get_surfaces_info()
+
+    def _get_surfaces_info(self) -> Dict[str, Dict]:
+        # The surfaces information is not cached, as surfaces can be created,
+        # deleted or redefined through the settings API, the TUI or Scheme, which
+        # is not notified by any event.
         request = FieldDataProtoModule.GetSurfacesInfoResponse()
         response = self._service.get_surfaces_info(request)
-        info = {
+        return {
             surface_info.surfaceName: {
                 "surface_id": [surf.id for surf in surface_info.surfaceId],
                 "zone_id": surface_info.zoneId.id,
@@ -230,24 +349,26 @@ class FieldInfo:
             }
             for surface_info in response.surfaceInfo
         }
-        return info
 
     def validate_scalar_fields(self, field_name: str):
         """Validate scalar fields."""
-        _AllowedScalarFieldNames(
-            self._is_data_valid, info=self.get_scalar_fields_info()
-        ).valid_name(field_name)
+        _AllowedScalarFieldNames(self._is_data_valid, field_info=self).valid_name(
+            field_name
+        )
 
     def validate_vector_fields(self, field_name: str):
         """Validate vector fields."""
+        if field_name not in self._get_vector_fields_info():
+            self._refresh_on_miss()
         _AllowedVectorFieldNames(
-            self._is_data_valid, info=self.get_vector_fields_info()
+            self._is_data_valid, info=self._get_vector_fields_info()
         ).valid_name(field_name)
 
     def validate_surfaces(self, surfaces: List[str]):
         """Validate surfaces."""
+        allowed_surface_names = _AllowedSurfaceNames(field_info=self)
         for surface in surfaces:
-            _AllowedSurfaceNames(info=self.get_surfaces_info()).valid_name(surface)
+            allowed_surface_names.valid_name(surface)
 
 
 class FieldUnavailable(RuntimeError):
@@ -265,6 +386,89 @@ class SurfaceDataType(Enum):
     FacesCentroid = "centroid"
 
 
+@dataclass(eq=False)
+class ConnectivityCSR:
+    """Faces (or lines) connectivity in a compressed sparse row (CSR) layout.
+
+    The 0-based vertex indices of the face ``i`` are
+    ``indices[offsets[i]:offsets[i + 1]]``.
+
+    Attributes:
+    -----------
+    offsets : np.ndarray
+        Offsets into ``indices``, with shape ``(n_faces + 1,)``.
+    indices : np.ndarray
+        Vertex indices of all the faces.
+    """
+
+    offsets: np.ndarray
+    indices: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, face_index: int) -> np.ndarray:
+        return self.indices[self.offsets[face_index] : self.offsets[face_index + 1]]
+
+    def to_dense(self) -> np.ndarray:
+        """Get the connectivity as a dense ``(n_faces, k)`` array.
+
+        Raises
+        ------
+        ValueError
+            If the faces do not all have the same number of vertices.
+        """
+        counts = np.diff(self.offsets)
+        if len(counts) and np.any(counts != counts[0]):
+            raise ValueError("Faces do not all have the same number of vertices.")
+        return self.indices.reshape(len(counts), counts[0] if len(counts) else 0)
+
+    def to_list(self) -> List[np.ndarray]:
+        """Get the connectivity as a list of arrays, one per face."""
+        offsets = self.offsets.tolist()
+        return [
+            self.indices[start:end] for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+
+
+def _get_connectivity_csr(data) -> ConnectivityCSR:
+    """Decode a flat ``[n, i0, ..., in-1, n, ...]`` connectivity stream."""
+    data = np.asarray(data)
+    size = len(data)
+    if size == 0:
+        return ConnectivityCSR(
+            offsets=np.zeros(1, dtype=np.int64), indices=data[:0].copy()
+        )
+    arity = int(data[0])
+    if arity > 0 and size % (arity + 1) == 0 and np.all(data[:: arity + 1] == arity):
+        # All the faces have the same number of vertices.
+        n_faces = size // (arity + 1)
+        return ConnectivityCSR(
+            offsets=np.arange(0, n_faces * arity + 1, arity, dtype=np.int64),
+            indices=data.reshape(n_faces, arity + 1)[:, 1:].ravel(),
+        )
+    # Find the positions of the vertex counts by pointer doubling: next_header[i]
+    # is the position of the header following a header at position i (with
+    # ``size`` as sentinel), and each pass doubles both the jump length and the
+    # number of known headers.
+    next_header = np.minimum(np.arange(1, size + 1) + data.astype(np.int64), size)
+    next_header = np.append(next_header, size)
+    headers = np.zeros(1, dtype=np.int64)
+    while headers[-1] != size:
+        headers = np.concatenate((headers, next_header[headers]))
+        next_header = next_header[next_header]
+    headers = headers[headers < size]
+    is_vertex = np.ones(size, dtype=bool)
+    is_vertex[headers] = False
+    offsets = np.zeros(len(headers) + 1, dtype=np.int64)
+    np.cumsum(data[headers], out=offsets[1:])
+    return ConnectivityCSR(offsets=offsets, indices=data[is_vertex])
+
+
+# Sections of the scalar fields which are available without solution data.
+_mesh_field_sections = ("Mesh...", "Cell Info...")
+
+
 class _AllowedNames:
     def __init__(self, field_info: FieldInfo | None = None, info: dict | None = None):
         self._field_info = field_info
@@ -274,6 +478,15 @@ class _AllowedNames:
         """Checks validity."""
         return name in self(respect_data_valid)
 
+    def _is_valid_or_refreshed(self, name, respect_data_valid=True):
+        """Checks validity, refreshing cached field information if name is not
+        found."""
+        if self.is_valid(name, respect_data_valid):
+            return True
+        if self._info is None and self._field_info._refresh_on_miss():
+            return self.is_valid(name, respect_data_valid)
+        return False
+
 
 class _AllowedFieldNames(_AllowedNames):
     def __init__(
@@ -289,7 +502,7 @@ class _AllowedFieldNames(_AllowedNames):
         """Returns valid names."""
         if validate_inputs:
             names = self
-            if not names.is_valid(field_name, respect_data_valid=False):
+            if not names._is_valid_or_refreshed(field_name, respect_data_valid=False):
                 raise self._field_name_error(
                     context="field",
                     name=field_name,
@@ -304,7 +517,7 @@ class _AllowedFieldNames(_AllowedNames):
 
 class _AllowedSurfaceNames(_AllowedNames):
     def __call__(self, respect_data_valid: bool = True) -> List[str]:
-        return self._info if self._info else self._field_info.get_surfaces_info()
+        return self._info if self._info else self._field_info._get_surfaces_info()
 
     def valid_name(self, surface_name: str) -> str:
         """Returns valid names.
@@ -324,7 +537,7 @@ class _AllowedSurfaceIDs(_AllowedNames):
         try:
             return [
                 info["surface_id"][0]
-                for _, info in self._field_info.get_surfaces_info().items()
+                for _, info in self._field_info._get_surfaces_info().items()
             ]
         except (KeyError, IndexError):
             pass
@@ -336,7 +549,7 @@ class _AllowedScalarFieldNames(_AllowedFieldNames):
 
     def __call__(self, respect_data_valid: bool = True) -> List[str]:
         field_dict = (
-            self._info if self._info else self._field_info.get_scalar_fields_info()
+            self._info if self._info else self._field_info._get_scalar_fields_info()
         )
         return (
             field_dict
@@ -344,10 +557,22 @@ class _AllowedScalarFieldNames(_AllowedFieldNames):
             else [
                 name
                 for name, info in field_dict.items()
-                if info["section"] in ("Mesh...", "Cell Info...")
+                if info["section"] in _mesh_field_sections
             ]
         )
 
+    def is_valid(self, name, respect_data_valid=True):
+        """Checks validity."""
+        if self._info:
+            return super().is_valid(name, respect_data_valid)
+        if name not in self._field_info._get_scalar_fields_info():
+            return False
+        return (
+            not respect_data_valid
+            or name in self._field_info._get_mesh_scalar_field_names()
+            or self._is_data_valid()
+        )
+
 
 class _AllowedVectorFieldNames(_AllowedFieldNames):
     _field_name_error = DisallowedValuesError
@@ -358,7 +583,7 @@ class _AllowedVectorFieldNames(_AllowedFieldNames):
             self._info
             if self._info
             else (
-                self._field_info.get_vector_fields_info()
+                self._field_info._get_vector_fields_info()
                 if (not respect_data_valid or self._is_data_valid())
                 else []
             )
@@ -404,6 +629,99 @@ def _data_type_convertor(args_dict):
     return args_dict
 
 
+def _make_read_only(value):
+    """Make the arrays contained in a field data result read-only."""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, dict):
+        for item in value.values():
+            _make_read_only(item)
+    return value
+
+
+class FieldDataCache:
+    """Size-bounded least recently used (LRU) cache of field data results.
+
+    The cached arrays are shared between the callers and are therefore
+    read-only. The cache is cleared whenever the solution data in Fluent can change.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of cached entries. The default is ``128``.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups which found an entry in the cache.
+    misses : int
+        Number of lookups which did not find an entry in the cache.
+    evictions : int
+        Number of entries removed to keep the cache within ``max_size``.
+    """
+
+    def __init__(self, max_size: int = 128):
+        """__init__ method of FieldDataCache class."""
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Number of times the cache has been cleared.
+
+        Results fetched while the cache is cleared are not stored.
+        """
+        return self._generation
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Get a cached value or ``None`` if the key is not cached."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, generation: int) -> Any:
+        """Cache a value fetched during the given cache generation."""
+        value = _make_read_only(value)
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Remove all the cached values."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get the cache statistics (hits, misses, evictions, and size)."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+
 class FieldTransaction:
     """Populates Fluent field data on surfaces."""
 
@@ -415,11 +733,13 @@ class FieldTransaction:
         allowed_surface_names,
         allowed_scalar_field_names,
         allowed_vector_field_names,
+        cache: FieldDataCache | None = None,
     ):
         """__init__ method of FieldTransaction class."""
         self._service = service
         self._field_info = field_info
         self._fields_request = get_fields_request()
+        self._cache = cache
 
         self._allowed_surface_names = allowed_surface_names
         self._allowed_scalar_field_names = allowed_scalar_field_names
@@ -725,9 +1045,24 @@ class FieldTransaction:
             ]
         )
 
-    def get_fields(self) -> Dict[int | Tuple, Dict[int, Dict[str, np.array]]]:
+    def get_fields(
+        self, contiguous: bool = False, num_streams: int = 1
+    ) -> Dict[int | Tuple, Dict[int, Dict[str, np.array]]]:
         """Get data for previously added requests and then clear all requests.
 
+        Parameters
+        ----------
+        contiguous : bool, optional
+            Whether to assemble all the fields into a single contiguous buffer and
+            return them as read-only views over it. This avoids intermediate copies
+            and reduces the peak memory for large requests. With several streams,
+            there is one buffer per stream. The default is ``False``.
+        num_streams : int, optional
+            Number of concurrent streams used to transfer the data. The requests are
+            split between the streams by surface, and each stream is decoded on its
+            own thread. Several streams can improve the throughput on high-latency
+            connections. The default is ``1``.
+
         Returns
         -------
         Dict[int, Dict[int, Dict[str, np.array]]]
@@ -736,10 +1071,119 @@ class FieldTransaction:
 
             The tag is a tuple for Fluent 2023 R1 or later.
         """
-        return ChunkParser().extract_fields(
+        if self._cache is None:
+            return self._fetch_fields(contiguous, num_streams)
+        key = self._get_cache_key(contiguous)
+        generation = self._cache.generation
+        fields = self._cache.get(key)
+        if fields is None:
+            fields = self._cache.put(
+                key, self._fetch_fields(contiguous, num_streams), generation
+            )
+        return fields
+
+    def iter_fields(self) -> Iterator[Tuple[int | Tuple, int, str, np.array]]:
+        """Iterate over the data of previously added requests as it arrives.
+
+        Unlike ``get_fields()``, the fields are not all held in memory. Each field is
+        yielded as soon as it has been received, so it can be written out, reduced or
+        forwarded while the rest of the data is still being transferred. The field
+        data cache is not used.
+
+        Yields
+        ------
+        Tuple[int | Tuple, int, str, np.array]
+            ``(tag, surface_id, field_name, field_data)`` for each field. A field which
+            Fluent sends in several consecutive payloads is yielded once, when it is
+            complete.
+
+        Raises
+        ------
+        RuntimeError
+            If the payloads of a field are not consecutive in the stream.
+        """
+        yield from ChunkParser.iter_fields(
             self._service.get_fields(self._fields_request)
         )
 
+    def export(
+        self,
+        path: str | os.PathLike,
+        file_format: str | None = None,
+        group: str | None = None,
+    ) -> str:
+        """Write the data of previously added requests to a file as it arrives.
+
+        The chunks of the stream are written directly to chunked and compressed
+        datasets, so no more than one chunk is held in memory. Each export appends a
+        group to the file, holding the data at
+        ``<group>/<tag>/<surface_id>/<field_name>``. This can be used to archive the
+        data of each timestep in a single file.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Path of the file (or of the directory of a Zarr store), which is created
+            if it does not exist.
+        file_format : str, optional
+            ``"hdf5"`` (requires ``h5py``), ``"zarr"`` (requires ``zarr``) or
+            ``"npz"``. If not provided, the format is deduced from the extension of
+            ``path``: ``.h5`` or ``.hdf5``, ``.zarr`` and ``.npz``.
+        group : str, optional
+            Name of the group holding the data, for example the timestep. If not
+            provided, groups are named by their index in the file: ``"0"``, ``"1"``,
+            etc.
+
+        Returns
+        -------
+        str
+            Name of the group holding the data.
+
+        Raises
+        ------
+        ValueError
+            If the file format is not supported or if the group already exists.
+        """
+        writer = get_fields_writer(path, file_format, group)
+        try:
+            decoder = _FieldsStreamDecoder(sink=writer)
+            for chunk in self._service.get_fields(self._fields_request):
+                decoder.add_chunk(chunk)
+            writer.finish()
+        except BaseException:
+            writer.abort()
+            raise
+        finally:
+            writer.close()
+        return writer.group
+
+    def _get_cache_key(self, contiguous: bool) -> Tuple:
+        return (
+            "transaction",
+            self._fields_request.SerializeToString(deterministic=True),
+            contiguous,
+        )
+
+    def _fetch_fields(self, contiguous: bool, num_streams: int):
+        def _extract_fields(fields_request):
+            return ChunkParser(contiguous=contiguous).extract_fields(
+                self._service.get_fields(fields_request)
+            )
+
+        fields_requests = _split_fields_request(self._fields_request, num_streams)
+        if len(fields_requests) == 1:
+            return _extract_fields(fields_requests[0])
+        with ThreadPoolExecutor(max_workers=len(fields_requests)) as executor:
+            futures = [
+                executor.submit(_extract_fields, fields_request)
+                for fields_request in fields_requests
+            ]
+            fields = {}
+            for future in futures:
+                for tag, payload_data in future.result().items():
+                    fields.setdefault(tag, {}).update(payload_data)
+        return fields
+
     def __call__(self):
         self.get_fields()
 
@@ -787,18 +1231,70 @@ def _get_surface_ids(
     List[int]
     """
     surface_ids = []
+    surfaces_info = None
     for surf in surfaces:
         if isinstance(surf, str):
-            surface_ids.extend(
-                field_info.get_surfaces_info()[allowed_surface_names.valid_name(surf)][
-                    "surface_id"
-                ]
-            )
+            surface_name = allowed_surface_names.valid_name(surf)
+            if surfaces_info is None:
+                surfaces_info = field_info._get_surfaces_info()
+            surface_ids.extend(surfaces_info[surface_name]["surface_id"])
         else:
             surface_ids.append(surf)
     return surface_ids
 
 
+def _validate_connectivity_format(connectivity_format: str):
+    """Validate the faces connectivity format.
+
+    Raises
+    ------
+    ValueError
+        If the connectivity format is not supported.
+    """
+    if connectivity_format not in ("list", "csr"):
+        raise ValueError(
+            f"Unsupported connectivity format '{connectivity_format}'. "
+            "Use 'list' or 'csr'."
+        )
+
+
+def _split_fields_request(fields_request, num_streams: int) -> list:
+    """Split a field request by surface into at most ``num_streams`` requests."""
+    request_fields = (
+        "surfaceRequest",
+        "scalarFieldRequest",
+        "vectorFieldRequest",
+        "pathlinesFieldRequest",
+    )
+    surface_ids = list(
+        dict.fromkeys(
+            request.surfaceId
+            for request_field in request_fields
+            for request in getattr(fields_request, request_field)
+        )
+    )
+    num_streams = min(num_streams, len(surface_ids))
+    if num_streams <= 1:
+        return [fields_request]
+    stream_index_by_surface_id = {
+        surface_id: index % num_streams for index, surface_id in enumerate(surface_ids)
+    }
+    fields_requests = [
+        FieldDataProtoModule.GetFieldsRequest(
+            provideBytesStream=fields_request.provideBytesStream,
+            chunkSize=fields_request.chunkSize,
+        )
+        for _ in range(num_streams)
+    ]
+    for request_field in request_fields:
+        for request in getattr(fields_request, request_field):
+            getattr(
+                fields_requests[stream_index_by_surface_id[request.surfaceId]],
+                request_field,
+            ).append(request)
+    return fields_requests
+
+
 def get_fields_request():
     """Populates a new field request."""
     return FieldDataProtoModule.GetFieldsRequest(
@@ -807,6 +1303,353 @@ def get_fields_request():
     )
 
 
+class _FieldPieces:
+    """Payloads received for one field, assembled once the stream has ended."""
+
+    def __init__(self, field_datatype):
+        self.dtype = np.dtype(field_datatype)
+        self.pieces = []
+        self.size = 0
+
+    def add(self, piece, count: int):
+        """Add a payload holding ``count`` items."""
+        self.pieces.append(piece)
+        self.size += count
+
+    def assemble(self) -> np.ndarray:
+        """Assemble the payloads into a single array.
+
+        A field received as a single payload is returned without copying.
+        Otherwise, each payload is copied exactly once into a new array.
+        """
+        if len(self.pieces) == 1:
+            return self.pieces[0]
+        return np.concatenate(self.pieces)
+
+
+class _Arena:
+    """Buffer holding all the fields of a stream, written as the chunks arrive.
+
+    Space for each payload is reserved from the announced field size when the
+    payload header is received, and the data of each chunk is copied into it
+    right away, so the received chunks are not kept. The buffer is an anonymous
+    memory map. It is grown in place where the platform supports it (``mremap``
+    on Linux), which neither copies the received data nor commits the memory of
+    the reserved but not yet written space.
+    """
+
+    # Alignment in bytes of each field within the buffer.
+    alignment = 8
+
+    def __init__(self):
+        """__init__ method of _Arena class."""
+        self._buffer = None
+        self.size = 0
+
+    def reserve(self, nbytes: int, offset: int | None = None) -> int:
+        """Reserve ``nbytes`` bytes at the end of the buffer and return their offset.
+
+        If ``offset`` is the offset of the last reservation, that reservation is
+        extended instead.
+        """
+        if offset is None:
+            offset = -(-self.size // self.alignment) * self.alignment
+        end = offset + nbytes
+        capacity = len(self._buffer) if self._buffer is not None else 0
+        if end > capacity or self._buffer is None:
+            self._grow(max(end, 2 * capacity, mmap.PAGESIZE))
+        self.size = end
+        return offset
+
+    @staticmethod
+    def _new_buffer(capacity: int) -> mmap.mmap:
+        # A shared anonymous map cannot be grown on Linux, its pages beyond the
+        # initial size are not backed.
+        if hasattr(mmap, "MAP_PRIVATE"):
+            return mmap.mmap(-1, capacity, flags=mmap.MAP_PRIVATE)
+        return mmap.mmap(-1, capacity)
+
+    def _grow(self, capacity: int):
+        if self._buffer is None:
+            self._buffer = self._new_buffer(capacity)
+            return
+        try:
+            self._buffer.resize(capacity)
+        except (OSError, SystemError, ValueError):
+            buffer = self._new_buffer(capacity)
+            with memoryview(buffer) as dst, memoryview(self._buffer) as src:
+                dst[: self.size] = src[: self.size]
+            self._buffer.close()
+            self._buffer = buffer
+
+    def write(self, offset: int, values: np.ndarray):
+        """Copy ``values`` into the buffer at ``offset``."""
+        values = values.view(np.uint8)
+        out = np.frombuffer(self._buffer, np.uint8, count=values.size, offset=offset)
+        out[...] = values
+
+    def move(self, offset: int, nbytes: int, new_offset: int):
+        """Copy ``nbytes`` bytes of the buffer from ``offset`` to ``new_offset``."""
+        self._buffer.move(new_offset, offset, nbytes)
+
+    def get_views(self, fields: List[Tuple[int, int, np.dtype]]) -> List[np.ndarray]:
+        """Get read-only arrays over the buffer.
+
+        Each field is given as ``(offset, count, dtype)``. All the arrays share the
+        same base array. The buffer cannot be grown while they exist.
+        """
+        if self._buffer is None:
+            return [np.empty(0, dtype) for _, _, dtype in fields]
+        arena = np.frombuffer(self._buffer, np.uint8, count=self.size)
+        arena.flags.writeable = False
+        return [
+            arena[offset : offset + count * dtype.itemsize].view(dtype)
+            for offset, count, dtype in fields
+        ]
+
+
+class _ArenaField:
+    """Location of a field in an ``_Arena``."""
+
+    __slots__ = ("dtype", "offset", "size")
+
+    def __init__(self, dtype):
+        self.dtype = np.dtype(dtype)
+        self.offset = None
+        self.size = 0
+
+
+def _get_payload_tag(payload_info, with_callbacks: bool = False):
+    """Get the tag identifying the request which a payload answers."""
+    field_request_info = payload_info.fieldRequestInfo
+    request_type = field_request_info.WhichOneof("request")
+    if request_type == "surfaceRequest":
+        return (("type", "surface-data"),)
+    if request_type == "scalarFieldRequest":
+        scalar_field_request = field_request_info.scalarFieldRequest
+        return (
+            ("type", "scalar-field"),
+            ("dataLocation", scalar_field_request.dataLocation),
+            ("boundaryValues", scalar_field_request.provideBoundaryValues),
+        )
+    if request_type == "vectorFieldRequest":
+        return (("type", "vector-field"),)
+    if request_type == "pathlinesFieldRequest":
+        return (
+            ("type", "pathlines-field"),
+            ("field", field_request_info.pathlinesFieldRequest.field),
+        )
+    if request_type is not None or with_callbacks:
+        return None
+    return reduce(
+        lambda x, y: x | y,
+        [_FieldDataConstants.payloadTags[tag] for tag in payload_info.payloadTag]
+        or [0],
+    )
+
+
+class _Payload:
+    """Payload of a field which is being received."""
+
+    __slots__ = (
+        "tag",
+        "surface_id",
+        "field_name",
+        "dtype",
+        "size",
+        "index",
+        "data",
+        "field_pieces",
+    )
+
+    def __init__(self, tag, surface_id, field_name, dtype, size, data, field_pieces):
+        self.tag = tag
+        self.surface_id = surface_id
+        self.field_name = field_name
+        self.dtype = dtype
+        self.size = size
+        self.index = 0
+        self.data = data
+        self.field_pieces = field_pieces
+
+
+class _FieldsStreamDecoder:
+    """Decoder of a field data stream, which is fed one chunk at a time.
+
+    The decoder does not pull chunks from the stream itself, so the same decoding
+    can consume a regular iterator, an asynchronous iterator or chunks received by
+    several threads.
+
+    Parameters
+    ----------
+    contiguous : bool, optional
+        Whether to assemble all the fields into a single contiguous buffer. See
+        ``ChunkParser``. The default is ``False``.
+    with_callbacks : bool, optional
+        Whether the decoded payloads are only passed on to callbacks, in which case
+        they are not stored by the decoder. The default is ``False``.
+    keep_fields : bool, optional
+        Whether to store the decoded payloads until the stream has ended. When
+        ``False``, each payload is only returned by ``add_chunk()``. The default is
+        ``True``.
+    sink : object, optional
+        Object receiving the data of each chunk as soon as it is decoded, through
+        its ``start_payload(tag, surface_id, field_name, dtype, size)`` and
+        ``write(values)`` methods. The payloads are then neither stored nor
+        returned by the decoder. The default is ``None``.
+    """
+
+    def __init__(
+        self,
+        contiguous: bool = False,
+        with_callbacks: bool = False,
+        keep_fields: bool = True,
+        sink: object = None,
+    ):
+        """__init__ method of _FieldsStreamDecoder class."""
+        self._sink = sink
+        self._keep_fields = keep_fields and not with_callbacks and sink is None
+        self._contiguous = contiguous and self._keep_fields
+        self._with_callbacks = with_callbacks
+        self._fields_data = {}
+        self._arena = _Arena() if self._contiguous else None
+        self._payload = None
+
+    def add_chunk(self, chunk) -> Tuple | None:
+        """Add the next chunk of the stream.
+
+        Returns
+        -------
+        Tuple | None
+            ``(tag, surface_id, field_name, field)`` if the chunk completes a
+            payload, ``None`` otherwise. ``field`` is ``None`` in contiguous mode, the
+            fields being only available once the stream has ended.
+        """
+        if self._payload is None:
+            return self._start_payload(chunk.payloadInfo)
+        return self._add_payload_data(chunk)
+
+    def _start_payload(self, payload_info):
+        tag = _get_payload_tag(payload_info, self._with_callbacks)
+        dtype = _FieldDataConstants.proto_field_type_to_np_data_type.get(
+            payload_info.fieldType
+        )
+        surface_id = payload_info.surfaceId
+        field_name = payload_info.fieldName
+        field_pieces = None
+        if self._keep_fields:
+            surface_data = self._fields_data.setdefault(tag, {}).setdefault(
+                surface_id, {}
+            )
+            field_pieces = surface_data.get(field_name)
+            if field_pieces is None:
+                field_pieces = surface_data[field_name] = (
+                    _ArenaField(dtype) if self._contiguous else _FieldPieces(dtype)
+                )
+        if tag is None:
+            # The data of the payload is not sent.
+            return tag, surface_id, field_name, None
+        size = payload_info.fieldSize
+        if self._sink is not None:
+            data = None
+            self._sink.start_payload(tag, surface_id, field_name, np.dtype(dtype), size)
+        elif self._contiguous:
+            data = self._reserve(field_pieces, size)
+        else:
+            data = np.empty(size, dtype=dtype)
+        self._payload = _Payload(
+            tag, surface_id, field_name, np.dtype(dtype), size, data, field_pieces
+        )
+
+    def _reserve(self, arena_field: _ArenaField, size: int) -> int:
+        # Reserve the space of a payload in the arena, after the previous payloads
+        # of the same field. The field is moved to the end of the arena if other
+        # fields were received since its previous payload.
+        arena = self._arena
+        itemsize = arena_field.dtype.itemsize
+        nbytes = arena_field.size * itemsize
+        if arena_field.offset is None:
+            arena_field.offset = arena.reserve(size * itemsize)
+        elif arena_field.offset + nbytes == arena.size:
+            arena.reserve(size * itemsize, arena.size)
+        else:
+            offset = arena.reserve(nbytes + size * itemsize)
+            arena.move(arena_field.offset, nbytes, offset)
+            arena_field.offset = offset
+        arena_field.size += size
+        return arena_field.offset + nbytes
+
+    def _add_payload_data(self, chunk):
+        payload = self._payload
+        dtype = payload.dtype
+        if chunk.bytePayload:
+            byte_payload = chunk.bytePayload
+            count = min(
+                len(byte_payload) // dtype.itemsize, payload.size - payload.index
+            )
+            if self._sink is not None:
+                self._sink.write(np.frombuffer(byte_payload, dtype, count=count))
+            elif self._contiguous:
+                self._arena.write(
+                    payload.data + payload.index * dtype.itemsize,
+                    np.frombuffer(byte_payload, dtype, count=count),
+                )
+            else:
+                payload.data[payload.index : payload.index + count] = np.frombuffer(
+                    byte_payload, dtype, count=count
+                )
+        else:
+            typed_payload = (
+                chunk.floatPayload.payload
+                or chunk.intPayload.payload
+                or chunk.doublePayload.payload
+                or chunk.longPayload.payload
+            )
+            count = len(typed_payload)
+            values = np.fromiter(typed_payload, dtype=dtype, count=count)
+            if self._sink is not None:
+                self._sink.write(values)
+            elif self._contiguous:
+                self._arena.write(payload.data + payload.index * dtype.itemsize, values)
+            else:
+                payload.data[payload.index : payload.index + count] = values
+        payload.index += count
+        if payload.index < payload.size:
+            return None
+        self._payload = None
+        if payload.data is None or self._contiguous:
+            return payload.tag, payload.surface_id, payload.field_name, None
+        if payload.field_pieces is not None:
+            payload.field_pieces.add(payload.data, payload.size)
+        return payload.tag, payload.surface_id, payload.field_name, payload.data
+
+    def get_fields(self) -> Dict:
+        """Get the fields received, once the stream has ended."""
+        fields_data = self._fields_data
+        all_field_pieces = [
+            (surface_data, field_name, field_pieces)
+            for payload_data in fields_data.values()
+            for surface_data in payload_data.values()
+            for field_name, field_pieces in surface_data.items()
+        ]
+        if not self._contiguous:
+            for surface_data, field_name, field_pieces in all_field_pieces:
+                surface_data[field_name] = (
+                    field_pieces.assemble() if field_pieces.pieces else None
+                )
+            return fields_data
+
+        received = [x for x in all_field_pieces if x[2].offset is not None]
+        views = self._arena.get_views(
+            [(x.offset, x.size, x.dtype) for _, _, x in received]
+        )
+        for surface_data, field_name, _ in all_field_pieces:
+            surface_data[field_name] = None
+        for (surface_data, field_name, _), view in zip(received, views):
+            surface_data[field_name] = view
+        return fields_data
+
+
 class ChunkParser:
     """Class for parsing field data stream received from Fluent.
 
@@ -820,142 +1663,140 @@ class ChunkParser:
         field_name : str
 
         field : numpy array
+    contiguous : bool, optional
+        Whether to assemble all the fields of the stream into a single contiguous
+        buffer. The space of each payload is reserved in the buffer from its announced
+        field size, and each chunk is copied into it as soon as it is received, so the
+        received chunks are not kept until the end of the stream. The fields are
+        returned as read-only views over that buffer. The default is ``False``.
     """
 
-    def __init__(self, callbacks_provider: object = None):
+    def __init__(self, callbacks_provider: object = None, contiguous: bool = False):
         """__init__ method of ChunkParser class."""
         self._callbacks_provider = callbacks_provider
+        self._contiguous = contiguous
+
+    def _new_decoder(self) -> _FieldsStreamDecoder:
+        return _FieldsStreamDecoder(
+            contiguous=self._contiguous,
+            with_callbacks=self._callbacks_provider is not None,
+        )
+
+    def _on_payload(self, payload):
+        if payload is not None and self._callbacks_provider is not None:
+            _, surface_id, field_name, field = payload
+            for callback_data in self._callbacks_provider.callbacks():
+                callback, args, kwargs = callback_data
+                callback(surface_id, field_name, field, *args, **kwargs)
 
     def extract_fields(self, chunk_iterator) -> Dict[int, Dict[str, np.array]]:
         """Extracts field data received from Fluent.
 
         if callbacks_provider is set then callbacks are triggered with extracted data.
         """
+        decoder = self._new_decoder()
+        for chunk in chunk_iterator:
+            self._on_payload(decoder.add_chunk(chunk))
+        return decoder.get_fields()
 
-        def _get_tag_for_surface_request():
-            return (("type", "surface-data"),)
+    async def extract_fields_async(
+        self, chunk_iterator
+    ) -> Dict[int, Dict[str, np.array]]:
+        """Extracts field data received from Fluent through an asynchronous iterator.
 
-        def _get_tag_for_vector_field_request():
-            return (("type", "vector-field"),)
+        The chunks are decoded as they arrive, so the event loop can run other tasks
+        while the stream is being received.
+        """
+        decoder = self._new_decoder()
+        async for chunk in chunk_iterator:
+            self._on_payload(decoder.add_chunk(chunk))
+        return decoder.get_fields()
 
-        def _get_tag_for_scalar_field_request(scalar_field_request):
-            return (
-                ("type", "scalar-field"),
-                ("dataLocation", scalar_field_request.dataLocation),
-                ("boundaryValues", scalar_field_request.provideBoundaryValues),
-            )
+    @staticmethod
+    def iter_fields(chunk_iterator) -> Iterator[Tuple[int | Tuple, int, str, np.array]]:
+        """Iterate over the field data received from Fluent as it arrives.
 
-        def _get_tag_for_pathlines_field_request(pathlines_field_request):
-            return (
-                ("type", "pathlines-field"),
-                ("field", pathlines_field_request.field),
-            )
+        Each field is yielded once as ``(tag, surface_id, field_name, field)``, as
+        soon as it is complete, and it is not kept by the parser. A field which
+        Fluent sends in several consecutive payloads is assembled first. It is
+        complete once the payloads of another field start arriving or the stream
+        ends.
 
-        def _extract_field(field_datatype, field_size, chunk_iterator):
-            field_arr = np.empty(field_size, dtype=field_datatype)
-            field_datatype_item_size = np.dtype(field_datatype).itemsize
-            index = 0
-            for chunk in chunk_iterator:
-                if chunk.bytePayload:
-                    count = min(
-                        len(chunk.bytePayload) // field_datatype_item_size,
-                        field_size - index,
-                    )
-                    field_arr[index : index + count] = np.frombuffer(
-                        chunk.bytePayload, field_datatype, count=count
-                    )
-                    index += count
-                    if index == field_size:
-                        return field_arr
-                else:
-                    payload = (
-                        chunk.floatPayload.payload
-                        or chunk.intPayload.payload
-                        or chunk.doublePayload.payload
-                        or chunk.longPayload.payload
-                    )
-                    count = len(payload)
-                    field_arr[index : index + count] = np.fromiter(
-                        payload, dtype=field_datatype
-                    )
-                    index += count
-                    if index == field_size:
-                        return field_arr
-
-        fields_data = {}
+        Raises
+        ------
+        RuntimeError
+            If a payload of a field arrives after the payloads of other fields,
+            once the field has been yielded.
+        """
+        decoder = _FieldsStreamDecoder(keep_fields=False)
+        merger = _FieldPayloadsMerger()
         for chunk in chunk_iterator:
-            payload_info = chunk.payloadInfo
-            surface_id = payload_info.surfaceId
-            field_request_info = payload_info.fieldRequestInfo
-            request_type = field_request_info.WhichOneof("request")
-            if request_type is not None:
-                payload_tag_id = (
-                    _get_tag_for_surface_request()
-                    if request_type == "surfaceRequest"
-                    else (
-                        _get_tag_for_scalar_field_request(
-                            field_request_info.scalarFieldRequest
-                        )
-                        if request_type == "scalarFieldRequest"
-                        else (
-                            _get_tag_for_vector_field_request()
-                            if request_type == "vectorFieldRequest"
-                            else (
-                                _get_tag_for_pathlines_field_request(
-                                    field_request_info.pathlinesFieldRequest
-                                )
-                                if request_type == "pathlinesFieldRequest"
-                                else None
-                            )
-                        )
-                    )
-                )
-            else:
-                if self._callbacks_provider is None:
-                    payload_tag_id = reduce(
-                        lambda x, y: x | y,
-                        [
-                            _FieldDataConstants.payloadTags[tag]
-                            for tag in payload_info.payloadTag
-                        ]
-                        or [0],
-                    )
-                else:
-                    payload_tag_id = None
-            field = None
-            if payload_tag_id is not None:
-                field = _extract_field(
-                    _FieldDataConstants.proto_field_type_to_np_data_type[
-                        payload_info.fieldType
-                    ],
-                    payload_info.fieldSize,
-                    chunk_iterator,
-                )
+            field = merger.add(decoder.add_chunk(chunk))
+            if field is not None:
+                yield field
+        field = merger.finish()
+        if field is not None:
+            yield field
 
-            if self._callbacks_provider is not None:
-                for callback_data in self._callbacks_provider.callbacks():
-                    callback, args, kwargs = callback_data
-                    # print('cb', surface_id, payload_info.fieldName)
-                    callback(surface_id, payload_info.fieldName, field, *args, **kwargs)
-            else:
-                payload_data = fields_data.get(payload_tag_id)
-                if not payload_data:
-                    payload_data = fields_data[payload_tag_id] = {}
-                surface_data = payload_data.get(surface_id)
-                if surface_data:
-                    if payload_info.fieldName in surface_data:
-                        surface_data.update(
-                            {
-                                payload_info.fieldName: np.concatenate(
-                                    (surface_data[payload_info.fieldName], field)
-                                )
-                            }
-                        )
-                    else:
-                        surface_data.update({payload_info.fieldName: field})
-                else:
-                    payload_data[surface_id] = {payload_info.fieldName: field}
-        return fields_data
+    @staticmethod
+    async def iter_fields_async(
+        chunk_iterator,
+    ) -> AsyncIterator[Tuple[int | Tuple, int, str, np.array]]:
+        """Iterate over the field data received from Fluent through an asynchronous
+        iterator as it arrives.
+
+        See ``iter_fields()``.
+        """
+        decoder = _FieldsStreamDecoder(keep_fields=False)
+        merger = _FieldPayloadsMerger()
+        async for chunk in chunk_iterator:
+            field = merger.add(decoder.add_chunk(chunk))
+            if field is not None:
+                yield field
+        field = merger.finish()
+        if field is not None:
+            yield field
+
+
+class _FieldPayloadsMerger:
+    """Assembles the consecutive payloads of each field of a stream."""
+
+    def __init__(self):
+        """__init__ method of _FieldPayloadsMerger class."""
+        self._key = None
+        self._field_pieces = None
+        self._completed_keys = set()
+
+    def add(self, payload: Tuple | None) -> Tuple | None:
+        """Add a decoded payload and return the field it completes, if any."""
+        if payload is None:
+            return None
+        tag, surface_id, field_name, data = payload
+        key = (tag, surface_id, field_name)
+        if key == self._key:
+            if data is not None:
+                self._field_pieces.add(data, data.size)
+            return None
+        if key in self._completed_keys:
+            raise RuntimeError(
+                f"The payloads of field {field_name!r} of surface {surface_id} are not "
+                "consecutive in the stream. Use get_fields() to receive it."
+            )
+        completed = self.finish()
+        self._key = key
+        self._field_pieces = _FieldPieces(data.dtype if data is not None else None)
+        if data is not None:
+            self._field_pieces.add(data, data.size)
+        return completed
+
+    def finish(self) -> Tuple | None:
+        """Return the field being assembled, once the stream has ended."""
+        if self._key is None:
+            return None
+        key, field_pieces = self._key, self._field_pieces
+        self._completed_keys.add(key)
+        self._key = self._field_pieces = None
+        return *key, field_pieces.assemble() if field_pieces.pieces else None
 
 
 # Root domain id in Fluent.
@@ -1070,20 +1911,194 @@ class Element:
     facets: list[Facet] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(eq=False)
 class Mesh:
     """Mesh class for Fluent field data.
 
+    The mesh is stored in a columnar layout based on NumPy arrays. Element and facet
+    connectivity use a compressed sparse row (CSR) layout, where the node indices of
+    the element ``i`` are
+    ``element_node_indices[element_node_offsets[i]:element_node_offsets[i + 1]]``.
+
     Attributes:
     -----------
+    node_ids : np.ndarray
+        IDs of the nodes, with shape ``(n_nodes,)``.
+    node_coordinates : np.ndarray
+        Coordinates of the nodes, with shape ``(n_nodes, 3)``.
+    element_ids : np.ndarray
+        IDs of the elements, with shape ``(n_elements,)``.
+    element_types : np.ndarray
+        ``CellElementType`` values of the elements, with shape ``(n_elements,)``.
+    element_node_offsets : np.ndarray
+        Offsets into ``element_node_indices``, with shape ``(n_elements + 1,)``.
+    element_node_indices : np.ndarray
+        0-based node indices of the standard elements.
+    element_facet_offsets : np.ndarray
+        Offsets into the facets, with shape ``(n_elements + 1,)``. Only polyhedral
+        elements have facets.
+    facet_node_offsets : np.ndarray
+        Offsets into ``facet_node_indices``, with shape ``(n_facets + 1,)``.
+    facet_node_indices : np.ndarray
+        0-based node indices of the facets.
     nodes : list[Node]
-        List of nodes in the mesh.
+        List of nodes in the mesh. Constructed on first access.
     elements : list[Element]
-        List of elements in the mesh.
+        List of elements in the mesh. Constructed on first access.
     """
 
-    nodes: list[Node]
-    elements: list[Element]
+    node_ids: np.ndarray
+    node_coordinates: np.ndarray
+    element_ids: np.ndarray
+    element_types: np.ndarray
+    element_node_offsets: np.ndarray
+    element_node_indices: np.ndarray
+    element_facet_offsets: np.ndarray
+    facet_node_offsets: np.ndarray
+    facet_node_indices: np.ndarray
+
+    @cached_property
+    def nodes(self) -> list[Node]:
+        """List of nodes in the mesh."""
+        return [
+            Node(_id=_id, x=x, y=y, z=z)
+            for _id, (x, y, z) in zip(
+                self.node_ids.tolist(), self.node_coordinates.tolist()
+            )
+        ]
+
+    @cached_property
+    def elements(self) -> list[Element]:
+        """List of elements in the mesh."""
+        element_node_offsets = self.element_node_offsets.tolist()
+        element_node_indices = self.element_node_indices.tolist()
+        element_facet_offsets = self.element_facet_offsets.tolist()
+        facet_node_offsets = self.facet_node_offsets.tolist()
+        facet_node_indices = self.facet_node_indices.tolist()
+        elements = []
+        for i, (_id, element_type) in enumerate(
+            zip(self.element_ids.tolist(), self.element_types.tolist())
+        ):
+            element_type = CellElementType(element_type)
+            if element_type == CellElementType.POLYHEDRON:
+                element = Element(
+                    _id=_id,
+                    element_type=element_type,
+                    facets=[
+                        Facet(
+                            node_indices=facet_node_indices[
+                                facet_node_offsets[j] : facet_node_offsets[j + 1]
+                            ]
+                        )
+                        for j in range(
+                            element_facet_offsets[i], element_facet_offsets[i + 1]
+                        )
+                    ],
+                )
+            else:
+                element = Element(
+                    _id=_id,
+                    element_type=element_type,
+                    node_indices=element_node_indices[
+                        element_node_offsets[i] : element_node_offsets[i + 1]
+                    ],
+                )
+            elements.append(element)
+        return elements
+
+
+def _get_offsets(counts: np.ndarray) -> np.ndarray:
+    """Get CSR offsets from the number of entries of each row."""
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def _get_node_indices(node_ids: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """Map node IDs to 0-based node indices.
+
+    Raises
+    ------
+    KeyError
+        If a node ID is not found.
+    """
+    if len(ids) == 0:
+        return np.empty(0, dtype=np.int64)
+    if len(node_ids) == 0:
+        raise KeyError(ids[0].item())
+    sorter = np.argsort(node_ids, kind="stable")
+    positions = np.searchsorted(node_ids, ids, sorter=sorter)
+    indices = sorter[np.minimum(positions, len(node_ids) - 1)]
+    mismatch = node_ids[indices] != ids
+    if np.any(mismatch):
+        raise KeyError(ids[np.argmax(mismatch)].item())
+    return indices
+
+
+def _get_mesh(nodes_pb, elements_pb) -> Mesh:
+    """Construct the columnar mesh from the solver mesh responses."""
+    n_nodes = len(nodes_pb)
+    node_ids = np.fromiter((node.id for node in nodes_pb), np.int64, count=n_nodes)
+    node_coordinates = np.fromiter(
+        chain.from_iterable((node.x, node.y, node.z) for node in nodes_pb),
+        np.float64,
+        count=3 * n_nodes,
+    ).reshape(-1, 3)
+
+    n_elements = len(elements_pb)
+    element_ids = np.fromiter(
+        (element.id for element in elements_pb), np.int64, count=n_elements
+    )
+    element_types = np.fromiter(
+        (element.element_type for element in elements_pb), np.int32, count=n_elements
+    )
+    element_node_offsets = _get_offsets(
+        np.fromiter(
+            (len(element.node_ids) for element in elements_pb),
+            np.int64,
+            count=n_elements,
+        )
+    )
+    element_node_ids = np.fromiter(
+        chain.from_iterable(element.node_ids for element in elements_pb),
+        np.int64,
+        count=element_node_offsets[-1],
+    )
+    element_facet_offsets = _get_offsets(
+        np.fromiter(
+            (len(element.facets) for element in elements_pb),
+            np.int64,
+            count=n_elements,
+        )
+    )
+    facet_node_offsets = _get_offsets(
+        np.fromiter(
+            (len(facet.node) for element in elements_pb for facet in element.facets),
+            np.int64,
+            count=element_facet_offsets[-1],
+        )
+    )
+    facet_node_ids = np.fromiter(
+        (
+            node_id
+            for element in elements_pb
+            for facet in element.facets
+            for node_id in facet.node
+        ),
+        np.int64,
+        count=facet_node_offsets[-1],
+    )
+    return Mesh(
+        node_ids=node_ids,
+        node_coordinates=node_coordinates,
+        element_ids=element_ids,
+        element_types=element_types,
+        element_node_offsets=element_node_offsets,
+        element_node_indices=_get_node_indices(node_ids, element_node_ids),
+        element_facet_offsets=element_facet_offsets,
+        facet_node_offsets=facet_node_offsets,
+        facet_node_indices=_get_node_indices(node_ids, facet_node_ids),
+    )
 
 
 class FieldData:
@@ -1096,6 +2111,7 @@ class FieldData:
         is_data_valid: Callable[[], bool],
         scheme_eval=None,
         get_zones_info: weakref.WeakMethod[Callable[[], list[ZoneInfo]]] | None = None,
+        events_manager=None,
     ):
         """__init__ method of FieldData class."""
         self._service = service
@@ -1103,6 +2119,9 @@ class FieldData:
         self.is_data_valid = is_data_valid
         self.scheme_eval = scheme_eval
         self.get_zones_info = lambda: get_zones_info()()
+        self._events_manager = events_manager
+        self._cache = None
+        self._cache_callback_ids = []
 
         self._allowed_surface_names = _AllowedSurfaceNames(field_info)
 
@@ -1131,6 +2150,16 @@ class FieldData:
             ),
             self.get_scalar_field_data,
         )
+        self.get_scalar_fields_data = override_help_text(
+            _FieldMethod(
+                field_data_accessor=self.get_scalar_fields_data,
+                args_allowed_values_accessors={
+                    **dict(field_names=self._allowed_scalar_field_names),
+                    **surface_args,
+                },
+            ),
+            self.get_scalar_fields_data,
+        )
         self.get_vector_field_data = override_help_text(
             _FieldMethod(
                 field_data_accessor=self.get_vector_field_data,
@@ -1156,6 +2185,103 @@ class FieldData:
             self.get_pathlines_field_data,
         )
 
+    # Solver events after which the cached field data is no longer valid.
+    _cache_invalidating_events = (
+        "ITERATION_ENDED",
+        "TIMESTEP_ENDED",
+        "SOLUTION_INITIALIZED",
+        "DATA_LOADED",
+        "CASE_LOADED",
+    )
+
+    @property
+    def cache(self) -> FieldDataCache | None:
+        """Field data cache if it is enabled, otherwise ``None``."""
+        return self._cache
+
+    def enable_cache(self, max_size: int = 128) -> FieldDataCache:
+        """Enable caching of field data results in the client.
+
+        Results are cached for the same fields, surfaces, and data locations until
+        the solution data changes, that is until an iteration or a timestep ends, the
+        solution is initialized, a case or data file is loaded, or solution variable
+        data is set through ``fields.solution_variable_data``. Cached arrays are
+        read-only.
+
+        Other changes are not detected, such as a surface being redefined, or
+        solution data being modified through the TUI, Scheme, or a UDF. Clear the
+        cache with ``cache.clear()`` after such changes.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            Maximum number of cached entries. The default is ``128``.
+
+        Returns
+        -------
+        FieldDataCache
+            The field data cache.
+        """
+        if self._cache is None:
+            self._cache = FieldDataCache(max_size=max_size)
+            if self._events_manager is None:
+                logger.warning(
+                    "Events are not available. "
+                    "The field data cache must be cleared explicitly."
+                )
+            else:
+                event_type = self._events_manager._event_type
+                for event_name in self._cache_invalidating_events:
+                    if event_name in event_type.__members__:
+                        self._cache_callback_ids.append(
+                            self._events_manager.register_callback(
+                                event_type[event_name], self._on_solution_changed
+                            )
+                        )
+        else:
+            self._cache.max_size = max_size
+        return self._cache
+
+    def disable_cache(self) -> None:
+        """Disable caching of field data results in the client."""
+        for callback_id in self._cache_callback_ids:
+            self._events_manager.unregister_callback(callback_id)
+        self._cache_callback_ids = []
+        self._cache = None
+
+    def _clear_cache(self) -> None:
+        cache = self._cache
+        if cache is not None:
+            cache.clear()
+
+    def _on_solution_changed(self, session, event_info):
+        self._clear_cache()
+
+    def _get_cached_data(
+        self,
+        keys: Dict[Hashable, Hashable],
+        fetch: Callable[[List[Hashable]], Dict[Hashable, Any]],
+    ) -> Dict[Hashable, Any]:
+        """Get data per item (such as a surface ID) from the cache, fetching the
+        missing items in a single call."""
+        if not keys:
+            return {}
+        cache = self._cache
+        if cache is None:
+            return fetch(list(keys))
+        generation = cache.generation
+        data = {}
+        for item, key in keys.items():
+            value = cache.get(key)
+            if value is not None:
+                data[item] = value
+        missing_items = [item for item in keys if item not in data]
+        if missing_items:
+            fetched_data = fetch(missing_items)
+            for item in missing_items:
+                data[item] = cache.put(keys[item], fetched_data[item], generation)
+        return data
+
     def new_transaction(self):
         """Create a new field transaction."""
         return FieldTransaction(
@@ -1165,6 +2291,7 @@ class FieldData:
             self._allowed_surface_names,
             self._allowed_scalar_field_names,
             self._allowed_vector_field_names,
+            self._cache,
         )
 
     def get_scalar_field_data(
@@ -1199,39 +2326,127 @@ class FieldData:
             allowed_surface_names=self._allowed_surface_names,
             surfaces=surfaces,
         )
-        fields_request = get_fields_request()
-        fields_request.scalarFieldRequest.extend(
-            [
-                FieldDataProtoModule.ScalarFieldRequest(
-                    surfaceId=surface_id,
-                    scalarFieldName=self._allowed_scalar_field_names.valid_name(
-                        field_name
-                    ),
-                    dataLocation=(
-                        FieldDataProtoModule.DataLocation.Nodes
-                        if node_value
-                        else FieldDataProtoModule.DataLocation.Elements
-                    ),
-                    provideBoundaryValues=boundary_value,
-                )
-                for surface_id in surface_ids
-            ]
+        self._allowed_scalar_field_names.valid_name(field_name)
+        scalar_field_data = self._get_scalar_fields_data(
+            [field_name], surface_ids, node_value, boundary_value
         )
+        return {
+            surface: scalar_field_data[(field_name, surface_ids[count])]
+            for count, surface in enumerate(surfaces)
+        }
 
-        fields = ChunkParser().extract_fields(self._service.get_fields(fields_request))
-        scalar_field_data = next(iter(fields.values()))
+    def get_scalar_fields_data(
+        self,
+        field_names: List[str],
+        surfaces: List[int | str],
+        node_value: bool | None = True,
+        boundary_value: bool | None = True,
+    ) -> Dict[int | str, np.array]:
+        """Get the data of several scalar fields on surfaces in a single request.
+
+        The field and surface names are validated once, and all the combinations of
+        fields and surfaces are received in a single stream.
+
+        Parameters
+        ----------
+        field_names : List[str]
+            Names of the scalar fields.
+        surfaces : List[int | str]
+            List of surface IDS or surface names for the surface data.
+        node_value : bool, optional
+            Whether to provide data for the nodal location. The default is ``True``.
+            When ``False``, data is provided for the element location.
+        boundary_value : bool, optional
+            Whether to provide slip velocity at the wall boundaries. The default is
+            ``True``. When ``True``, no slip velocity is provided.
 
+        Returns
+        -------
+        Dict[int | str, np.array]
+            Returns a map of surface IDs (or names) to 2-D arrays holding one column
+            per field, in the order of ``field_names``.
+        """
+        surface_ids = _get_surface_ids(
+            field_info=self._field_info,
+            allowed_surface_names=self._allowed_surface_names,
+            surfaces=surfaces,
+        )
+        for field_name in field_names:
+            self._allowed_scalar_field_names.valid_name(field_name)
+        scalar_field_data = self._get_scalar_fields_data(
+            field_names, surface_ids, node_value, boundary_value
+        )
         return {
-            surface: scalar_field_data[surface_ids[count]][field_name]
+            surface: np.stack(
+                [
+                    scalar_field_data[(field_name, surface_ids[count])]
+                    for field_name in field_names
+                ],
+                axis=1,
+            )
             for count, surface in enumerate(surfaces)
         }
 
+    def _get_scalar_fields_data(
+        self,
+        field_names: List[str],
+        surface_ids: List[int],
+        node_value: bool | None,
+        boundary_value: bool | None,
+    ) -> Dict[Tuple[str, int], np.array]:
+        """Get scalar field data per field name and surface ID, in a single request
+        for the data which is not cached."""
+
+        def _fetch(fields_and_surface_ids):
+            fields_request = get_fields_request()
+            fields_request.scalarFieldRequest.extend(
+                [
+                    FieldDataProtoModule.ScalarFieldRequest(
+                        surfaceId=surface_id,
+                        scalarFieldName=field_name,
+                        dataLocation=(
+                            FieldDataProtoModule.DataLocation.Nodes
+                            if node_value
+                            else FieldDataProtoModule.DataLocation.Elements
+                        ),
+                        provideBoundaryValues=boundary_value,
+                    )
+                    for field_name, surface_id in fields_and_surface_ids
+                ]
+            )
+            fields = ChunkParser().extract_fields(
+                self._service.get_fields(fields_request)
+            )
+            scalar_field_data = next(iter(fields.values()))
+            return {
+                (field_name, surface_id): scalar_field_data[surface_id][field_name]
+                for field_name, surface_id in fields_and_surface_ids
+            }
+
+        return self._get_cached_data(
+            {
+                (field_name, surface_id): (
+                    "scalar-field",
+                    field_name,
+                    surface_id,
+                    bool(node_value),
+                    bool(boundary_value),
+                )
+                for field_name in field_names
+                for surface_id in surface_ids
+            },
+            _fetch,
+        )
+
     def get_surface_data(
         self,
         data_types: List[SurfaceDataType],
         surfaces: List[int | str],
         overset_mesh: bool | None = False,
-    ) -> Dict[int | str, Dict[SurfaceDataType, np.array | List[np.array]]]:
+        connectivity_format: str | None = "list",
+    ) -> Dict[
+        int | str, Dict[SurfaceDataType, np.array | List[np.array] | ConnectivityCSR]
+    ]:
         """Get surface data (vertices, faces connectivity, centroids, and normals).
 
         Parameters
@@ -1242,34 +2457,65 @@ class FieldData:
             List of surface IDS or surface names for the surface data.
         overset_mesh : bool, optional
             Whether to provide the overset method. The default is ``False``.
+        connectivity_format : str, optional
+            Format of the faces connectivity data. ``"list"`` provides a list of
+            arrays, one per face. ``"csr"`` provides a ``ConnectivityCSR`` object
+            holding the offsets and indices arrays. The default is ``"list"``.
 
         Returns
         -------
-        Dict[int | str, Dict[SurfaceDataType, np.array | List[np.array]]]
+        Dict[int | str, Dict[SurfaceDataType, np.array | List[np.array] | ConnectivityCSR]]
              Returns a map of surface IDs (or names) to face
              vertices, connectivity data, and normal or centroid data.
+
+        Raises
+        ------
+        ValueError
+            If the connectivity format is not supported.
         """
+        _validate_connectivity_format(connectivity_format)
         surface_ids = _get_surface_ids(
             field_info=self._field_info,
             allowed_surface_names=self._allowed_surface_names,
             surfaces=surfaces,
         )
-        fields_request = get_fields_request()
-        fields_request.surfaceRequest.extend(
-            [
-                FieldDataProtoModule.SurfaceRequest(
-                    surfaceId=surface_id,
-                    oversetMesh=overset_mesh,
-                    provideFaces=SurfaceDataType.FacesConnectivity in data_types,
-                    provideVertices=SurfaceDataType.Vertices in data_types,
-                    provideFacesCentroid=SurfaceDataType.FacesCentroid in data_types,
-                    provideFacesNormal=SurfaceDataType.FacesNormal in data_types,
+
+        def _fetch(surface_ids):
+            fields_request = get_fields_request()
+            fields_request.surfaceRequest.extend(
+                [
+                    FieldDataProtoModule.SurfaceRequest(
+                        surfaceId=surface_id,
+                        oversetMesh=overset_mesh,
+                        provideFaces=SurfaceDataType.FacesConnectivity in data_types,
+                        provideVertices=SurfaceDataType.Vertices in data_types,
+                        provideFacesCentroid=SurfaceDataType.FacesCentroid
+                        in data_types,
+                        provideFacesNormal=SurfaceDataType.FacesNormal in data_types,
+                    )
+                    for surface_id in surface_ids
+                ]
+            )
+            fields = ChunkParser().extract_fields(
+                self._service.get_fields(fields_request)
+            )
+            return next(iter(fields.values()))
+
+        data_type_values = tuple(
+            sorted({SurfaceDataType(data_type).value for data_type in data_types})
+        )
+        surface_data = self._get_cached_data(
+            {
+                surface_id: (
+                    "surface-data",
+                    data_type_values,
+                    surface_id,
+                    bool(overset_mesh),
                 )
                 for surface_id in surface_ids
-            ]
+            },
+            _fetch,
         )
-        fields = ChunkParser().extract_fields(self._service.get_fields(fields_request))
-        surface_data = next(iter(fields.values()))
 
         ret_surf_data = {}
         for count, surface in enumerate(surfaces):
@@ -1280,7 +2526,8 @@ class FieldData:
                         self._get_faces_connectivity_data(
                             surface_data[surface_ids[count]][
                                 SurfaceDataType.FacesConnectivity.value
-                            ]
+                            ],
+                            connectivity_format,
                         )
                     )
                 else:
@@ -1290,14 +2537,11 @@ class FieldData:
         return ret_surf_data
 
     @staticmethod
-    def _get_faces_connectivity_data(data):
-        faces_data = []
-        i = 0
-        while i < len(data):
-            end = i + 1 + data[i]
-            faces_data.append(data[i + 1 : end])
-            i = end
-        return faces_data
+    def _get_faces_connectivity_data(data, connectivity_format: str = "list"):
+        connectivity = _get_connectivity_csr(data)
+        if connectivity_format == "csr":
+            return connectivity
+        return connectivity.to_list()
 
     def get_vector_field_data(
         self,
@@ -1325,23 +2569,39 @@ class FieldData:
         )
         for surface_id in surface_ids:
             self.scheme_eval.string_eval(f"(surface? {surface_id})")
-        fields_request = get_fields_request()
-        fields_request.vectorFieldRequest.extend(
-            [
-                FieldDataProtoModule.VectorFieldRequest(
-                    surfaceId=surface_id,
-                    vectorFieldName=self._allowed_vector_field_names.valid_name(
-                        field_name
-                    ),
-                )
+        if surface_ids:
+            self._allowed_vector_field_names.valid_name(field_name)
+
+        def _fetch(surface_ids):
+            fields_request = get_fields_request()
+            fields_request.vectorFieldRequest.extend(
+                [
+                    FieldDataProtoModule.VectorFieldRequest(
+                        surfaceId=surface_id,
+                        vectorFieldName=field_name,
+                    )
+                    for surface_id in surface_ids
+                ]
+            )
+            fields = ChunkParser().extract_fields(
+                self._service.get_fields(fields_request)
+            )
+            vector_field_data = next(iter(fields.values()))
+            return {
+                surface_id: vector_field_data[surface_id][field_name]
                 for surface_id in surface_ids
-            ]
+            }
+
+        vector_field_data = self._get_cached_data(
+            {
+                surface_id: ("vector-field", field_name, surface_id)
+                for surface_id in surface_ids
+            },
+            _fetch,
         )
-        fields = ChunkParser().extract_fields(self._service.get_fields(fields_request))
-        vector_field_data = next(iter(fields.values()))
 
         return {
-            surface: vector_field_data[surface_ids[count]][field_name].reshape(-1, 3)
+            surface: vector_field_data[surface_ids[count]].reshape(-1, 3)
             for count, surface in enumerate(surfaces)
         }
 
@@ -1452,6 +2712,161 @@ class FieldData:
             }
         return path_lines_dict
 
+    @staticmethod
+    def _iter_surface_fields(
+        transaction: FieldTransaction,
+        surfaces: List[int | str],
+        surface_ids: List[int],
+    ) -> Iterator[Tuple[int | str, str, np.array]]:
+        surfaces_by_id = dict(zip(surface_ids, surfaces))
+        for _, surface_id, field_name, data in transaction.iter_fields():
+            yield surfaces_by_id.get(surface_id, surface_id), field_name, data
+
+    def iter_scalar_field_data(
+        self,
+        field_name: str,
+        surfaces: List[int | str],
+        node_value: bool | None = True,
+        boundary_value: bool | None = True,
+    ) -> Iterator[Tuple[int | str, np.array]]:
+        """Iterate over scalar field data on surfaces as it arrives.
+
+        The arguments are validated when this method is called. The data of each
+        surface is then yielded as soon as it has been received, without holding the
+        data of all the surfaces in memory.
+
+        Parameters
+        ----------
+        field_name : str
+            Name of the scalar field.
+        surfaces : List[int | str]
+            List of surface IDS or surface names for the surface data.
+        node_value : bool, optional
+            Whether to provide data for the nodal location. The default is ``True``.
+            When ``False``, data is provided for the element location.
+        boundary_value : bool, optional
+            Whether to provide slip velocity at the wall boundaries. The default is
+            ``True``. When ``True``, no slip velocity is provided.
+
+        Returns
+        -------
+        Iterator[Tuple[int | str, np.array]]
+            Iterator over the surface IDs (or names) and their scalar field data.
+        """
+        surface_ids = _get_surface_ids(
+            field_info=self._field_info,
+            allowed_surface_names=self._allowed_surface_names,
+            surfaces=surfaces,
+        )
+        transaction = self.new_transaction()
+        transaction.add_scalar_fields_request(
+            field_name, surface_ids, node_value, boundary_value
+        )
+        return (
+            (surface, data)
+            for surface, _, data in self._iter_surface_fields(
+                transaction, surfaces, surface_ids
+            )
+        )
+
+    def iter_vector_field_data(
+        self,
+        field_name: str,
+        surfaces: List[int | str],
+    ) -> Iterator[Tuple[int | str, np.array]]:
+        """Iterate over vector field data on surfaces as it arrives.
+
+        The arguments are validated when this method is called. The data of each
+        surface is then yielded as soon as it has been received, without holding the
+        data of all the surfaces in memory.
+
+        Parameters
+        ----------
+        field_name : str
+            Name of the vector field.
+        surfaces : List[int | str]
+            List of surface IDS or surface names for the surface data.
+
+        Returns
+        -------
+        Iterator[Tuple[int | str, np.array]]
+            Iterator over the surface IDs (or names) and their vector field data.
+        """
+        surface_ids = _get_surface_ids(
+            field_info=self._field_info,
+            allowed_surface_names=self._allowed_surface_names,
+            surfaces=surfaces,
+        )
+        transaction = self.new_transaction()
+        transaction.add_vector_fields_request(field_name, surface_ids)
+        return (
+            (surface, data.reshape(-1, 3))
+            for surface, _, data in self._iter_surface_fields(
+                transaction, surfaces, surface_ids
+            )
+        )
+
+    def iter_surface_data(
+        self,
+        data_types: List[SurfaceDataType],
+        surfaces: List[int | str],
+        overset_mesh: bool | None = False,
+        connectivity_format: str | None = "list",
+    ) -> Iterator[
+        Tuple[int | str, SurfaceDataType, np.array | List[np.array] | ConnectivityCSR]
+    ]:
+        """Iterate over surface data (vertices, faces connectivity, centroids, and
+        normals) as it arrives.
+
+        The arguments are validated when this method is called. Each kind of data of
+        each surface is then yielded as soon as it has been received, without holding
+        the data of all the surfaces in memory.
+
+        Parameters
+        ----------
+        data_types : List[SurfaceDataType],
+            SurfaceDataType Enum members.
+        surfaces : List[int | str]
+            List of surface IDS or surface names for the surface data.
+        overset_mesh : bool, optional
+            Whether to provide the overset method. The default is ``False``.
+        connectivity_format : str, optional
+            Format of the faces connectivity data, ``"list"`` or ``"csr"``. The
+            default is ``"list"``.
+
+        Returns
+        -------
+        Iterator[Tuple[int | str, SurfaceDataType, np.array | List[np.array] | ConnectivityCSR]]
+            Iterator over the surface IDs (or names), the data types and the data.
+
+        Raises
+        ------
+        ValueError
+            If the connectivity format is not supported.
+        """
+        _validate_connectivity_format(connectivity_format)
+        surface_ids = _get_surface_ids(
+            field_info=self._field_info,
+            allowed_surface_names=self._allowed_surface_names,
+            surfaces=surfaces,
+        )
+        transaction = self.new_transaction()
+        transaction.add_surfaces_request(data_types, surface_ids, overset_mesh)
+
+        def _iter_surface_data():
+            for surface, field_name, data in self._iter_surface_fields(
+                transaction, surfaces, surface_ids
+            ):
+                data_type = SurfaceDataType(field_name)
+                if data_type == SurfaceDataType.FacesConnectivity:
+                    yield surface, data_type, self._get_faces_connectivity_data(
+                        data, connectivity_format
+                    )
+                else:
+                    yield surface, data_type, data.reshape(-1, 3)
+
+        return _iter_surface_data()
+
     def get_mesh(self, zone: str | int) -> Mesh:
         """Get mesh for a zone.
 
@@ -1494,35 +2909,8 @@ class FieldData:
         )
         elements_response = self._service.get_solver_mesh_elements(elements_request)
         logger.info("Elements data received")
-        logger.info("Constructing nodes structure in PyFluent")
-        nodes = nodes_response.nodes
-        nodes = [Node(_id=node.id, x=node.x, y=node.y, z=node.z) for node in nodes]
-        node_index_by_id = {node._id: index for index, node in enumerate(nodes)}
-        logger.info("Nodes structure constructed")
-        logger.info("Constructing elements structure in PyFluent")
-        elements_pb = elements_response.elements
-        elements = []
-        for element_pb in elements_pb:
-            element_type = CellElementType(element_pb.element_type)
-            if element_type == CellElementType.POLYHEDRON:
-                facets = []
-                for facet_pb in element_pb.facets:
-                    facet = Facet(
-                        node_indices=[node_index_by_id[id] for id in facet_pb.node]
-                    )
-                    facets.append(facet)
-                element = Element(
-                    _id=element_pb.id,
-                    element_type=element_type,
-                    facets=facets,
-                )
-            else:
-                element = Element(
-                    _id=element_pb.id,
-                    element_type=element_type,
-                    node_indices=[node_index_by_id[id] for id in element_pb.node_ids],
-                )
-            elements.append(element)
-        logger.info("Elements structure constructed")
+        logger.info("Constructing mesh structure in PyFluent")
+        mesh = _get_mesh(nodes_response.nodes, elements_response.elements)
+        logger.info("Mesh structure constructed")
         logger.info("Returning mesh")
-        return Mesh(nodes=nodes, elements=elements)
+        return mesh
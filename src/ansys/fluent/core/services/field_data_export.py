@@ -0,0 +1,294 @@
+"""Writers of Fluent field data streams to HDF5, Zarr and NPZ files."""
+
+from abc import ABC, abstractmethod
+import itertools
+import os
+import shutil
+import tempfile
+from typing import Tuple
+import zipfile
+
+import numpy as np
+
+# Number of bytes in each chunk of the stored datasets. This is the size of the
+# chunks of the field data stream.
+_storage_chunk_bytes = 256 * 1024
+
+
+def _get_tag_name(tag: int | Tuple) -> str:
+    """Get a group name for the tag of a field data request."""
+    if isinstance(tag, tuple):
+        return ",".join(f"{key}={value}" for key, value in tag)
+    return str(tag)
+
+
+def _get_storage_chunks(dtype: np.dtype) -> Tuple[int]:
+    return (max(_storage_chunk_bytes // dtype.itemsize, 1),)
+
+
+class _FieldsWriter(ABC):
+    """Base class of the writers of a field data stream.
+
+    The data of each field is stored at ``<group>/<tag>/<surface_id>/<field_name>``.
+    A field which Fluent sends in several payloads is stored as a single array.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path of the file or store, which is created if it does not exist.
+    group : str, optional
+        Name of the group holding the data. If not provided, the group is named by
+        the first index which is not used by an existing group: ``"0"``, ``"1"``,
+        etc.
+    """
+
+    def __init__(self, path: str | os.PathLike, group: str | None = None):
+        """__init__ method of _FieldsWriter class."""
+        self._path = path
+        self.group = group
+
+    def _get_group_name(self, existing_groups) -> str:
+        existing_groups = set(existing_groups)
+        group = self.group
+        if group is None:
+            group = next(
+                name
+                for name in map(str, itertools.count())
+                if name not in existing_groups
+            )
+        elif group in existing_groups:
+            raise ValueError(f"Group '{group}' already exists in {self._path}.")
+        return group
+
+    @abstractmethod
+    def start_payload(
+        self, tag: int | Tuple, surface_id: int, field_name: str, dtype, size: int
+    ) -> None:
+        """Start receiving a payload of ``size`` items."""
+
+    @abstractmethod
+    def write(self, values: np.ndarray) -> None:
+        """Write the next values of the current payload."""
+
+    def finish(self) -> None:
+        """Complete the group once the stream has ended."""
+
+    def abort(self) -> None:
+        """Discard the partially written group after an error."""
+
+    def close(self) -> None:
+        """Close the file."""
+
+
+class _HDF5FieldsWriter(_FieldsWriter):
+    """Writer of a field data stream to chunked and compressed HDF5 datasets."""
+
+    def __init__(self, path: str | os.PathLike, group: str | None = None):
+        """__init__ method of _HDF5FieldsWriter class."""
+        super().__init__(path, group)
+        try:
+            import h5py
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "Missing dependencies, use 'pip install ansys-fluent-core[reader]' to install them."
+            ) from exc
+        self._file = h5py.File(path, "a")
+        self.group = self._get_group_name(self._file.keys())
+        self._group = self._file.create_group(self.group)
+        self._dataset = None
+        self._index = 0
+
+    def start_payload(self, tag, surface_id, field_name, dtype, size):
+        """Start receiving a payload of ``size`` items."""
+        tag_group = self._group.get(_get_tag_name(tag))
+        if tag_group is None:
+            tag_group = self._group.create_group(_get_tag_name(tag))
+            if isinstance(tag, tuple):
+                for key, value in tag:
+                    tag_group.attrs[key] = value
+        surface_group = tag_group.require_group(str(surface_id))
+        dataset = surface_group.get(field_name)
+        if dataset is None:
+            dataset = surface_group.create_dataset(
+                field_name,
+                shape=(0,),
+                maxshape=(None,),
+                dtype=dtype,
+                chunks=_get_storage_chunks(dtype),
+                compression="gzip",
+            )
+        self._index = dataset.shape[0]
+        dataset.resize((self._index + size,))
+        self._dataset = dataset
+
+    def write(self, values):
+        """Write the next values of the current payload."""
+        self._dataset[self._index : self._index + values.size] = values
+        self._index += values.size
+
+    def abort(self):
+        """Discard the partially written group after an error."""
+        del self._file[self.group]
+
+    def close(self):
+        """Close the file."""
+        self._file.close()
+
+
+class _ZarrFieldsWriter(_FieldsWriter):
+    """Writer of a field data stream to chunked and compressed Zarr arrays."""
+
+    def __init__(self, path: str | os.PathLike, group: str | None = None):
+        """__init__ method of _ZarrFieldsWriter class."""
+        super().__init__(path, group)
+        try:
+            import zarr
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "Missing dependencies, use 'pip install zarr' to install them."
+            ) from exc
+        self._root = zarr.open_group(str(path), mode="a")
+        self.group = self._get_group_name(self._root.group_keys())
+        self._group = self._root.create_group(self.group)
+        self._array = None
+        self._index = 0
+
+    def start_payload(self, tag, surface_id, field_name, dtype, size):
+        """Start receiving a payload of ``size`` items."""
+        tag_name = _get_tag_name(tag)
+        if tag_name not in self._group:
+            tag_group = self._group.create_group(tag_name)
+            if isinstance(tag, tuple):
+                for key, value in tag:
+                    tag_group.attrs[key] = value
+        surface_group = self._group[tag_name].require_group(str(surface_id))
+        if field_name in surface_group:
+            array = surface_group[field_name]
+        else:
+            array = surface_group.create_dataset(
+                field_name, shape=(0,), chunks=_get_storage_chunks(dtype), dtype=dtype
+            )
+        self._index = array.shape[0]
+        array.resize((self._index + size,))
+        self._array = array
+
+    def write(self, values):
+        """Write the next values of the current payload."""
+        self._array[self._index : self._index + values.size] = values
+        self._index += values.size
+
+    def abort(self):
+        """Discard the partially written group after an error."""
+        del self._root[self.group]
+
+
+class _NPZFieldsWriter(_FieldsWriter):
+    """Writer of a field data stream to a compressed NPZ archive.
+
+    Each field is spooled to a temporary file while it is received and added to the
+    archive as ``<group>/<tag>/<surface_id>/<field_name>.npy`` once the stream has
+    ended.
+    """
+
+    def __init__(self, path: str | os.PathLike, group: str | None = None):
+        """__init__ method of _NPZFieldsWriter class."""
+        super().__init__(path, group)
+        self._archive = zipfile.ZipFile(
+            path, "a", compression=zipfile.ZIP_DEFLATED, allowZip64=True
+        )
+        self.group = self._get_group_name(
+            name.split("/", 1)[0] for name in self._archive.namelist()
+        )
+        self._spool_dir = tempfile.TemporaryDirectory()
+        self._fields = {}
+        self._file = None
+
+    def start_payload(self, tag, surface_id, field_name, dtype, size):
+        """Start receiving a payload of ``size`` items."""
+        name = f"{self.group}/{_get_tag_name(tag)}/{surface_id}/{field_name}.npy"
+        field = self._fields.get(name)
+        if field is None:
+            field = self._fields[name] = [
+                dtype,
+                0,
+                tempfile.TemporaryFile(dir=self._spool_dir.name),
+            ]
+        field[1] += size
+        self._file = field[2]
+
+    def write(self, values):
+        """Write the next values of the current payload."""
+        self._file.write(np.ascontiguousarray(values).data)
+
+    def finish(self):
+        """Add the spooled fields to the archive."""
+        for name, (dtype, size, file) in self._fields.items():
+            file.seek(0)
+            with self._archive.open(name, "w", force_zip64=True) as member:
+                np.lib.format.write_array_header_1_0(
+                    member,
+                    {
+                        "descr": np.lib.format.dtype_to_descr(dtype),
+                        "fortran_order": False,
+                        "shape": (size,),
+                    },
+                )
+                shutil.copyfileobj(file, member)
+
+    def close(self):
+        """Close the archive and remove the spooled fields."""
+        for _, _, file in self._fields.values():
+            file.close()
+        self._spool_dir.cleanup()
+        self._archive.close()
+
+
+_writer_cls_by_format = {
+    "hdf5": _HDF5FieldsWriter,
+    "zarr": _ZarrFieldsWriter,
+    "npz": _NPZFieldsWriter,
+}
+
+_format_by_extension = {
+    ".h5": "hdf5",
+    ".hdf5": "hdf5",
+    ".zarr": "zarr",
+    ".npz": "npz",
+}
+
+
+def get_fields_writer(
+    path: str | os.PathLike, file_format: str | None = None, group: str | None = None
+) -> _FieldsWriter:
+    """Get the writer of a field data stream for a file format.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path of the file or store.
+    file_format : str, optional
+        ``"hdf5"``, ``"zarr"`` or ``"npz"``. If not provided, the format is deduced
+        from the extension of ``path``.
+    group : str, optional
+        Name of the group holding the data.
+
+    Raises
+    ------
+    ValueError
+        If the format is not supported or cannot be deduced from the path.
+    """
+    if file_format is None:
+        extension = os.path.splitext(os.fspath(path).rstrip("/\\"))[1].lower()
+        file_format = _format_by_extension.get(extension)
+        if file_format is None:
+            raise ValueError(
+                f"Cannot deduce the file format from '{path}'. Allowed formats are "
+                f"{list(_writer_cls_by_format)}."
+            )
+    writer_cls = _writer_cls_by_format.get(file_format)
+    if writer_cls is None:
+        raise ValueError(
+            f"Unsupported file format '{file_format}'. Allowed formats are "
+            f"{list(_writer_cls_by_format)}."
+        )
+    return writer_cls(path, group)
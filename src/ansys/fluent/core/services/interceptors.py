@@ -99,6 +99,34 @@ class ErrorStateInterceptor(grpc.UnaryUnaryClientInterceptor):
         return self._intercept_call(continuation, client_call_details, request)
 
 
+def _convert_grpc_error(ex: Exception) -> Exception:
+    """Convert the error of a gRPC call to the Python exception raised by Fluent."""
+    new_ex_cls = RuntimeError
+    try:
+        from google.rpc import error_details_pb2
+        from grpc_status import rpc_status
+
+        status = rpc_status.from_call(ex)
+        if status:
+            for detail in status.details:
+                if detail.Is(error_details_pb2.ErrorInfo.DESCRIPTOR):
+                    info = error_details_pb2.ErrorInfo()
+                    detail.Unpack(info)
+                    if info.domain == "Python":
+                        reason = info.reason
+                        ex_cls_name = _upper_snake_case_to_camel_case(reason)
+                        if hasattr(builtins, ex_cls_name):
+                            cls = getattr(builtins, ex_cls_name)
+                            if issubclass(cls, Exception):
+                                new_ex_cls = cls
+                                break
+    except DecodeError:
+        pass
+    new_ex = new_ex_cls(ex.details() if isinstance(ex, grpc.RpcError) else str(ex))
+    new_ex.__context__ = ex
+    return new_ex
+
+
 class GrpcErrorInterceptor(grpc.UnaryUnaryClientInterceptor):
     """Interceptor class to check Fluent server error state before gRPC calls are
     made."""
@@ -111,33 +139,7 @@ class GrpcErrorInterceptor(grpc.UnaryUnaryClientInterceptor):
     ) -> Any:
         response = continuation(client_call_details, request)
         if response.exception() is not None and response.code() != grpc.StatusCode.OK:
-            ex = response.exception()
-            new_ex_cls = RuntimeError
-            try:
-                from google.rpc import error_details_pb2
-                from grpc_status import rpc_status
-
-                status = rpc_status.from_call(ex)
-                if status:
-                    for detail in status.details:
-                        if detail.Is(error_details_pb2.ErrorInfo.DESCRIPTOR):
-                            info = error_details_pb2.ErrorInfo()
-                            detail.Unpack(info)
-                            if info.domain == "Python":
-                                reason = info.reason
-                                ex_cls_name = _upper_snake_case_to_camel_case(reason)
-                                if hasattr(builtins, ex_cls_name):
-                                    cls = getattr(builtins, ex_cls_name)
-                                    if issubclass(cls, Exception):
-                                        new_ex_cls = cls
-                                        break
-            except DecodeError:
-                pass
-            new_ex = new_ex_cls(
-                ex.details() if isinstance(ex, grpc.RpcError) else str(ex)
-            )
-            new_ex.__context__ = ex
-            raise new_ex from None
+            raise _convert_grpc_error(response.exception()) from None
         return response
 
     def intercept_unary_unary(
@@ -226,3 +228,106 @@ class BatchInterceptor(grpc.UnaryUnaryClientInterceptor):
     ) -> Any:
         """Intercept unary-unary call for batch operation."""
         return self._intercept_call(continuation, client_call_details, request)
+
+
+class AsyncTracingInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Interceptor class to trace gRPC calls made on an asyncio channel."""
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Any,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Intercept unary-unary call for tracing."""
+        network_logger.debug(
+            f"GRPC_TRACE: RPC = {client_call_details.method}, request = {_truncate_grpc_str(request)}"
+        )
+        call = await continuation(client_call_details, request)
+        try:
+            response = await call
+        except grpc.RpcError:
+            return call
+        # call _truncate_grpc_str early to get the size warning even when hiding secrets
+        response_str = _truncate_grpc_str(response)
+        if os.getenv("PYFLUENT_HIDE_LOG_SECRETS") != "1":
+            network_logger.debug(f"GRPC_TRACE: response = {response_str}")
+        return call
+
+
+class AsyncErrorStateInterceptor(
+    grpc.aio.UnaryUnaryClientInterceptor, grpc.aio.UnaryStreamClientInterceptor
+):
+    """Interceptor class to check Fluent server error state before gRPC calls are
+    made on an asyncio channel."""
+
+    def __init__(self, fluent_error_state) -> None:
+        """__init__ method of AsyncErrorStateInterceptor class."""
+        super().__init__()
+        self._fluent_error_state = fluent_error_state
+
+    def _check_error_state(self):
+        if self._fluent_error_state.name == "fatal":
+            details = self._fluent_error_state.details
+            raise RuntimeError(
+                f"Fatal error identified on the Fluent server: {details}."
+            )
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Any,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Intercept unary-unary call for error state checking."""
+        self._check_error_state()
+        return await continuation(client_call_details, request)
+
+    async def intercept_unary_stream(
+        self,
+        continuation: Any,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Intercept unary-stream call for error state checking."""
+        self._check_error_state()
+        return await continuation(client_call_details, request)
+
+
+class AsyncGrpcErrorInterceptor(
+    grpc.aio.UnaryUnaryClientInterceptor, grpc.aio.UnaryStreamClientInterceptor
+):
+    """Interceptor class to convert the errors of gRPC calls made on an asyncio
+    channel to the Python exceptions raised by Fluent."""
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Any,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Intercept unary-unary call for error conversion."""
+        call = await continuation(client_call_details, request)
+        try:
+            await call
+        except grpc.RpcError as ex:
+            raise _convert_grpc_error(ex) from None
+        return call
+
+    async def intercept_unary_stream(
+        self,
+        continuation: Any,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Intercept unary-stream call for error conversion."""
+        call = await continuation(client_call_details, request)
+
+        async def _iter_responses():
+            try:
+                async for response in call:
+                    yield response
+            except grpc.RpcError as ex:
+                raise _convert_grpc_error(ex) from None
+
+        return _iter_responses()
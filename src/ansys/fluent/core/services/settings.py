@@ -1,13 +1,19 @@
 """Wrapper to settings gRPC service of Fluent."""
 
 import collections.abc
+import copy
+from dataclasses import dataclass
 from functools import wraps
-from typing import Any
+import threading
+from typing import Any, Iterable, Iterator
 
 import grpc
 
+from ansys.api.fluent.v0 import batch_ops_pb2 as BatchOpsModule
 from ansys.api.fluent.v0 import settings_pb2 as SettingsModule
 from ansys.api.fluent.v0 import settings_pb2_grpc as SettingsGrpcModule
+import ansys.fluent.core as pyfluent
+from ansys.fluent.core.services.batch_ops import BatchOps, BatchOpsService
 from ansys.fluent.core.services.interceptors import (
     BatchInterceptor,
     ErrorStateInterceptor,
@@ -29,6 +35,7 @@ class _SettingsServiceImpl:
         )
         self.__stub = SettingsGrpcModule.SettingsStub(intercept_channel)
         self.__metadata = metadata
+        self.__batch_ops_service = BatchOpsService(channel, metadata)
 
     def set_var(
         self, request: SettingsModule.SetVarRequest
@@ -102,6 +109,12 @@ class _SettingsServiceImpl:
         """Get attributes."""
         return self.__stub.GetAttrs(request, metadata=self.__metadata)
 
+    def execute_batch(
+        self, requests: Iterable[BatchOpsModule.ExecuteRequest]
+    ) -> Iterator[BatchOpsModule.ExecuteResponse]:
+        """Execute several requests in a single call."""
+        return self.__batch_ops_service.execute(requests)
+
 
 trace: bool = False
 _indent: int = 0
@@ -126,6 +139,24 @@ def _trace(fn):
     return _fn
 
 
+def _clears_attr_cache(fn):
+    @wraps(fn)
+    def _fn(self, *args, **kwds):
+        # Responses received during the call are not cached either.
+        self.clear_attr_cache()
+        try:
+            return fn(self, *args, **kwds)
+        finally:
+            self.clear_attr_cache()
+            # Within a BatchOps block, the call may only have been queued. The
+            # cache is cleared again once the queued operations are executed.
+            batch_ops = BatchOps.instance()
+            if batch_ops is not None and batch_ops.batching:
+                batch_ops.add_executed_callback(self.clear_attr_cache)
+
+    return _fn
+
+
 def _get_request_instance_for_path(request_class, path: str) -> Any:
     request = request_class()
     request.path_info.path = path
@@ -133,6 +164,37 @@ def _get_request_instance_for_path(request_class, path: str) -> Any:
     return request
 
 
+@dataclass
+class AttrCacheStatistics:
+    """Statistics of the attribute cache of the settings service."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the attribute requests served by the cache."""
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+
+_MISSING = object()
+
+
+# Methods of _SettingsServiceImpl by the name of the settings RPC
+_method_names = {"GetVar": "get_var", "GetAttrs": "get_attrs"}
+
+
+def _get_batch_request(method: str, request: Any) -> BatchOpsModule.ExecuteRequest:
+    return BatchOpsModule.ExecuteRequest(
+        package=SettingsModule.DESCRIPTOR.package,
+        service="Settings",
+        method=method,
+        request_body=request.SerializeToString(),
+    )
+
+
 class SettingsService:
     """Service for accessing and modifying Fluent settings."""
 
@@ -143,6 +205,51 @@ class SettingsService:
         self._service_impl = _SettingsServiceImpl(channel, metadata, fluent_error_state)
         self._app_utilities = app_utilities
         self._scheme_eval = scheme_eval
+        # Attributes by (path, attrs, recursive). The generation is incremented at
+        # each invalidation so that a response received across an invalidation is
+        # not cached.
+        self._attr_cache = {}
+        self._attr_cache_generation = 0
+        self._attr_cache_statistics = AttrCacheStatistics()
+        self._attr_cache_lock = threading.Lock()
+
+    def clear_attr_cache(self, *args, **kwargs) -> None:
+        """Clear the cached attributes.
+
+        The cache is cleared by the changes made through this service. This must be
+        called after the settings are changed by other means, e.g. through the TUI or
+        a Scheme evaluation, if ``SETTINGS_USE_ATTR_CACHE`` is enabled. The arguments,
+        if any, are ignored, so that this can be registered as an event callback.
+        """
+        with self._attr_cache_lock:
+            self._attr_cache_generation += 1
+            if self._attr_cache:
+                self._attr_cache.clear()
+                self._attr_cache_statistics.invalidations += 1
+
+    def get_attr_cache_statistics(self) -> AttrCacheStatistics:
+        """Get the hit and invalidation counts of the attribute cache."""
+        with self._attr_cache_lock:
+            return copy.copy(self._attr_cache_statistics)
+
+    def reset_attr_cache_statistics(self) -> None:
+        """Reset the hit and invalidation counts of the attribute cache."""
+        with self._attr_cache_lock:
+            self._attr_cache_statistics = AttrCacheStatistics()
+
+    def _get_cached_attrs(self, key: tuple) -> Any:
+        with self._attr_cache_lock:
+            value = self._attr_cache.get(key, _MISSING)
+            if value is _MISSING:
+                self._attr_cache_statistics.misses += 1
+                return _MISSING
+            self._attr_cache_statistics.hits += 1
+        return copy.deepcopy(value)
+
+    def _cache_attrs(self, key: tuple, value: Any, generation: int) -> None:
+        with self._attr_cache_lock:
+            if generation == self._attr_cache_generation:
+                self._attr_cache[key] = copy.deepcopy(value)
 
     @_trace
     def _set_state_from_value(self, state: SettingsModule.Value, value: Any):
@@ -187,6 +294,7 @@ class SettingsService:
             return None
 
     @_trace
+    @_clears_attr_cache
     def set_var(self, path: str, value: Any) -> None:
         """Set the value for the given path."""
         request = _get_request_instance_for_path(SettingsModule.SetVarRequest, path)
@@ -200,7 +308,42 @@ class SettingsService:
         response = self._service_impl.get_var(request)
         return self._get_state_from_value(response.value)
 
+    def _execute_batch(self, method: str, requests: list, response_cls) -> list:
+        """Execute the requests of a settings method in a single round trip.
+
+        The requests which are not executed successfully in the batch, e.g. if the
+        method is not supported by the batch service of Fluent, are executed one by one
+        so that their errors are raised as usual.
+        """
+        responses = [None] * len(requests)
+        batch_responses = self._service_impl.execute_batch(
+            _get_batch_request(method, request) for request in requests
+        )
+        for i, batch_response in zip(range(len(requests)), batch_responses):
+            if batch_response.status == BatchOpsModule.STATUS_SUCCESSFUL:
+                responses[i] = response_cls.FromString(batch_response.response_body)
+        execute_one = getattr(self._service_impl, _method_names[method])
+        return [
+            response if response is not None else execute_one(request)
+            for request, response in zip(requests, responses)
+        ]
+
     @_trace
+    def get_vars(self, paths: list[str]) -> list[Any]:
+        """Get the values for the given paths in a single round trip."""
+        requests = [
+            _get_request_instance_for_path(SettingsModule.GetVarRequest, path)
+            for path in paths
+        ]
+        if not requests:
+            return []
+        responses = self._execute_batch(
+            "GetVar", requests, SettingsModule.GetVarResponse
+        )
+        return [self._get_state_from_value(response.value) for response in responses]
+
+    @_trace
+    @_clears_attr_cache
     def rename(self, path: str, new: str, old: str) -> None:
         """Rename the object at the given path."""
         request = _get_request_instance_for_path(SettingsModule.RenameRequest, path)
@@ -210,6 +353,7 @@ class SettingsService:
         self._service_impl.rename(request)
 
     @_trace
+    @_clears_attr_cache
     def create(self, path: str, name: str) -> None:
         """Create a named object child for the given path."""
         request = _get_request_instance_for_path(SettingsModule.CreateRequest, path)
@@ -218,6 +362,7 @@ class SettingsService:
         self._service_impl.create(request)
 
     @_trace
+    @_clears_attr_cache
     def delete(self, path: str, name: str) -> None:
         """Delete the object with the given name at the given path."""
         request = _get_request_instance_for_path(SettingsModule.DeleteRequest, path)
@@ -242,6 +387,7 @@ class SettingsService:
         return self._service_impl.get_list_size(request).size
 
     @_trace
+    @_clears_attr_cache
     def resize_list_object(self, path: str, size: int) -> None:
         """Resize a list object."""
         request = _get_request_instance_for_path(
@@ -321,6 +467,7 @@ class SettingsService:
         return self._extract_static_info(response.info)
 
     @_trace
+    @_clears_attr_cache
     def execute_cmd(self, path: str, command: str, **kwds) -> Any:
         """Execute a given command with the provided keyword arguments."""
         request = _get_request_instance_for_path(
@@ -358,14 +505,62 @@ class SettingsService:
     @_trace
     def get_attrs(self, path: str, attrs: list[str], recursive: bool = False) -> Any:
         """Return values of given attributes."""
+        use_cache = pyfluent.SETTINGS_USE_ATTR_CACHE
+        if use_cache:
+            key = (path, tuple(attrs), recursive)
+            ret = self._get_cached_attrs(key)
+            if ret is not _MISSING:
+                return ret
+            generation = self._attr_cache_generation
         request = _get_request_instance_for_path(SettingsModule.GetAttrsRequest, path)
         request.attrs[:] = attrs
         request.recursive = recursive
 
         response = self._service_impl.get_attrs(request)
         if recursive:
-            return self._parse_attrs(response)
-        return self._get_state_from_value(response.values)
+            ret = self._parse_attrs(response)
+        else:
+            ret = self._get_state_from_value(response.values)
+        if use_cache:
+            self._cache_attrs(key, ret, generation)
+        return ret
+
+    @_trace
+    def get_attrs_many(
+        self, paths: list[str], attrs: list[str], recursive: bool = False
+    ) -> list[Any]:
+        """Return values of given attributes for the given paths in a single round
+        trip."""
+        use_cache = pyfluent.SETTINGS_USE_ATTR_CACHE
+        generation = self._attr_cache_generation
+        rets = [_MISSING] * len(paths)
+        requests = {}
+        for i, path in enumerate(paths):
+            if use_cache:
+                rets[i] = self._get_cached_attrs((path, tuple(attrs), recursive))
+                if rets[i] is not _MISSING:
+                    continue
+            request = _get_request_instance_for_path(
+                SettingsModule.GetAttrsRequest, path
+            )
+            request.attrs[:] = attrs
+            request.recursive = recursive
+            requests[i] = request
+        if not requests:
+            return rets
+        responses = self._execute_batch(
+            "GetAttrs", list(requests.values()), SettingsModule.GetAttrsResponse
+        )
+        for i, response in zip(requests, responses):
+            if recursive:
+                rets[i] = self._parse_attrs(response)
+            else:
+                rets[i] = self._get_state_from_value(response.values)
+            if use_cache:
+                self._cache_attrs(
+                    (paths[i], tuple(attrs), recursive), rets[i], generation
+                )
+        return rets
 
     @_trace
     def has_wildcard(self, name: str) -> bool:
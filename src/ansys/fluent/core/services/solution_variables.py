@@ -1,7 +1,8 @@
 """Wrappers over SVAR gRPC service of Fluent."""
 
-import math
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import Any, Callable, Dict, List, Tuple
 import warnings
 
 import grpc
@@ -10,6 +11,7 @@ import numpy as np
 from ansys.api.fluent.v0 import field_data_pb2 as FieldDataProtoModule
 from ansys.api.fluent.v0 import svar_pb2 as SvarProtoModule
 from ansys.api.fluent.v0 import svar_pb2_grpc as SvarGrpcModule
+import ansys.fluent.core as pyfluent
 from ansys.fluent.core.services.field_data import (
     _FieldDataConstants,
     override_help_text,
@@ -100,14 +102,12 @@ class SolutionVariableInfo:
                 )
 
         def _filter(self, solution_variables_info):
+            names = {
+                solution_variable_info.name
+                for solution_variable_info in solution_variables_info
+            }
             self._solution_variables_info = {
-                k: v
-                for k, v in self._solution_variables_info.items()
-                if k
-                in [
-                    solution_variable_info.name
-                    for solution_variable_info in solution_variables_info
-                ]
+                k: v for k, v in self._solution_variables_info.items() if k in names
             }
 
         def __getitem__(self, name):
@@ -194,12 +194,96 @@ class SolutionVariableInfo:
             """Get domain id."""
             return self._domains_info.get(domain_name, None)
 
-    def __init__(
-        self,
-        service: SolutionVariableService,
-    ):
+    # Events after which the cached zones and solution variables information is no
+    # longer valid.
+    _metadata_invalidating_events = (
+        "ABOUT_TO_LOAD_CASE",
+        "CASE_LOADED",
+        "ABOUT_TO_LOAD_DATA",
+        "DATA_LOADED",
+        "SOLUTION_INITIALIZED",
+    )
+
+    def __init__(self, service: SolutionVariableService, events_manager=None):
         """Initialize SolutionVariableInfo."""
         self._service = service
+        self._metadata = {}
+        self._metadata_version = 0
+        self._metadata_lock = threading.Lock()
+        self._is_metadata_cache_supported = events_manager is not None and all(
+            event_name in events_manager._event_type.__members__
+            for event_name in self._metadata_invalidating_events
+        )
+        if self._is_metadata_cache_supported:
+            for event_name in self._metadata_invalidating_events:
+                events_manager.register_callback(
+                    events_manager._event_type[event_name], self._on_metadata_changed
+                )
+
+    @property
+    def _use_metadata_cache(self) -> bool:
+        return (
+            self._is_metadata_cache_supported
+            and pyfluent.SOLUTION_VARIABLE_INFO_USE_CACHE
+        )
+
+    @property
+    def metadata_version(self) -> int:
+        """Version of the cached zones and solution variables information.
+
+        The version is incremented each time the cached information is invalidated.
+        """
+        return self._metadata_version
+
+    def refresh(self) -> None:
+        """Invalidate the cached zones and solution variables information.
+
+        The information is fetched again from Fluent on the next access. This is
+        required only after the zones are modified without a case or data file being
+        loaded, for example, after separating a zone. The information is also
+        refreshed when the data read from Fluent does not match the cached zone
+        counts, for example, after the mesh is adapted. Refresh it explicitly before
+        calling ``create_empty_array()`` after a mesh change, if no data was read in
+        between.
+        """
+        with self._metadata_lock:
+            self._metadata = {}
+            self._metadata_version += 1
+
+    def _on_metadata_changed(self, session, event_info):
+        self.refresh()
+
+    def _refresh_on_miss(self) -> bool:
+        """Invalidate the cached information after a failed name lookup.
+
+        Returns whether the information was cached, in which case the lookup should
+        be retried.
+        """
+        if self._use_metadata_cache and self._metadata:
+            self.refresh()
+            return True
+        return False
+
+    def _get_metadata(self, key, fetch: Callable[[], Any]) -> Any:
+        if not self._use_metadata_cache:
+            return fetch()
+        version = self._metadata_version
+        metadata = self._metadata.get(key)
+        if metadata is None:
+            metadata = fetch()
+            with self._metadata_lock:
+                if version == self._metadata_version:
+                    self._metadata[key] = metadata
+        return metadata
+
+    def _get_variables_info_response(self, domain_id: int, zone_id: int):
+        def _fetch():
+            request = SvarProtoModule.GetSvarsInfoRequest(
+                domainId=domain_id, zoneId=zone_id
+            )
+            return self._service.get_variables_info(request).svarsInfo
+
+        return self._get_metadata(("variables", domain_id, zone_id), _fetch)
 
     def get_variables_info(
         self, zone_names: List[str], domain_name: str | None = "mixture"
@@ -223,17 +307,16 @@ class SolutionVariableInfo:
         allowed_domain_names = _AllowedDomainNames(self)
         solution_variables_info = None
         for zone_name in zone_names:
-            request = SvarProtoModule.GetSvarsInfoRequest(
-                domainId=allowed_domain_names.valid_name(domain_name),
-                zoneId=allowed_zone_names.valid_name(zone_name),
+            svars_info = self._get_variables_info_response(
+                allowed_domain_names.valid_name(domain_name),
+                allowed_zone_names.valid_name(zone_name),
             )
-            response = self._service.get_variables_info(request)
             if solution_variables_info is None:
                 solution_variables_info = SolutionVariableInfo.SolutionVariables(
-                    response.svarsInfo
+                    svars_info
                 )
             else:
-                solution_variables_info._filter(response.svarsInfo)
+                solution_variables_info._filter(svars_info)
         return solution_variables_info
 
     def get_svars_info(
@@ -258,9 +341,15 @@ class SolutionVariableInfo:
         SolutionVariableInfo.ZonesInfo
             Object containing information for all zones.
         """
-        request = SvarProtoModule.GetZonesInfoRequest()
-        response = self._service.get_zones_info(request)
-        return SolutionVariableInfo.ZonesInfo(response.zonesInfo, response.domainsInfo)
+
+        def _fetch():
+            request = SvarProtoModule.GetZonesInfoRequest()
+            response = self._service.get_zones_info(request)
+            return SolutionVariableInfo.ZonesInfo(
+                response.zonesInfo, response.domainsInfo
+            )
+
+        return self._get_metadata("zones", _fetch)
 
 
 class SvarError(ValueError):
@@ -291,6 +380,19 @@ class ZoneError(ValueError):
         )
 
 
+class ZoneSizeError(RuntimeError):
+    """Exception class for data received for a zone whose size does not match the
+    zone count."""
+
+    def __init__(self, zone_name: str, expected_size: int, received_size: int):
+        """Initialize ZoneSizeError."""
+        self.zone_name = zone_name
+        super().__init__(
+            f"{received_size} values were received for zone '{zone_name}', which has "
+            f"{expected_size} values."
+        )
+
+
 class _AllowedNames:
     def is_valid(self, name):
         """Check whether a given name is valid or not."""
@@ -315,8 +417,11 @@ class _AllowedSvarNames:
         domain_name: str | None = "mixture",
     ):
         """Check whether solution variable name is valid or not."""
-        return solution_variable_name in self(
-            zone_names=zone_names, domain_name=domain_name
+        return (
+            self._solution_variable_info.get_variables_info(
+                zone_names=zone_names, domain_name=domain_name
+            )[solution_variable_name]
+            is not None
         )
 
     def valid_name(
@@ -334,6 +439,11 @@ class _AllowedSvarNames:
         """
         if not self.is_valid(
             solution_variable_name, zone_names=zone_names, domain_name=domain_name
+        ) and (
+            not self._solution_variable_info._refresh_on_miss()
+            or not self.is_valid(
+                solution_variable_name, zone_names=zone_names, domain_name=domain_name
+            )
         ):
             raise SvarError(
                 solution_variable_name=solution_variable_name,
@@ -342,13 +452,32 @@ class _AllowedSvarNames:
         return solution_variable_name
 
 
-class _AllowedZoneNames(_AllowedNames):
+class _AllowedZonesInfoNames(_AllowedNames):
     def __init__(self, solution_variable_info: SolutionVariableInfo):
-        self._zones_info = solution_variable_info.get_zones_info()
+        self._solution_variable_info = solution_variable_info
+        self._metadata_version = solution_variable_info.metadata_version
+        self._zones_info_snapshot = solution_variable_info.get_zones_info()
+
+    @property
+    def _zones_info(self):
+        # Zones information is fetched again only if the cached information has
+        # been refreshed since this object was created.
+        metadata_version = self._solution_variable_info.metadata_version
+        if metadata_version != self._metadata_version:
+            self._metadata_version = metadata_version
+            self._zones_info_snapshot = self._solution_variable_info.get_zones_info()
+        return self._zones_info_snapshot
+
+
+class _AllowedZoneNames(_AllowedZonesInfoNames):
 
     def __call__(self) -> List[str]:
         return self._zones_info.zones
 
+    def is_valid(self, zone_name):
+        """Check whether a given zone name is valid or not."""
+        return zone_name in self._zones_info._zones_info
+
     def valid_name(self, zone_name):
         """Get a valid zone name.
 
@@ -357,7 +486,10 @@ class _AllowedZoneNames(_AllowedNames):
         ZoneError
             If the given zone name is invalid.
         """
-        if not self.is_valid(zone_name):
+        if not self.is_valid(zone_name) and (
+            not self._solution_variable_info._refresh_on_miss()
+            or not self.is_valid(zone_name)
+        ):
             raise ZoneError(
                 zone_name=zone_name,
                 allowed_values=self(),
@@ -365,13 +497,15 @@ class _AllowedZoneNames(_AllowedNames):
         return self._zones_info[zone_name].zone_id
 
 
-class _AllowedDomainNames(_AllowedNames):
-    def __init__(self, solution_variable_info: SolutionVariableInfo):
-        self._zones_info = solution_variable_info.get_zones_info()
+class _AllowedDomainNames(_AllowedZonesInfoNames):
 
     def __call__(self) -> List[str]:
         return self._zones_info.domains
 
+    def is_valid(self, domain_name):
+        """Check whether a given domain name is valid or not."""
+        return domain_name in self._zones_info._domains_info
+
     def valid_name(self, domain_name):
         """Get a valid domain name.
 
@@ -406,26 +540,37 @@ class _SvarMethod:
         return self._svar_accessor(*args, **kwargs)
 
 
-def extract_svars(solution_variables_data):
-    """Extracts SVAR data via a server call."""
+def _read_svars(
+    solution_variables_data,
+    get_zone_array: Callable[[int, type, int], np.ndarray],
+) -> None:
+    """Read SVAR data received from Fluent.
 
-    def _extract_svar(field_datatype, field_size, solution_variables_data):
-        field_arr = np.empty(field_size, dtype=field_datatype)
-        field_datatype_item_size = np.dtype(field_datatype).itemsize
-        index = 0
-        for solution_variable_data in solution_variables_data:
+    The data of each zone is written into the array returned by
+    ``get_zone_array(zone_id, field_datatype, field_size)``.
+    """
+    zone_array = None
+    for solution_variable_data in solution_variables_data:
+        array_type = solution_variable_data.WhichOneof("array")
+        if array_type == "payloadInfo":
+            payload_info = solution_variable_data.payloadInfo
+            field_datatype = _FieldDataConstants.proto_field_type_to_np_data_type[
+                payload_info.fieldType
+            ]
+            field_size = payload_info.fieldSize
+            field_datatype_item_size = np.dtype(field_datatype).itemsize
+            zone_array = get_zone_array(payload_info.zone, field_datatype, field_size)
+            index = 0
+        elif array_type == "payload" and zone_array is not None:
             chunk = solution_variable_data.payload
             if chunk.bytePayload:
                 count = min(
                     len(chunk.bytePayload) // field_datatype_item_size,
                     field_size - index,
                 )
-                field_arr[index : index + count] = np.frombuffer(
+                zone_array[index : index + count] = np.frombuffer(
                     chunk.bytePayload, field_datatype, count=count
                 )
-                index += count
-                if index == field_size:
-                    return field_arr
             else:
                 payload = (
                     chunk.floatPayload.payload
@@ -434,29 +579,94 @@ def extract_svars(solution_variables_data):
                     or chunk.longPayload.payload
                 )
                 count = len(payload)
-                field_arr[index : index + count] = np.fromiter(
-                    payload, dtype=field_datatype
+                zone_array[index : index + count] = np.fromiter(
+                    payload, dtype=field_datatype, count=count
                 )
-                index += count
-                if index == field_size:
-                    return field_arr
+            index += count
+            if index == field_size:
+                zone_array = None
+
 
+def extract_svars(solution_variables_data):
+    """Extracts SVAR data via a server call."""
     zones_svar_data = {}
-    for array in solution_variables_data:
-        if array.WhichOneof("array") == "payloadInfo":
-            zones_svar_data[array.payloadInfo.zone] = _extract_svar(
-                _FieldDataConstants.proto_field_type_to_np_data_type[
-                    array.payloadInfo.fieldType
-                ],
-                array.payloadInfo.fieldSize,
-                solution_variables_data,
-            )
-        elif array.WhichOneof("array") == "header":
-            continue
 
+    def _get_zone_array(zone_id, field_datatype, field_size):
+        zone_array = zones_svar_data[zone_id] = np.empty(
+            field_size, dtype=field_datatype
+        )
+        return zone_array
+
+    _read_svars(solution_variables_data, _get_zone_array)
     return zones_svar_data
 
 
+def _generate_set_data_requests(
+    solution_variable_name: str, domain_id: int, zone_ids_to_svar_data: Dict
+):
+    """Generate the requests of the SetSvarData RPC.
+
+    The requests are generated as they are sent. Each chunk is sliced from the
+    buffer of the zone data, so no more than one chunk is copied at a time.
+    """
+    yield SvarProtoModule.SetSvarDataRequest(
+        header=SvarProtoModule.SvarHeader(
+            name=solution_variable_name, domainId=domain_id
+        )
+    )
+    for zone_id, solution_variable_data in zone_ids_to_svar_data.items():
+        # Any buffer-protocol object is accepted, for example, a memory-mapped
+        # array. The data is copied only if it is not contiguous or not in the
+        # native byte order.
+        solution_variable_data = np.ascontiguousarray(solution_variable_data)
+        if not solution_variable_data.dtype.isnative:
+            solution_variable_data = solution_variable_data.astype(
+                solution_variable_data.dtype.newbyteorder("=")
+            )
+        solution_variable_data = solution_variable_data.reshape(-1)
+        field_datatype = solution_variable_data.dtype
+        yield SvarProtoModule.SetSvarDataRequest(
+            payloadInfo=SvarProtoModule.Info(
+                fieldType=_FieldDataConstants.np_data_type_to_proto_field_type[
+                    field_datatype.type
+                ],
+                fieldSize=solution_variable_data.size,
+                zone=zone_id,
+            )
+        )
+        chunk_size = _FieldDataConstants.chunk_size // field_datatype.itemsize
+        if _FieldDataConstants.bytes_stream:
+            solution_variable_bytes = memoryview(solution_variable_data).cast("B")
+            chunk_bytes = chunk_size * field_datatype.itemsize
+            for start in range(0, solution_variable_bytes.nbytes, chunk_bytes):
+                yield SvarProtoModule.SetSvarDataRequest(
+                    payload=SvarProtoModule.Payload(
+                        bytePayload=bytes(
+                            solution_variable_bytes[start : start + chunk_bytes]
+                        )
+                    )
+                )
+        else:
+            payload_field, payload_cls = {
+                np.float32: ("floatPayload", FieldDataProtoModule.FloatPayload),
+                np.float64: ("doublePayload", FieldDataProtoModule.DoublePayload),
+                np.int32: ("intPayload", FieldDataProtoModule.IntPayload),
+                np.int64: ("longPayload", FieldDataProtoModule.LongPayload),
+            }[field_datatype.type]
+            for start in range(0, solution_variable_data.size, chunk_size):
+                yield SvarProtoModule.SetSvarDataRequest(
+                    payload=SvarProtoModule.Payload(
+                        **{
+                            payload_field: payload_cls(
+                                payload=solution_variable_data[
+                                    start : start + chunk_size
+                                ]
+                            )
+                        }
+                    )
+                )
+
+
 class SolutionVariableData:
     """Provides access to Fluent SVAR data on zones.
 
@@ -512,6 +722,55 @@ class SolutionVariableData:
         def __getitem__(self, name):
             return self._data.get(name, None)
 
+    class BulkData:
+        """Data of several solution variables on several zones, held in a single
+        array."""
+
+        def __init__(self, domain_name, solution_variable_names, zone_slices, data):
+            """Initialize BulkData."""
+            self._domain_name = domain_name
+            self._solution_variable_indices = {
+                name: i for i, name in enumerate(solution_variable_names)
+            }
+            self._zone_slices = zone_slices
+            self._data = data
+
+        @property
+        def domain(self) -> str:
+            """Domain name."""
+            return self._domain_name
+
+        @property
+        def solution_variables(self) -> List[str]:
+            """Solution variable names, in the order of the rows of the data."""
+            return list(self._solution_variable_indices)
+
+        @property
+        def zones(self) -> List[str]:
+            """Zone names, in the order of the columns of the data."""
+            return list(self._zone_slices)
+
+        @property
+        def data(self) -> np.ndarray:
+            """Solution variables data as a ``(n_solution_variables, n_values)``
+            array."""
+            return self._data
+
+        def zone_slice(self, zone_name: str) -> slice:
+            """Slice of the columns of the data holding the values of a zone."""
+            return self._zone_slices[zone_name]
+
+        def get(self, solution_variable_name: str, zone_name: str) -> np.ndarray:
+            """Get the data of a solution variable on a zone, as a view."""
+            return self._data[
+                self._solution_variable_indices[solution_variable_name],
+                self._zone_slices[zone_name],
+            ]
+
+        def __getitem__(self, name):
+            index = self._solution_variable_indices.get(name)
+            return None if index is None else self._data[index]
+
     def __init__(
         self,
         service: SolutionVariableService,
@@ -520,6 +779,12 @@ class SolutionVariableData:
         """Initialize SolutionVariableData."""
         self._service = service
         self._solution_variable_info = solution_variable_info
+        # Last data uploaded with set_changed_zones_data() per domain, SVAR and zone
+        # names.
+        self._uploaded_data = {}
+        self._uploaded_data_version = solution_variable_info.metadata_version
+        # Callbacks called after SVAR data is set in Fluent
+        self._data_set_callbacks = []
 
         self.get_data = override_help_text(
             _SvarMethod(
@@ -529,6 +794,11 @@ class SolutionVariableData:
             SolutionVariableData.get_data,
         )
 
+    def _add_data_set_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback called after SVAR data is set in Fluent, for example,
+        to invalidate the field data cached in the client."""
+        self._data_set_callbacks.append(callback)
+
     def _update_solution_variable_info(self):
         self._allowed_zone_names = _AllowedZoneNames(self._solution_variable_info)
 
@@ -599,11 +869,37 @@ class SolutionVariableData:
             zone_id_name_map[zone_id] = zone_name
             svars_request.zones.append(zone_id)
 
-        return SolutionVariableData.Data(
+        zones_svar_data = extract_svars(self._service.get_data(svars_request))
+        self._check_zone_counts(
+            solution_variable_name,
+            {
+                zone_id_name_map[zone_id]: zone_data.size
+                for zone_id, zone_data in zones_svar_data.items()
+            },
             domain_name,
-            zone_id_name_map,
-            extract_svars(self._service.get_data(svars_request)),
         )
+        return SolutionVariableData.Data(domain_name, zone_id_name_map, zones_svar_data)
+
+    def _check_zone_counts(
+        self,
+        solution_variable_name: str,
+        zone_names_to_sizes: Dict[str, int],
+        domain_name: str | None,
+    ) -> None:
+        """Refresh the cached zone counts if they do not match the sizes of the data
+        received, for example, after the mesh is adapted."""
+        solution_variable_info = self._solution_variable_info
+        if not solution_variable_info._use_metadata_cache:
+            return
+        zones_info = solution_variable_info.get_zones_info()
+        dimension = solution_variable_info.get_variables_info(
+            zone_names=list(zone_names_to_sizes), domain_name=domain_name
+        )[solution_variable_name].dimension
+        if any(
+            size != zones_info[zone_name].count * dimension
+            for zone_name, size in zone_names_to_sizes.items()
+        ):
+            solution_variable_info.refresh()
 
     def get_svar_data(
         self,
@@ -622,6 +918,152 @@ class SolutionVariableData:
             domain_name=domain_name,
         )
 
+    def get_data_bulk(
+        self,
+        solution_variable_names: List[str],
+        zone_names: List[str],
+        domain_name: str | None = "mixture",
+        out: np.ndarray | None = None,
+        num_streams: int = 1,
+    ) -> BulkData:
+        """Get the data of several solution variables on several zones in a single
+        array.
+
+        The names are validated once, and the data of each zone is written directly
+        into its slice of a ``(n_solution_variables, n_values)`` array, where the
+        values of the zones are concatenated in the order of ``zone_names``.
+
+        Parameters
+        ----------
+        solution_variable_names : List[str]
+            Names of the SVARs. Only SVARs of dimension 1 are supported.
+        zone_names: List[str]
+            Zone names list for SVAR data.
+        domain_name : str, optional
+            Domain name. The default is ``mixture``.
+        out : np.ndarray, optional
+            C-contiguous array of shape ``(n_solution_variables, n_values)`` into which
+            the data is written, for example, the array of a previous call to read the
+            data at each iteration without new allocations. If not provided, a new
+            array is allocated with a data type holding all the SVARs.
+        num_streams : int, optional
+            Number of SVARs received concurrently, each through its own stream. The
+            default is ``1``.
+
+        Returns
+        -------
+        SolutionVariableData.BulkData
+            Object containing the SVARs data.
+
+        Raises
+        ------
+        ValueError
+            If an SVAR is not of dimension 1 or if ``out`` does not have the expected
+            shape.
+        ZoneSizeError
+            If the size of the data received for a zone does not match its count.
+        """
+        self._update_solution_variable_info()
+        args = solution_variable_names, zone_names, domain_name, out, num_streams
+        try:
+            return self._get_data_bulk(*args)
+        except ZoneSizeError:
+            # The cached zone counts are stale, for example, after the mesh is
+            # adapted, so they are fetched again.
+            if not self._solution_variable_info._refresh_on_miss():
+                raise
+        return self._get_data_bulk(*args)
+
+    def _get_data_bulk(
+        self,
+        solution_variable_names: List[str],
+        zone_names: List[str],
+        domain_name: str | None,
+        out: np.ndarray | None,
+        num_streams: int,
+    ) -> BulkData:
+        domain_id = self._allowed_domain_names.valid_name(domain_name)
+        zone_names = list(dict.fromkeys(zone_names))
+        solution_variables_info = self._solution_variable_info.get_variables_info(
+            zone_names=zone_names, domain_name=domain_name
+        )
+        for solution_variable_name in solution_variable_names:
+            self._allowed_solution_variable_names.valid_name(
+                solution_variable_name, zone_names, domain_name
+            )
+            dimension = solution_variables_info[solution_variable_name].dimension
+            if dimension != 1:
+                raise ValueError(
+                    f"'{solution_variable_name}' is of dimension {dimension}, only "
+                    "solution variables of dimension 1 can be read in bulk."
+                )
+
+        zones_info = self._solution_variable_info.get_zones_info()
+        zone_ids = []
+        zone_slices = {}
+        zone_names_by_id = {}
+        n_values = 0
+        for zone_name in zone_names:
+            zone_id = self._allowed_zone_names.valid_name(zone_name)
+            count = zones_info[zone_name].count
+            zone_ids.append(zone_id)
+            zone_slices[zone_name] = slice(n_values, n_values + count)
+            zone_names_by_id[zone_id] = zone_name
+            n_values += count
+
+        shape = (len(solution_variable_names), n_values)
+        if out is None:
+            out = np.empty(
+                shape,
+                dtype=np.result_type(
+                    *(
+                        solution_variables_info[name].field_type
+                        for name in solution_variable_names
+                    )
+                ),
+            )
+        elif out.shape != shape or not out.flags.c_contiguous:
+            raise ValueError(
+                f"The output array must be a C-contiguous array of shape {shape}."
+            )
+
+        def _read_solution_variable(index):
+            svars_request = SvarProtoModule.GetSvarDataRequest(
+                provideBytesStream=_FieldDataConstants.bytes_stream,
+                chunkSize=_FieldDataConstants.chunk_size,
+                name=solution_variable_names[index],
+                domainId=domain_id,
+                zones=zone_ids,
+            )
+            row = out[index]
+
+            def _get_zone_array(zone_id, field_datatype, field_size):
+                zone_name = zone_names_by_id[zone_id]
+                zone_slice = zone_slices[zone_name]
+                expected_size = zone_slice.stop - zone_slice.start
+                # The data of the zone must fill its slice exactly, otherwise it
+                # would spill into the slice of the next zone or leave values unset.
+                if field_size != expected_size:
+                    raise ZoneSizeError(zone_name, expected_size, field_size)
+                return row[zone_slice]
+
+            _read_svars(self._service.get_data(svars_request), _get_zone_array)
+
+        indices = range(len(solution_variable_names))
+        if num_streams > 1 and len(indices) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(num_streams, len(indices))
+            ) as executor:
+                # Consume the results to raise the errors of the streams.
+                list(executor.map(_read_solution_variable, indices))
+        else:
+            for index in indices:
+                _read_solution_variable(index)
+
+        return SolutionVariableData.BulkData(
+            domain_name, solution_variable_names, zone_slices, out
+        )
+
     def set_data(
         self,
         solution_variable_name: str,
@@ -630,12 +1072,17 @@ class SolutionVariableData:
     ) -> None:
         """Set SVAR data on zones.
 
+        The data is sent in chunks sliced from the arrays as the request is
+        streamed, so the arrays are not copied as a whole.
+
         Parameters
         ----------
         solution_variable_name : str
             Name of the SVAR.
         zone_names_to_solution_variable_data: Dict[str, np.array]
-            Dictionary containing zone names for SVAR data.
+            Dictionary containing zone names for SVAR data. The data can be any
+            object supporting the buffer protocol, for example, a memory-mapped
+            array loaded with ``np.load(file_name, mmap_mode="r")``.
         domain_name : str, optional
             Domain name. The default is ``mixture``.
 
@@ -644,83 +1091,125 @@ class SolutionVariableData:
         None
         """
         self._update_solution_variable_info()
+        for zone_name in zone_names_to_solution_variable_data:
+            self._uploaded_data.pop(
+                (domain_name, solution_variable_name, zone_name), None
+            )
+        self._set_data(
+            solution_variable_name, zone_names_to_solution_variable_data, domain_name
+        )
+
+    def _set_data(
+        self,
+        solution_variable_name: str,
+        zone_names_to_solution_variable_data: Dict[str, np.array],
+        domain_name: str | None,
+    ) -> None:
         domain_id = self._allowed_domain_names.valid_name(domain_name)
         zone_ids_to_svar_data = {
             self._allowed_zone_names.valid_name(zone_name): solution_variable_data
             for zone_name, solution_variable_data in zone_names_to_solution_variable_data.items()
         }
 
-        def generate_set_data_requests():
-            set_data_requests = []
-
-            set_data_requests.append(
-                SvarProtoModule.SetSvarDataRequest(
-                    header=SvarProtoModule.SvarHeader(
-                        name=solution_variable_name, domainId=domain_id
-                    )
+        try:
+            self._service.set_data(
+                _generate_set_data_requests(
+                    solution_variable_name, domain_id, zone_ids_to_svar_data
                 )
             )
+        finally:
+            # The data may have been partially set if the request failed.
+            for callback in self._data_set_callbacks:
+                callback()
 
-            for zone_id, solution_variable_data in zone_ids_to_svar_data.items():
-                max_array_size = (
-                    _FieldDataConstants.chunk_size
-                    / np.dtype(solution_variable_data.dtype).itemsize
-                )
-                solution_variable_data_list = np.array_split(
-                    solution_variable_data,
-                    math.ceil(solution_variable_data.size / max_array_size),
-                )
-                set_data_requests.append(
-                    SvarProtoModule.SetSvarDataRequest(
-                        payloadInfo=SvarProtoModule.Info(
-                            fieldType=_FieldDataConstants.np_data_type_to_proto_field_type[
-                                solution_variable_data.dtype.type
-                            ],
-                            fieldSize=solution_variable_data.size,
-                            zone=zone_id,
-                        )
-                    )
-                )
-                set_data_requests += [
-                    SvarProtoModule.SetSvarDataRequest(
-                        payload=(
-                            SvarProtoModule.Payload(
-                                floatPayload=FieldDataProtoModule.FloatPayload(
-                                    payload=solution_variable_data
-                                )
-                            )
-                            if solution_variable_data.dtype.type == np.float32
-                            else (
-                                SvarProtoModule.Payload(
-                                    doublePayload=FieldDataProtoModule.DoublePayload(
-                                        payload=solution_variable_data
-                                    )
-                                )
-                                if solution_variable_data.dtype.type == np.float64
-                                else (
-                                    SvarProtoModule.Payload(
-                                        intPayload=FieldDataProtoModule.IntPayload(
-                                            payload=solution_variable_data
-                                        )
-                                    )
-                                    if solution_variable_data.dtype.type == np.int32
-                                    else SvarProtoModule.Payload(
-                                        longPayload=FieldDataProtoModule.LongPayload(
-                                            payload=solution_variable_data
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                    )
-                    for solution_variable_data in solution_variable_data_list
-                    if solution_variable_data.size > 0
-                ]
+    def set_changed_zones_data(
+        self,
+        solution_variable_name: str,
+        zone_names_to_changes: Dict[str, np.array | Tuple[np.array, np.array]],
+        domain_name: str | None = "mixture",
+    ) -> List[str]:
+        """Set SVAR data on the zones where it has changed.
+
+        Changes are detected per zone, not per value. The data last uploaded with
+        this method is kept in the client, and only the zones whose data differs
+        from it are sent to Fluent. Fluent only receives the data of whole zones, so
+        a zone with a single changed value is sent in full: there are no savings
+        when the changes are spread over all the zones, or when the SVAR is defined
+        on a single zone. The savings are for the zones which are unchanged, at the
+        cost of a copy of the uploaded data kept in the client and compared with the
+        new data at each call.
+
+        The kept data is discarded when a case or data file is loaded or the
+        solution is initialized, and for the zones set with ``set_data()``. It is
+        otherwise assumed that the SVAR is only modified by this client, which is
+        not the case for SVARs updated by the solver during the iterations.
 
-            for set_data_request in set_data_requests:
-                yield set_data_request
+        Parameters
+        ----------
+        solution_variable_name : str
+            Name of the SVAR.
+        zone_names_to_changes: Dict[str, np.array | Tuple[np.array, np.array]]
+            Dictionary containing, for each zone name, either the new data of the
+            zone, or a tuple ``(indices, values)`` or ``(mask, values)`` of the
+            changes to the data last uploaded. Indices and boolean masks apply to the
+            data of the zone as returned by ``create_empty_array()``. If changes are
+            provided for a zone whose data has not been uploaded yet, the current data
+            is first read from Fluent.
+        domain_name : str, optional
+            Domain name. The default is ``mixture``.
 
-        self._service.set_data(generate_set_data_requests())
+        Returns
+        -------
+        List[str]
+            Names of the zones whose data was sent.
+        """
+        self._update_solution_variable_info()
+        metadata_version = self._solution_variable_info.metadata_version
+        if metadata_version != self._uploaded_data_version:
+            self._uploaded_data = {}
+            self._uploaded_data_version = metadata_version
+
+        def _key(zone_name):
+            return domain_name, solution_variable_name, zone_name
+
+        zone_names_to_read = [
+            zone_name
+            for zone_name, changes in zone_names_to_changes.items()
+            if isinstance(changes, tuple) and _key(zone_name) not in self._uploaded_data
+        ]
+        if zone_names_to_read:
+            current_data = self.get_data(
+                solution_variable_name, zone_names_to_read, domain_name
+            )
+            for zone_name in zone_names_to_read:
+                self._uploaded_data[_key(zone_name)] = current_data[zone_name]
+
+        changed_data = {}
+        for zone_name, changes in zone_names_to_changes.items():
+            uploaded_data = self._uploaded_data.get(_key(zone_name))
+            if isinstance(changes, tuple):
+                locations, values = changes
+                if np.array_equal(
+                    uploaded_data[locations],
+                    np.broadcast_to(values, uploaded_data[locations].shape),
+                ):
+                    continue
+                zone_data = uploaded_data.copy()
+                zone_data[locations] = values
+            else:
+                zone_data = np.asarray(changes).reshape(-1)
+                if uploaded_data is not None and np.array_equal(
+                    uploaded_data, zone_data
+                ):
+                    continue
+                zone_data = zone_data.copy()
+            changed_data[zone_name] = zone_data
+
+        if changed_data:
+            self._set_data(solution_variable_name, changed_data, domain_name)
+            for zone_name, zone_data in changed_data.items():
+                self._uploaded_data[_key(zone_name)] = zone_data
+        return list(changed_data)
 
     def set_svar_data(
         self,
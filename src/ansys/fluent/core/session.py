@@ -11,6 +11,7 @@ from ansys.fluent.core.fluent_connection import FluentConnection
 from ansys.fluent.core.journaling import Journal
 from ansys.fluent.core.services import service_creator
 from ansys.fluent.core.services.app_utilities import AppUtilitiesOld
+from ansys.fluent.core.services.async_field_data import AsyncFieldData
 from ansys.fluent.core.services.field_data import FieldDataService, ZoneInfo
 from ansys.fluent.core.services.scheme_eval import SchemeEval
 from ansys.fluent.core.streaming_services.datamodel_event_streaming import (
@@ -203,6 +204,7 @@ class BaseSession:
                 self.field_info = service_creator("field_info").create(
                     _session._field_data_service,
                     self._is_solution_data_valid,
+                    events_manager=_session.events,
                 )
                 self.field_data = service_creator("field_data").create(
                     _session._field_data_service,
@@ -210,6 +212,7 @@ class BaseSession:
                     self._is_solution_data_valid,
                     _session.scheme_eval,
                     get_zones_info,
+                    events_manager=_session.events,
                 )
                 self.field_data_streaming = FieldDataStreaming(
                     _session._fluent_connection._id, _session._field_data_service
@@ -220,6 +223,19 @@ class BaseSession:
                     self._is_solution_data_valid,
                     _session.scheme_eval,
                 )
+                self._fluent_connection = _session._fluent_connection
+
+            def create_async_field_data(self) -> AsyncFieldData:
+                """Create an asyncio-native field data object.
+
+                This must be called from a running event loop. The returned object
+                owns an asyncio gRPC channel, which is closed with ``await
+                async_field_data.close()`` or by using it as an asynchronous context
+                manager.
+                """
+                return AsyncFieldData.from_connection(
+                    self._fluent_connection, self.field_data
+                )
 
         self.fields = Fields(self)
 
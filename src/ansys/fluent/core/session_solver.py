@@ -65,7 +65,10 @@ def _import_settings_root(root):
         api_keys = root.child_names
 
     for root_item in api_keys:
-        _class_dict[root_item] = root.__dict__[root_item]
+        # The child objects of the root are created on first access.
+        _class_dict[root_item] = property(
+            lambda self, item=root_item: object.__getattribute__(root, item)
+        )
 
     settings_api_root = type("SettingsRoot", (object,), _class_dict)
     return settings_api_root()
@@ -131,7 +134,7 @@ class Solver(BaseSession):
             fluent_connection._channel, fluent_connection._metadata
         )
         self.fields.solution_variable_info = SolutionVariableInfo(
-            self._solution_variable_service
+            self._solution_variable_service, events_manager=self.events
         )
         self._reduction_service = self._fluent_connection.create_grpc_service(
             ReductionService, self._error_state
@@ -153,14 +156,34 @@ class Solver(BaseSession):
             SolverEvent.SOLUTION_INITIALIZED, self.monitors.refresh
         )
         self.events.register_callback(SolverEvent.DATA_LOADED, self.monitors.refresh)
+        for event in (
+            SolverEvent.CASE_LOADED,
+            SolverEvent.DATA_LOADED,
+            SolverEvent.SOLUTION_INITIALIZED,
+            SolverEvent.SETTINGS_CLEARED,
+        ):
+            self.events.register_callback(
+                event, self._settings_service.clear_attr_cache
+            )
+            self.events.register_callback(event, self._clear_settings_local_state)
 
         fluent_connection.register_finalizer_cb(self.monitors.stop)
 
+    def _clear_settings_local_state(self, *args, **kwargs):
+        """Discard the settings state mirrored by snapshots or prefetched."""
+        if self._settings_root is not None:
+            flobject._clear_local_state(self._settings_root)
+
     def _solution_variable_data(self) -> SolutionVariableData:
         """Return the SolutionVariableData handle."""
-        return service_creator("svar_data").create(
+        solution_variable_data = service_creator("svar_data").create(
             self._solution_variable_service, self.fields.solution_variable_info
         )
+        # The field data cached in the client is outdated once SVARs are set.
+        solution_variable_data._add_data_set_callback(
+            self.fields.field_data._clear_cache
+        )
+        return solution_variable_data
 
     @property
     def svar_data(self):
@@ -254,6 +277,7 @@ class Solver(BaseSession):
                 interrupt=Solver._interrupt,
                 file_transfer_service=self._file_transfer_service,
                 scheme_eval=self.scheme_eval.scheme_eval,
+                get_build_id=lambda: self._app_utilities.get_build_info()["build_id"],
             )
         return self._settings_root
 
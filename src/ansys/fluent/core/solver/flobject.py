@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import collections
 from contextlib import contextmanager, nullcontext
+import copy
 import fnmatch
 import hashlib
 import keyword
@@ -29,9 +30,11 @@ import os.path
 import pickle
 import string
 import sys
+import threading
 import types
 from typing import (
     Any,
+    Callable,
     Dict,
     ForwardRef,
     Generic,
@@ -77,6 +80,24 @@ class InactiveObjectError(RuntimeError):
         super().__init__(f"'{python_path}' is currently inactive.")
 
 
+class DeferredWriteError(RuntimeError):
+    """Raised when some of the deferred writes fail to be applied.
+
+    Attributes
+    ----------
+    errors : dict[str, Exception]
+        Errors by the path of the failed writes.
+    """
+
+    def __init__(self, errors: dict[str, Exception]):
+        """Initialize DeferredWriteError."""
+        self.errors = errors
+        super().__init__(
+            "Failed to apply the deferred writes:\n"
+            + "\n".join(f"  '{path}': {error}" for path, error in errors.items())
+        )
+
+
 class _InlineConstants:
     is_active = "active?"
     is_stable = "webui-release-active?"
@@ -203,6 +224,333 @@ def _get_class_from_paths(root_cls, some_path: list[str], other_path: list[str])
     return cls, full_path
 
 
+class _PrefetchingProxy:
+    """Proxy which serves the reads of prefetched settings paths.
+
+    The paths added to the proxy are gathered until the next read, which fetches all of
+    them in a single round trip with ``get_vars`` and ``get_attrs_many``. Snapshots
+    of a subtree are added with their state and attributes already fetched. The
+    values, object names and list sizes of the descendants of a prefetched path are
+    extracted from its value. Any write through the proxy discards the prefetched
+    values, and the reads which are not prefetched are forwarded to the wrapped proxy.
+
+    Parameters
+    ----------
+    flproxy
+        Object that interfaces with the Fluent backend.
+    """
+
+    _writes = frozenset(
+        [
+            "set_var",
+            "rename",
+            "create",
+            "delete",
+            "resize_list_object",
+            "execute_cmd",
+        ]
+    )
+    _missing = object()
+
+    def __init__(self, flproxy):
+        """__init__ of _PrefetchingProxy class."""
+        self._flproxy = flproxy
+        self._pending_paths = {}
+        self._pending_attrs = {}
+        self._values = {}
+        self._attrs = {}
+        self._clear_callbacks = []
+        self.active = True
+
+    def add(self, path: str, attrs: list[str] | None = None) -> None:
+        """Add a path whose value, or the given attributes, are prefetched."""
+        if attrs:
+            self._pending_attrs.setdefault(tuple(attrs), {})[path] = None
+        else:
+            self._pending_paths[path] = None
+
+    def add_snapshot(self, path: str, value, attrs: dict | None = None) -> None:
+        """Add the fetched state and recursive attributes of a path."""
+        self._values[path] = value
+        if attrs:
+            self.add_snapshot_attrs(path, attrs)
+
+    def add_snapshot_attrs(self, path: str, attrs: dict) -> None:
+        """Add the fetched recursive attributes of a path."""
+        self._attrs.setdefault(path, {}).update(attrs.get("attrs") or {})
+        for name, child_attrs in (attrs.get("group_children") or {}).items():
+            self.add_snapshot_attrs(f"{path}/{name}" if path else name, child_attrs)
+
+    def on_clear(self, callback) -> None:
+        """Register a callback called once when the prefetched values are discarded."""
+        self._clear_callbacks.append(callback)
+
+    def clear(self) -> None:
+        """Discard the prefetched values."""
+        self._values.clear()
+        self._attrs.clear()
+        callbacks, self._clear_callbacks = self._clear_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def close(self) -> None:
+        """Discard the prefetched values and forward all the calls from now on."""
+        self.clear()
+        self._pending_paths.clear()
+        self._pending_attrs.clear()
+        self.active = False
+
+    def _resolve(self) -> None:
+        if self._pending_paths:
+            paths = list(self._pending_paths)
+            self._pending_paths.clear()
+            self._values.update(zip(paths, self._flproxy.get_vars(paths)))
+        while self._pending_attrs:
+            attrs, paths = self._pending_attrs.popitem()
+            paths = list(paths)
+            for path, values in zip(
+                paths, self._flproxy.get_attrs_many(paths, list(attrs))
+            ):
+                self._attrs.setdefault(path, {}).update(values or {})
+
+    def _find_value(self, path: str):
+        self._resolve()
+        comps = path.split("/") if path else []
+        for i in range(len(comps), -1, -1):
+            prefix = "/".join(comps[:i])
+            value = self._values.get(prefix, self._missing)
+            if value is not self._missing:
+                break
+        else:
+            return self._missing
+        if i < len(comps) and any(c in prefix for c in "*?["):
+            # The value of a wildcard path is keyed by the matched names.
+            return self._missing
+        for comp in comps[i:]:
+            if isinstance(value, dict):
+                value = value.get(comp)
+            elif isinstance(value, list) and comp.isdigit() and int(comp) < len(value):
+                value = value[int(comp)]
+            else:
+                value = None
+            if value is None:
+                return self._missing
+        return value
+
+    def get_var(self, path: str):
+        """Get the value for the given path."""
+        if self.active:
+            value = self._find_value(path)
+            if value is not self._missing:
+                return copy.deepcopy(value)
+        return self._flproxy.get_var(path)
+
+    def get_object_names(self, path: str) -> list[str]:
+        """Get the names of the child objects of the named object at the given
+        path."""
+        if self.active:
+            value = self._find_value(path)
+            if isinstance(value, dict):
+                return list(value)
+        return self._flproxy.get_object_names(path)
+
+    def get_list_size(self, path: str) -> int:
+        """Get the number of elements of the list object at the given path."""
+        if self.active:
+            value = self._find_value(path)
+            if isinstance(value, list):
+                return len(value)
+        return self._flproxy.get_list_size(path)
+
+    def get_attrs(self, path: str, attrs: list[str], recursive: bool = False):
+        """Get the values of the given attributes for the given path."""
+        if self.active and not recursive:
+            self._resolve()
+            values = self._attrs.get(path)
+            if values is not None and all(attr in values for attr in attrs):
+                return {
+                    attr: value
+                    for attr, value in values.items()
+                    if attr in attrs or attr == _InlineConstants.is_active
+                }
+        return self._flproxy.get_attrs(path, attrs, recursive)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._flproxy, name)
+        if name not in self._writes:
+            return attr
+
+        def _write(*args, **kwds):
+            self.clear()
+            return attr(*args, **kwds)
+
+        return _write
+
+    def __eq__(self, other):
+        if isinstance(other, (_PrefetchingProxy, _DeferringProxy)):
+            other = other._flproxy
+        return self._flproxy == other
+
+
+def _deep_merge(value, other):
+    """Merge ``other`` over ``value``, nested dictionaries are merged key by key."""
+    if isinstance(value, dict) and isinstance(other, dict):
+        ret = dict(value)
+        for k, v in other.items():
+            ret[k] = _deep_merge(ret[k], v) if k in ret else v
+        return ret
+    return other
+
+
+# Child classes of the settings classes by Fluent name
+_child_classes_by_fluent_name = {}
+
+
+def _get_cls_by_fluent_path(root_cls, comps: list[str]):
+    """Get the settings class at a Fluent path, or None if it is not found."""
+    cls = root_cls
+    for comp in comps:
+        if issubclass(cls, (NamedObject, ListObject)):
+            cls = cls.child_object_type
+            continue
+        lazy_child_classes = getattr(cls, "_child_classes", None)
+        if isinstance(lazy_child_classes, _LazyChildClasses):
+            # Only the module of the child class is imported.
+            cls = lazy_child_classes.get_by_fluent_name(comp)
+            if cls is None:
+                return None
+            continue
+        child_classes = _child_classes_by_fluent_name.get(cls)
+        if child_classes is None:
+            child_classes = _child_classes_by_fluent_name[cls] = {
+                child_cls.fluent_name: child_cls
+                for child_cls in getattr(cls, "_child_classes", {}).values()
+            }
+        cls = child_classes.get(comp)
+        if cls is None:
+            return None
+    return cls
+
+
+class _DeferringProxy:
+    """Proxy which defers and coalesces the ``set_var`` calls.
+
+    Each write is lifted to the highest ancestor path reachable through groups and
+    named objects, where a partial dictionary state only changes the given children,
+    and merged with the other writes lifted to the same path. On ``flush``, each
+    merged write is applied with a single ``set_var`` call at the common ancestor of
+    its writes. The other writes flush the deferred writes before being forwarded to
+    the wrapped proxy, as the reads are.
+
+    Parameters
+    ----------
+    flproxy
+        Object that interfaces with the Fluent backend.
+    root_cls
+        Class of the settings root.
+    """
+
+    _writes = frozenset(
+        [
+            "rename",
+            "create",
+            "delete",
+            "resize_list_object",
+            "execute_cmd",
+        ]
+    )
+
+    def __init__(self, flproxy, root_cls):
+        """__init__ of _DeferringProxy class."""
+        self._flproxy = flproxy
+        self._root_cls = root_cls
+        # [depth, value, [(path, value), ...]] by the path the writes are lifted to
+        self._deferred = {}
+        self.active = True
+
+    def _is_merge_parent(self, comps: list[str]) -> bool:
+        if not comps or any(c in comp for comp in comps for c in "*?["):
+            return False
+        cls = _get_cls_by_fluent_path(self._root_cls, comps)
+        return (
+            cls is not None
+            and issubclass(cls, (Group, NamedObject))
+            and not issubclass(cls, ListObject)
+        )
+
+    def set_var(self, path: str, value) -> None:
+        """Defer setting the value for the given path."""
+        if not self.active:
+            return self._flproxy.set_var(path, value)
+        value = copy.deepcopy(value)
+        comps = path.split("/") if path else []
+        depth = len(comps)
+        while depth > 1 and self._is_merge_parent(comps[: depth - 1]):
+            depth -= 1
+        lifted_value = value
+        for comp in reversed(comps[depth:]):
+            lifted_value = {comp: lifted_value}
+        key = tuple(comps[:depth])
+        deferred = self._deferred.get(key)
+        if deferred is None:
+            self._deferred[key] = [len(comps), lifted_value, [(path, value)]]
+        else:
+            deferred[0] = min(deferred[0], len(comps))
+            deferred[1] = _deep_merge(deferred[1], lifted_value)
+            deferred[2].append((path, value))
+
+    def flush(self) -> None:
+        """Apply the deferred writes.
+
+        Raises
+        ------
+        DeferredWriteError
+            If some writes fail. When a merged write fails, its writes are applied
+            one by one to find the failed paths.
+        """
+        deferred, self._deferred = self._deferred, {}
+        errors = {}
+        for key, (depth, value, writes) in deferred.items():
+            comps = list(key)
+            while len(comps) < depth and isinstance(value, dict) and len(value) == 1:
+                ((comp, value),) = value.items()
+                comps.append(comp)
+            try:
+                self._flproxy.set_var("/".join(comps), value)
+            except Exception as ex:
+                if len(writes) == 1:
+                    errors[writes[0][0]] = ex
+                    continue
+                for path, write_value in writes:
+                    try:
+                        self._flproxy.set_var(path, write_value)
+                    except Exception as ex:
+                        errors[path] = ex
+        if errors:
+            raise DeferredWriteError(errors)
+
+    def close(self) -> None:
+        """Discard the deferred writes and forward all the calls from now on."""
+        self._deferred.clear()
+        self.active = False
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._flproxy, name)
+        if name not in self._writes:
+            return attr
+
+        def _write(*args, **kwds):
+            self.flush()
+            return attr(*args, **kwds)
+
+        return _write
+
+    def __eq__(self, other):
+        if isinstance(other, (_DeferringProxy, _PrefetchingProxy)):
+            other = other._flproxy
+        return self._flproxy == other
+
+
 class Base:
     """Provides the base class for settings and command objects.
 
@@ -337,6 +685,92 @@ class Base:
         """Get the requested attributes for the object."""
         return self.flproxy.get_attrs(self.path, attrs, recursive)
 
+    @contextmanager
+    def prefetch(self, *objects, attrs: list[str] | None = None):
+        """Read the state of settings objects in a single round trip.
+
+        Within the ``with`` block, the state of the given objects, and of their
+        descendants, is fetched together at the first read and then served locally.
+        More objects can be added to the returned ``Prefetch`` object, they are fetched
+        together at the next read. Any change of the settings discards the fetched
+        values.
+
+        Parameters
+        ----------
+        *objects
+            Settings objects to prefetch, by default this object.
+        attrs : list[str], optional
+            Attributes to prefetch instead of the state of the objects.
+
+        Examples
+        --------
+        >>> bcs = solver.settings.setup.boundary_conditions
+        >>> with bcs.velocity_inlet.prefetch():
+        >>>     velocities = {
+        >>>         name: inlet.momentum.velocity_magnitude.value()
+        >>>         for name, inlet in bcs.velocity_inlet.items()
+        >>>     }
+        """
+        root = self._root
+        flproxy = root._flproxy
+        if isinstance(flproxy, _PrefetchingProxy):
+            prefetch = _Prefetch(flproxy)
+            prefetch.add(*(objects or (self,)), attrs=attrs)
+            yield prefetch
+            return
+        prefetching_proxy = _PrefetchingProxy(flproxy)
+        prefetch = _Prefetch(prefetching_proxy)
+        prefetch.add(*(objects or (self,)), attrs=attrs)
+        root._setattr("_flproxy", prefetching_proxy)
+        try:
+            yield prefetch
+        finally:
+            root._setattr("_flproxy", flproxy)
+            prefetching_proxy.close()
+
+    @contextmanager
+    def deferred(self):
+        """Defer the changes of the settings to the end of the ``with`` block.
+
+        Within the ``with`` block, the state set through the objects of this settings
+        root is collected and merged into as few ``set_var`` calls as possible, each
+        one at the common ancestor of the merged paths, which are applied at the end of
+        the block. Reads return the state of Fluent, without the deferred changes.
+        Commands, and the creation, renaming and deletion of objects, apply the
+        deferred changes first. If the block raises an exception, the deferred changes
+        are discarded.
+
+        Raises
+        ------
+        DeferredWriteError
+            If some of the deferred changes fail to be applied.
+
+        Examples
+        --------
+        >>> with solver.settings.deferred():
+        >>>     for inlet in solver.settings.setup.boundary_conditions.velocity_inlet.values():
+        >>>         inlet.momentum.velocity_magnitude.value = 2.0
+        >>>         inlet.turbulence.turbulent_intensity = 0.02
+        """
+        root = self._root
+        flproxy = root._flproxy
+        if isinstance(flproxy, _DeferringProxy):
+            yield
+            return
+        deferring_proxy = _DeferringProxy(flproxy, root.__class__)
+        root._setattr("_flproxy", deferring_proxy)
+        try:
+            yield
+        except BaseException:
+            root._setattr("_flproxy", flproxy)
+            deferring_proxy.close()
+            raise
+        root._setattr("_flproxy", flproxy)
+        try:
+            deferring_proxy.flush()
+        finally:
+            deferring_proxy.close()
+
     def get_attr(
         self,
         attr: str,
@@ -474,6 +908,142 @@ class Base:
         return self.flproxy == other.flproxy and self.path == other.path
 
 
+class _Prefetch:
+    """Settings objects prefetched within a ``prefetch`` block."""
+
+    def __init__(self, flproxy: _PrefetchingProxy):
+        """__init__ of _Prefetch class."""
+        self._flproxy = flproxy
+
+    def add(self, *objects, attrs: list[str] | None = None) -> None:
+        """Add settings objects to fetch at the next read.
+
+        Parameters
+        ----------
+        *objects
+            Settings objects to prefetch.
+        attrs : list[str], optional
+            Attributes to prefetch instead of the state of the objects.
+        """
+        for obj in objects:
+            self._flproxy.add(obj.path, attrs)
+
+
+def _get_member_paths(cls, path: str, value):
+    """Get the paths of the members of the named and list objects within a state."""
+    if issubclass(cls, (NamedObject, ListObject)):
+        if isinstance(value, dict):
+            members = value.items()
+        elif isinstance(value, list):
+            members = enumerate(value)
+        else:
+            return
+        for name, member_value in members:
+            member_path = f"{path}/{name}" if path else str(name)
+            yield member_path
+            yield from _get_member_paths(
+                cls.child_object_type, member_path, member_value
+            )
+    elif issubclass(cls, Group) and isinstance(value, dict):
+        for child in cls.child_names:
+            child_cls = cls._child_classes[child]
+            if child_cls.fluent_name in value:
+                yield from _get_member_paths(
+                    child_cls,
+                    (
+                        f"{path}/{child_cls.fluent_name}"
+                        if path
+                        else child_cls.fluent_name
+                    ),
+                    value[child_cls.fluent_name],
+                )
+
+
+class SettingsSnapshot:
+    """Local read-only mirror of the state of a settings object.
+
+    It is returned by ``SettingsBase.snapshot()``. The mirror is fetched when the
+    ``with`` block is entered and discarded at its end.
+    """
+
+    def __init__(self, obj: Base, recursive: bool, attrs: list[str]):
+        """__init__ of SettingsSnapshot class."""
+        self._obj = obj
+        self._recursive = recursive
+        self._attrs = attrs
+        self._flproxy = None
+        self._owned = False
+        self._valid = False
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the objects still read from the mirror."""
+        return self._valid
+
+    def invalidate(self) -> None:
+        """Discard the mirror, the objects read from Fluent again."""
+        if self._valid:
+            self._flproxy.clear()
+
+    def _mirror(self) -> None:
+        obj, attrs, recursive = self._obj, self._attrs, self._recursive
+        root = obj._root
+        flproxy = root._flproxy
+        value = flproxy.get_var(obj.path)
+        attrs_value = None
+        member_paths = []
+        if attrs:
+            attrs_value = flproxy.get_attrs(obj.path, attrs, recursive)
+            if recursive:
+                member_paths = list(_get_member_paths(obj.__class__, obj.path, value))
+            else:
+                attrs_value = {"attrs": attrs_value}
+        self._owned = not isinstance(flproxy, _PrefetchingProxy)
+        if self._owned:
+            flproxy = _PrefetchingProxy(flproxy)
+            root._setattr("_flproxy", flproxy)
+        flproxy.add_snapshot(obj.path, value, attrs_value)
+        if member_paths:
+            # The recursive attributes of a group do not include the members of its
+            # named and list objects.
+            for path, member_attrs in zip(
+                member_paths,
+                flproxy.get_attrs_many(member_paths, attrs, recursive=True),
+            ):
+                flproxy.add_snapshot_attrs(path, member_attrs or {})
+        self._flproxy = flproxy
+        self._valid = True
+        flproxy.on_clear(self._on_clear)
+
+    def _on_clear(self) -> None:
+        self._valid = False
+        if self._owned:
+            root = self._obj._root
+            if root._flproxy is self._flproxy:
+                root._setattr("_flproxy", self._flproxy._flproxy)
+            self._flproxy.close()
+
+    def __enter__(self) -> SettingsSnapshot:
+        self._mirror()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb) -> None:
+        self.invalidate()
+
+
+def _clear_local_state(root: Base) -> None:
+    """Discard the state of a settings root which is mirrored or prefetched locally.
+
+    This is called when the settings are changed by Fluent, for example, when a case
+    file is read.
+    """
+    flproxy = root._flproxy
+    while flproxy is not None:
+        if isinstance(flproxy, _PrefetchingProxy):
+            flproxy.clear()
+        flproxy = getattr(flproxy, "_flproxy", None)
+
+
 StateT = TypeVar("StateT")
 
 
@@ -679,6 +1249,101 @@ def _create_child(cls, name, parent: weakref.CallableProxyType, alias_path=None)
     return cls(name, parent)
 
 
+class _ChildDescriptor:
+    """Creates the child object of a group on first access."""
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        cls = type(obj)._child_classes[self._name]
+        return obj.__dict__.setdefault(self._name, _create_child(cls, None, obj))
+
+
+def _install_child_descriptors(cls):
+    """Install the child object descriptors of a group class once."""
+    if "_child_descriptors_installed" in cls.__dict__:
+        return
+    for name in cls.child_names + cls.command_names + cls.query_names:
+        if name not in cls.__dict__:
+            setattr(cls, name, _ChildDescriptor(name))
+    cls._child_descriptors_installed = True
+
+
+class _LazyChildClasses(collections.abc.Mapping):
+    """Child classes of a settings class which are imported on first access.
+
+    The generated settings classes can be written as one module per child
+    of the root class. The modules are imported only when the corresponding
+    child class is looked up.
+
+    Parameters
+    ----------
+    module_dir: os.PathLike
+        Directory containing the child class modules.
+    module_prefix: str
+        Prefix of the names under which the modules are registered.
+    names: list[str]
+        Names of the child classes. The module of each child class is named
+        after it and defines the class as ``shard_root``.
+    names_by_fluent_name: dict[str, str], optional
+        Names of the child classes by their Fluent names, to look up a child class
+        by Fluent name without importing the other modules.
+    """
+
+    def __init__(
+        self,
+        module_dir: os.PathLike,
+        module_prefix: str,
+        names: list[str],
+        names_by_fluent_name: dict[str, str] | None = None,
+    ):
+        self._module_dir = module_dir
+        self._module_prefix = module_prefix
+        self._names = list(names)
+        self._names_by_fluent_name = names_by_fluent_name
+        self._classes = {}
+        self._lock = threading.Lock()
+
+    def get_by_fluent_name(self, fluent_name: str):
+        """Get the child class with a Fluent name, or None if there is none."""
+        if self._names_by_fluent_name is None:
+            # Shards generated without the index
+            return next(
+                (cls for cls in self.values() if cls.fluent_name == fluent_name), None
+            )
+        name = self._names_by_fluent_name.get(fluent_name)
+        return None if name is None else self[name]
+
+    def __getitem__(self, name: str):
+        try:
+            return self._classes[name]
+        except KeyError:
+            if name not in self._names:
+                raise
+        from ansys.fluent.core import utils
+
+        with self._lock:
+            if name not in self._classes:
+                module = utils.load_module(
+                    f"{self._module_prefix}.{name}",
+                    os.path.join(self._module_dir, f"{name}.py"),
+                )
+                self._classes[name] = module.shard_root
+        return self._classes[name]
+
+    def __contains__(self, name) -> bool:
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
 class SettingsBase(Base, Generic[StateT]):
     """Base class for settings objects.
 
@@ -717,6 +1382,47 @@ class SettingsBase(Base, Generic[StateT]):
         """Get the state of the object."""
         return self.to_python_keys(self.flproxy.get_var(self.path))
 
+    def snapshot(
+        self, recursive: bool = True, attrs: list[str] | None = None
+    ) -> SettingsSnapshot:
+        """Mirror the state and attributes of the object locally within a ``with``
+        block.
+
+        When the block is entered, the state of the object is fetched with one
+        ``get_var`` call and the attributes of the object, and of its descendants if
+        ``recursive``, with one ``get_attrs`` call. The object and its descendants then
+        read their state, attributes, object names and list sizes from this local
+        read-only mirror until the end of the block, unless it is invalidated before,
+        either explicitly, by any change of the settings made through the same root
+        object, or when a case or data file is read, the solution is initialized or the
+        settings are cleared. Changes made in Fluent otherwise, for example, through
+        the TUI, are not seen within the block.
+
+        Parameters
+        ----------
+        recursive : bool, optional
+            Whether to mirror the attributes of the descendants. The default is
+            ``True``.
+        attrs : list[str], optional
+            Attributes to mirror. The default is the attributes which are queried
+            while accessing the child objects, i.e. ``"active?"`` and
+            ``"webui-release-active?"``.
+
+        Returns
+        -------
+        SettingsSnapshot
+            Snapshot, to be used as a context manager.
+
+        Examples
+        --------
+        >>> walls = solver.settings.setup.boundary_conditions.wall
+        >>> with walls.snapshot():
+        >>>     report = {name: wall.thermal.thermal_condition() for name, wall in walls.items()}
+        """
+        if attrs is None:
+            attrs = [_InlineConstants.is_active, _InlineConstants.is_stable]
+        return SettingsSnapshot(self, recursive, attrs)
+
     def set_state(self, state: StateT | None = None, **kwargs):
         """Set the state of the object."""
         with self._while_setting_state():
@@ -939,15 +1645,8 @@ class Group(SettingsBase[DictStateType]):
     def __init__(self, name: str | None = None, parent=None):
         """__init__ of Group class."""
         super().__init__(name, parent)
-        for child in self.child_names:
-            cls = self.__class__._child_classes[child]
-            self._setattr(child, _create_child(cls, None, self))
-        for cmd in self.command_names:
-            cls = self.__class__._child_classes[cmd]
-            self._setattr(cmd, _create_child(cls, None, self))
-        for query in self.query_names:
-            cls = self.__class__._child_classes[query]
-            self._setattr(query, _create_child(cls, None, self))
+        # The child objects are created on first access.
+        _install_child_descriptors(self.__class__)
 
     def __call__(self, *args, **kwargs):
         if kwargs:
@@ -2131,12 +2830,123 @@ def _gethash(obj_info):
     return dhash.hexdigest()
 
 
+# Root classes built from the static info, keyed by the version and the static info
+# checksum. They are shared by the sessions connected to the same Fluent build.
+_root_cls_by_hash = {}
+
+
+def _get_static_info_cache_file(version: str, build_id: str):
+    from ansys.fluent.core.utils import get_user_data_dir
+
+    key = f"{version}_{build_id}_{pyfluent.__version__}"
+    key = "".join(c if c.isalnum() or c in "-." else "_" for c in key)
+    return get_user_data_dir() / "settings_static_info" / f"settings_{key}.pickle"
+
+
+def _read_static_info_cache(cache_file, key: tuple) -> tuple[str, bytes] | None:
+    # The file is only a cache of the static info RPC result. It is used if it was
+    # written for the same Fluent version and build and the same PyFluent version.
+    # The checksum only detects a truncated or corrupted file, it does not tell
+    # whether the cached static info is up to date.
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, checksum, static_info_bytes = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as ex:
+        settings_logger.warning(f"Unable to read {cache_file}: {ex}")
+        return None
+    if cached_key != key:
+        settings_logger.warning(f"Ignoring {cache_file} written for {cached_key}.")
+        return None
+    if hashlib.sha256(static_info_bytes).hexdigest() != checksum:
+        settings_logger.warning(f"Ignoring {cache_file} as it is corrupted.")
+        return None
+    return checksum, static_info_bytes
+
+
+def _write_static_info_cache(
+    cache_file, key: tuple, checksum: str, static_info_bytes: bytes
+):
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump((key, checksum, static_info_bytes), f)
+        os.replace(tmp_file, cache_file)
+    except OSError as ex:
+        settings_logger.warning(f"Unable to write {cache_file}: {ex}")
+
+
+def _get_root_cls_from_static_info(
+    flproxy, version: str, get_build_id: Callable[[], str] | None
+):
+    """Get the root class from the static info, using the static info cache.
+
+    The static info is cached on disk per Fluent version and build and PyFluent
+    version, and the root class is cached in memory per static info checksum. A
+    cache hit skips the static info RPC, and the class construction if the root
+    class was already built in this process.
+    """
+    if get_build_id is None or not pyfluent.SETTINGS_USE_STATIC_INFO_CACHE:
+        return get_cls("", flproxy.get_static_info(), version=version)[0]
+    build_id = get_build_id()
+    key = (version, build_id, pyfluent.__version__)
+    cache_file = _get_static_info_cache_file(version, build_id)
+    cached = _read_static_info_cache(cache_file, key)
+    if cached:
+        settings_logger.info(f"Static info cache hit: {cache_file}")
+        checksum, static_info_bytes = cached
+    else:
+        settings_logger.info(f"Static info cache miss: {cache_file}")
+        static_info_bytes = pickle.dumps(flproxy.get_static_info())
+        checksum = hashlib.sha256(static_info_bytes).hexdigest()
+        _write_static_info_cache(cache_file, key, checksum, static_info_bytes)
+    root_cls = _root_cls_by_hash.get((version, checksum))
+    if root_cls is None:
+        root_cls, _ = get_cls("", pickle.loads(static_info_bytes), version=version)
+        _root_cls_by_hash[(version, checksum)] = root_cls
+    return root_cls
+
+
+def _read_settings_hash(path) -> str | None:
+    """Read the SHASH of a generated settings module without importing it."""
+    try:
+        with open(path, "r") as f:
+            for line in f:
+                if line.startswith("SHASH = "):
+                    return line.split("=", 1)[1].strip().strip('"')
+                if line.startswith("class "):
+                    break
+    except OSError:
+        pass
+    return None
+
+
+def _are_settings_shards_current(shards_index, settings_file) -> bool:
+    """Whether the settings shards were generated with the settings module.
+
+    The shards directory is not removed when the settings module is regenerated by
+    an older codegen, so the shards are only used if both have the same SHASH.
+    """
+    if not shards_index.exists():
+        return False
+    shards_hash = _read_settings_hash(shards_index)
+    if shards_hash is not None and shards_hash == _read_settings_hash(settings_file):
+        return True
+    settings_logger.warning(
+        f"Ignoring {shards_index.parent} as it does not match {settings_file}."
+    )
+    return False
+
+
 def get_root(
     flproxy,
     version: str = "",
     interrupt: Any | None = None,
     file_transfer_service: Any | None = None,
     scheme_eval=None,
+    get_build_id: Callable[[], str] | None = None,
 ) -> Group:
     """Get the root settings object.
 
@@ -2152,6 +2962,10 @@ def get_root(
         A gRPC service to execute Scheme code.
     version : str
         Fluent version.
+    get_build_id : Callable[[], str], optional
+        Function returning the Fluent build id. If the generated settings classes
+        are not available, it is called and the static info is cached on disk per
+        Fluent version and build id.
 
     Returns
     -------
@@ -2164,15 +2978,19 @@ def get_root(
     """
     from ansys.fluent.core import CODEGEN_OUTDIR, utils
 
+    settings_file = CODEGEN_OUTDIR / "solver" / f"settings_{version}.py"
+    shards_index = (
+        CODEGEN_OUTDIR / "solver" / f"settings_{version}_shards" / "__init__.py"
+    )
     try:
-        settings = utils.load_module(
-            f"settings_{version}",
-            CODEGEN_OUTDIR / "solver" / f"settings_{version}.py",
-        )
+        if _are_settings_shards_current(shards_index, settings_file):
+            # The child classes of the root class are imported on first access.
+            settings = utils.load_module(f"settings_{version}_shards", shards_index)
+        else:
+            settings = utils.load_module(f"settings_{version}", settings_file)
         root_cls = settings.root
     except FileNotFoundError:
-        obj_info = flproxy.get_static_info()
-        root_cls, _ = get_cls("", obj_info, version=version)
+        root_cls = _get_root_cls_from_static_info(flproxy, version, get_build_id)
     root = root_cls()
     root.set_flproxy(flproxy)
     root._set_on_interrupt(interrupt)
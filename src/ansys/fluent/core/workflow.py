@@ -8,6 +8,7 @@ import threading
 from typing import Any, Iterable, Iterator, Tuple
 import warnings
 
+from ansys.fluent.core.data_model_cache import NameKey
 from ansys.fluent.core.services.datamodel_se import (
     PyCallableStateObject,
     PyCommand,
@@ -1318,6 +1319,7 @@ class Workflow:
                 _refresh_count=0,
                 _ordered_children=[],
                 _task_list=[],
+                _task_list_version=None,
                 _getattr_recurse_depth=0,
                 _main_thread_ident=None,
                 _task_objects={},
@@ -1404,7 +1406,8 @@ class Workflow:
         The ordered children of the workflow are A, B, E, while B has ordered children C
         and D.
         """
-        if recompute:
+        if recompute and self._task_list_may_have_changed():
+            task_list_version = self._get_task_list_version()
             workflow_state, task_list = self._workflow_and_task_list_state()
 
             def task_by_id(mappings):
@@ -1426,8 +1429,37 @@ class Workflow:
                     filter(None, map(task_by_id(mappings), task_list))
                 )
                 self._task_list = task_list
+            self._task_list_version = task_list_version
         return self._ordered_children
 
+    def _get_task_list_version(self) -> int | None:
+        """Get the version of the cached workflow state, if it is cached."""
+        cache = self._workflow.service.cache
+        if cache is None:
+            return None
+        version = cache.get_version(self._workflow.rules)
+        if cache.is_unassigned(cache.get_state(self._workflow.rules, self._workflow)):
+            return None
+        return version
+
+    def _task_list_may_have_changed(self) -> bool:
+        """Check whether tasks may have been added, deleted or renamed since the task
+        list was computed."""
+        if self._task_list_version is None:
+            return True
+        changes = self._workflow.service.cache.changes_since(
+            self._workflow.rules, self._task_list_version
+        )
+        if changes is None:
+            return True
+        for path in changes:
+            key, _, sub_path = path.partition("/")
+            if not key or (
+                key.startswith("TaskObject:") and sub_path in ("", "_name_")
+            ):
+                return True
+        return False
+
     @staticmethod
     def inactive_tasks() -> list:
         """Get the inactive ordered task list held by this task.
@@ -1487,6 +1519,15 @@ class Workflow:
         return self._workflow()
 
     def _workflow_state(self):
+        # The workflow state is only read here, so the read-only cached state is
+        # used as is instead of the mutable copy returned by get_state.
+        cache = self._workflow.service.cache
+        if cache is not None:
+            workflow_state = cache.get_state(
+                self._workflow.rules, self._workflow, NameKey.DISPLAY
+            )
+            if not cache.is_unassigned(workflow_state):
+                return workflow_state
         return self._workflow()
 
     def _workflow_and_task_list_state(self) -> Tuple[dict, dict]:
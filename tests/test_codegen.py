@@ -2,7 +2,9 @@ import ast
 import importlib
 from pathlib import Path
 import pickle
+import re
 import shutil
+import sys
 import tempfile
 
 import pytest
@@ -10,6 +12,7 @@ import pytest
 import ansys.fluent.core as pyfluent
 from ansys.fluent.core.codegen import StaticInfoType, allapigen
 from ansys.fluent.core.search import get_api_tree_file_name
+from ansys.fluent.core.solver import flobject
 from ansys.fluent.core.utils.fluent_version import get_version_for_file_name
 
 
@@ -645,10 +648,22 @@ def test_codegen_with_settings_static_info(monkeypatch):
         "solver",
     }
     solver_paths = list((codegen_outdir / "solver").iterdir())
-    assert len(solver_paths) == 2
+    assert len(solver_paths) == 3
     assert set(p.name for p in solver_paths) == {
         f"settings_{version}.py",
         f"settings_{version}.pyi",
+        f"settings_{version}_shards",
+    }
+    shard_paths = list(
+        (codegen_outdir / "solver" / f"settings_{version}_shards").iterdir()
+    )
+    assert set(p.name for p in shard_paths) == {
+        "__init__.py",
+        "G1.py",
+        "P1.py",
+        "N1.py",
+        "C1.py",
+        "Q1.py",
     }
     with open(codegen_outdir / "solver" / f"settings_{version}.py", "r") as f:
         assert f.read().strip() == _expected_settings_api_output
@@ -781,3 +796,61 @@ def test_codegen_with_settings_static_info_edge_cases(
         # The order of classes is important.
         assert class_names_from_file == class_names
     shutil.rmtree(str(codegen_outdir))
+
+
+def test_codegen_settings_shards_are_loaded_lazily(monkeypatch):
+    codegen_outdir = Path(tempfile.mkdtemp())
+    monkeypatch.setattr(pyfluent, "CODEGEN_OUTDIR", codegen_outdir)
+    version = "251"
+    static_infos = {}
+    static_infos[StaticInfoType.SETTINGS] = _settings_static_info
+    allapigen.generate(version, static_infos)
+    # Bypass the active checks of the child objects as there is no server.
+    get_child = flobject.SettingsBase.__getattribute__
+
+    def get_build_id():
+        raise AssertionError("The build id is only needed without generated classes.")
+
+    root = flobject.get_root(flproxy=None, version=version, get_build_id=get_build_id)
+    assert "settings_251_shards" in sys.modules
+    assert "settings_251_shards.G1" not in sys.modules
+    assert root.child_names == ["G1", "P1", "N1"]
+    assert "G1" in root._child_classes
+    assert "settings_251_shards.G1" not in sys.modules
+    p2_cls = flobject._get_cls_by_fluent_path(type(root), ["G1", "P2"])
+    assert p2_cls.fluent_name == "P2"
+    assert [name for name in sys.modules if name.startswith("settings_251_")] == [
+        "settings_251_shards",
+        "settings_251_shards.G1",
+    ]
+    g1 = get_child(root, "G1")
+    assert "settings_251_shards.N1" not in sys.modules
+    assert g1.path == "G1"
+    assert g1.child_names == ["G2", "P2"]
+    assert get_child(get_child(g1, "G2"), "P3").path == "G1/G2/P3"
+    assert get_child(root, "G1") is g1
+    for name in list(sys.modules):
+        if name.startswith("settings_251"):
+            del sys.modules[name]
+    shutil.rmtree(str(codegen_outdir))
+
+
+def test_codegen_stale_settings_shards_are_ignored(monkeypatch):
+    codegen_outdir = Path(tempfile.mkdtemp())
+    monkeypatch.setattr(pyfluent, "CODEGEN_OUTDIR", codegen_outdir)
+    version = "251"
+    static_infos = {}
+    static_infos[StaticInfoType.SETTINGS] = _settings_static_info
+    allapigen.generate(version, static_infos)
+    settings_file = codegen_outdir / "solver" / f"settings_{version}.py"
+    settings_src = settings_file.read_text()
+    settings_src = re.sub(r'SHASH = ".*"', 'SHASH = "regenerated"', settings_src)
+    settings_file.write_text(settings_src)
+    root = flobject.get_root(flproxy=None, version=version)
+    assert "settings_251" in sys.modules
+    assert "settings_251_shards" not in sys.modules
+    assert root.child_names == ["G1", "P1", "N1"]
+    for name in list(sys.modules):
+        if name.startswith("settings_251"):
+            del sys.modules[name]
+    shutil.rmtree(str(codegen_outdir))
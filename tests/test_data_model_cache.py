@@ -1,9 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+
 import pytest
 
 from ansys.api.fluent.v0.variant_pb2 import Variant
 import ansys.fluent.core as pyfluent
-from ansys.fluent.core.data_model_cache import DataModelCache, NameKey
-from ansys.fluent.core.services.datamodel_se import _convert_value_to_variant
+from ansys.fluent.core import utils
+from ansys.fluent.core.data_model_cache import (
+    DataModelCache,
+    NameKey,
+    _is_dict_parameter_type,
+)
+from ansys.fluent.core.services.datamodel_se import (
+    PyStateContainer,
+    _convert_value_to_variant,
+)
+from ansys.fluent.core.utils.fluent_version import FluentVersion
+from ansys.fluent.core.workflow import Workflow
 
 
 class Fake:
@@ -402,6 +414,20 @@ def test_cache_get_state(rules_cache, name_key_in_config, path, name_key, state)
                 }
             },
         ),
+        (
+            {"A": {}},
+            NameKey.DISPLAY,
+            "A/B:b1/E",
+            1,
+            {"A": {"B:b1": {"E": 1}}},
+        ),
+        (
+            {"A": {}},
+            NameKey.INTERNAL,
+            "A",
+            {"B:b1": 1},
+            {"A": {"B:b1": 1}},
+        ),
     ],
 )
 def test_cache_set_state(
@@ -432,3 +458,287 @@ def test_cache_per_session():
         _ = m1.watertight()
         assert not m1.meshing.GlobalSettings.EnableComplexMeshing()
         assert m2.meshing.GlobalSettings.EnableComplexMeshing()
+
+
+@pytest.mark.parametrize("name_key", [NameKey.INTERNAL, NameKey.DISPLAY])
+def test_cache_named_object_lookups_follow_updates(name_key):
+    cache = DataModelCache()
+    rules = "x"
+    cache.set_config(rules, "name_key", name_key)
+
+    def update(state, deleted_paths=()):
+        var = Variant()
+        _convert_value_to_variant(state, var)
+        cache.update_cache(rules, var, list(deleted_paths))
+
+    update(
+        {
+            "A": {
+                f"B:B{i}": {"_name_": f"B-{i}", "__iname__": f"B{i}", "C": i}
+                for i in range(100)
+            }
+        }
+    )
+    assert cache.get_state(rules, Fake("A/B:B-42"), NameKey.DISPLAY)["C"] == 42
+    assert cache.get_state(rules, Fake("A/B:B42"), NameKey.INTERNAL)["C"] == 42
+
+    if name_key == NameKey.INTERNAL:
+        # rename
+        update({"A": {"B:B42": {"_name_": "B-renamed"}}})
+        state = cache.get_state(rules, Fake("A/B:B-renamed"), NameKey.DISPLAY)
+        assert state["C"] == 42
+        assert DataModelCache.Empty == cache.get_state(
+            rules, Fake("A/B:B-42"), NameKey.DISPLAY
+        )
+
+    # delete and recreate
+    update({}, ["A/B:B7"])
+    assert DataModelCache.Empty == cache.get_state(
+        rules, Fake("A/B:B7"), NameKey.INTERNAL
+    )
+    update({"A": {"B:B7": {"_name_": "B-7", "C": 70}}})
+    assert cache.get_state(rules, Fake("A/B:B7"), NameKey.INTERNAL)["C"] == 70
+    assert cache.get_state(rules, Fake("A/B:B-7"), NameKey.DISPLAY)["C"] == 70
+
+    # set_state through the other name
+    other_name = "B-8" if name_key == NameKey.INTERNAL else "B8"
+    cache.set_state(rules, Fake(f"A/B:{other_name}/C"), 80)
+    assert cache.get_state(rules, Fake("A/B:B8"), NameKey.INTERNAL)["C"] == 80
+
+    # the cache is replaced
+    state = {"_name_": "N", "__iname__": "I"}
+    cache.rules_str_to_cache[rules] = {"A": {"B:K": state}}
+    other_name = "N" if name_key == NameKey.INTERNAL else "I"
+    assert state == cache.get_state(rules, Fake(f"A/B:{other_name}"), ~name_key)
+
+
+def test_cache_get_state_returns_shared_snapshot():
+    cache = DataModelCache()
+    rules = "x"
+    cache.set_config(rules, "name_key", NameKey.INTERNAL)
+    cache.set_state(
+        rules,
+        Fake("A"),
+        {"B:B1": {"_name_": "B-1", "C": [1, 2]}, "B:B2": {"_name_": "B-2", "C": [3]}},
+    )
+
+    state = cache.get_state(rules, Fake("A"))
+    assert state is cache.get_state(rules, Fake("A"))
+    with pytest.raises(TypeError):
+        state["D"] = 1
+    with pytest.raises(TypeError):
+        state["B:B1"]["C"].append(3)
+
+    display_state = cache.get_state(rules, Fake("A"), NameKey.DISPLAY)
+    assert display_state == {
+        "B:B-1": {"_name_": "B-1", "__iname__": "B1", "C": [1, 2]},
+        "B:B-2": {"_name_": "B-2", "__iname__": "B2", "C": [3]},
+    }
+    assert display_state is cache.get_state(rules, Fake("A"), NameKey.DISPLAY)
+
+    cache.set_state(rules, Fake("A/B:B1/C"), [4])
+    new_state = cache.get_state(rules, Fake("A"))
+    assert state["B:B1"]["C"] == [1, 2]
+    assert new_state["B:B1"]["C"] == [4]
+    assert new_state["B:B2"] is state["B:B2"]
+    new_display_state = cache.get_state(rules, Fake("A"), NameKey.DISPLAY)
+    assert new_display_state["B:B-1"]["C"] == [4]
+    assert new_display_state["B:B-2"] is display_state["B:B-2"]
+
+    copied_state = cache.get_state(rules, Fake("A"), deep_copy=True)
+    assert type(copied_state) is dict and type(copied_state["B:B1"]["C"]) is list
+    copied_state["B:B1"]["C"].append(5)
+    assert cache.get_state(rules, Fake("A/B:B1/C")) == [4]
+
+
+def test_state_container_returns_mutable_state():
+    class FakeService:
+        cache = DataModelCache()
+
+    rules = "x"
+    FakeService.cache.set_config(rules, "name_key", NameKey.DISPLAY)
+    FakeService.cache.set_state(rules, Fake("A"), {"B": {"C": [1, 2]}})
+    container = PyStateContainer(FakeService(), rules, [("A", "")])
+    state = container.get_state()
+    assert state == {"B": {"C": [1, 2]}}
+    state["B"]["C"].append(3)
+    state["D"] = 1
+    assert container.get_state() == {"B": {"C": [1, 2]}}
+
+
+def test_workflow_reads_cached_state_without_copy():
+    class FakeService:
+        cache = DataModelCache()
+
+    rules = "workflow"
+    FakeService.cache.set_config(rules, "name_key", NameKey.DISPLAY)
+    FakeService.cache.set_state(
+        rules, Fake([]), {"TaskObject:TaskObject1": {"_name_": "Import Geometry"}}
+    )
+    workflow = Workflow.__new__(Workflow)
+    workflow.__dict__["_workflow"] = PyStateContainer(FakeService(), rules, [])
+    workflow_state, task_list = workflow._workflow_and_task_list_state()
+    assert task_list == ["Import Geometry"]
+    assert workflow_state == workflow._workflow()
+    # the read-only cached state is returned, not a mutable copy
+    with pytest.raises(TypeError):
+        workflow_state["TaskObject:TaskObject2"] = {}
+
+
+def test_cache_locks_by_top_level_type():
+    cache = DataModelCache()
+    cache.collect_lock_statistics = True
+    rules = "x"
+    cache.set_state(rules, Fake("A/B"), 1)
+    cache.set_state(rules, Fake("C/D"), 2)
+
+    with ThreadPoolExecutor() as executor:
+        with cache._with_lock(rules, ["A"], write=True):
+            # readers of other types are not blocked by the writer
+            future = executor.submit(cache.get_state, rules, Fake("C/D"))
+            assert future.result(timeout=10) == 2
+            future = executor.submit(cache.get_state, rules, Fake("A/B"))
+            assert not wait([future], timeout=0.2).done
+            whole_state_future = executor.submit(cache.get_state, rules, Fake([]))
+            assert not wait([whole_state_future], timeout=0.1).done
+            # writers of other types are serialized, as they share the root index
+            writer_future = executor.submit(cache.set_state, rules, Fake("C/D"), 3)
+            assert not wait([writer_future], timeout=0.1).done
+        assert future.result(timeout=10) == 1
+        writer_future.result(timeout=10)
+        assert whole_state_future.result(timeout=10) in (
+            {"A": {"B": 1}, "C": {"D": 2}},
+            {"A": {"B": 1}, "C": {"D": 3}},
+        )
+        assert cache.get_state(rules, Fake("C/D")) == 3
+
+    statistics = cache.get_lock_statistics(rules)
+    assert statistics["A"]["write"].acquisitions == 2
+    assert statistics["A"]["read"].contended_acquisitions == 1
+    assert statistics["A"]["read"].max_wait_time >= 0.2
+    assert statistics["C"]["read"].contended_acquisitions == 0
+    assert statistics[""]["read"].contended_acquisitions == 1
+    cache.reset_lock_statistics(rules)
+    assert cache.get_lock_statistics(rules) == {}
+
+
+def test_cache_uncontended_read_locks():
+    cache = DataModelCache()
+    rules = "x"
+    cache.set_state(rules, Fake("A/B"), 1)
+    assert cache.get_state(rules, Fake("A/B")) == 1
+    locks = cache._get_locks(rules)
+    # the statistics are not collected by default
+    assert cache.get_lock_statistics(rules) == {}
+    # an uncontended reader only locks the whole state
+    assert "A" not in locks.stripes or not any(locks.stripe("A")._held.values())
+    with cache._with_lock(rules, ["A"], write=False):
+        assert locks.root._held["S"] == 1
+        assert not any(locks.stripe("A")._held.values())
+    with cache._with_lock(rules, ["C"], write=True):
+        # readers of other types are not blocked by the writer
+        with cache._with_lock(rules, ["A"], write=False):
+            assert locks.root._held["IS"] == 1
+            assert locks.stripe("A")._held["S"] == 1
+    assert not any(locks.root._held.values())
+
+
+def test_cache_versions_and_change_journal():
+    cache = DataModelCache()
+    rules = "x"
+    cache.set_config(rules, "name_key", NameKey.INTERNAL)
+
+    def update(state, deleted_paths=()):
+        var = Variant()
+        _convert_value_to_variant(state, var)
+        cache.update_cache(rules, var, list(deleted_paths))
+
+    update({f"B:B{i}": {"_name_": f"B-{i}", "C": {"D": i, "E": [i]}} for i in range(3)})
+    version, state = cache.get_state_if_changed(rules, Fake("B:B1"), None)
+    assert version == cache.get_version(rules)
+    assert state == {"_name_": "B-1", "C": {"D": 1, "E": [1]}}
+    assert cache.get_state_if_changed(rules, Fake("B:B1"), version) == (
+        version,
+        DataModelCache.Unchanged,
+    )
+
+    # unchanged values are not recorded
+    update({"B:B1": {"_name_": "B-1", "C": {"D": 1, "E": [1]}}})
+    assert cache.changes_since(rules, version) == []
+    assert cache.get_state_if_changed(rules, Fake("B:B1"), version)[1] is (
+        DataModelCache.Unchanged
+    )
+
+    update({"B:B2": {"C": {"D": 20}}}, ["B:B0"])
+    assert cache.changes_since(rules, version) == ["B:B0", "B:B2/C/D"]
+    assert cache.get_state_if_changed(rules, Fake("B:B1"), version)[1] is (
+        DataModelCache.Unchanged
+    )
+    new_version, state = cache.get_state_if_changed(rules, Fake("B:B2"), version)
+    assert new_version > version
+    assert state == {"_name_": "B-2", "C": {"D": 20, "E": [2]}}
+    assert cache.get_state_if_changed(rules, Fake("B:B2/C/E"), version)[1] is (
+        DataModelCache.Unchanged
+    )
+    assert cache.get_state_if_changed(rules, Fake("B:B2/C/D"), version)[1] == 20
+
+    cache.set_state(rules, Fake("B:B1/C/E"), [10])
+    assert cache.changes_since(rules, new_version) == ["B:B1/C/E"]
+    assert cache.get_state_if_changed(rules, Fake("B:B1"), new_version)[1] == {
+        "_name_": "B-1",
+        "C": {"D": 1, "E": [10]},
+    }
+
+    # the journal is bounded
+    cache = DataModelCache()
+    cache.journal_max_length = 2
+    version = cache.get_version(rules)
+    update({"A": 1})
+    assert cache.changes_since(rules, version) == ["A"]
+    update({"A": 2, "B": 3, "C": 4})
+    assert cache.changes_since(rules, version) is None
+
+
+def test_is_dict_parameter_type_loads_rules_once(tmp_path, monkeypatch):
+    version = FluentVersion.v252
+    rules = "dict_parameter_rules"
+    codegen_dir = tmp_path / f"datamodel_{version.number}"
+    codegen_dir.mkdir()
+    (codegen_dir / f"{rules}.py").write_text(
+        """
+from ansys.fluent.core.services.datamodel_se import (
+    PyDictionary,
+    PyMenu,
+    PyNamedObjectContainer,
+    PyTextual,
+)
+
+
+class Root(PyMenu):
+    class Task(PyNamedObjectContainer):
+        class _Task(PyMenu):
+            class Arguments(PyDictionary):
+                pass
+
+            class State(PyTextual):
+                pass
+"""
+    )
+    monkeypatch.setattr(pyfluent, "CODEGEN_OUTDIR", tmp_path)
+    load_count = 0
+    load_module = utils.load_module
+
+    def counting_load_module(*args):
+        nonlocal load_count
+        load_count += 1
+        return load_module(*args)
+
+    monkeypatch.setattr(utils, "load_module", counting_load_module)
+    for _ in range(2):
+        assert _is_dict_parameter_type(version, rules, "Task/Arguments")
+        assert not _is_dict_parameter_type(version, rules, "Task/Arguments/FileName")
+        assert not _is_dict_parameter_type(version, rules, "Task/State")
+        assert not _is_dict_parameter_type(version, rules, "Task/State/Value")
+        assert not _is_dict_parameter_type(version, rules, "Task")
+    assert load_count == 1
+    assert not _is_dict_parameter_type(version, "missing_rules", "Task")
@@ -1,16 +1,30 @@
+import asyncio
+import threading
+
 import numpy as np
 import pytest
 from test_utils import pytest_approx
 
-from ansys.fluent.core import examples
+from ansys.api.fluent.v0 import field_data_pb2 as FieldDataProtoModule
+from ansys.fluent.core import SolverEvent, examples
 from ansys.fluent.core.examples.downloads import download_file
 from ansys.fluent.core.exceptions import DisallowedValuesError
+from ansys.fluent.core.fluent_connection import ErrorState
+from ansys.fluent.core.services.async_field_data import AsyncFieldData
 from ansys.fluent.core.services.field_data import (
     CellElementType,
+    ChunkParser,
+    FieldData,
+    FieldDataCache,
+    FieldInfo,
     FieldUnavailable,
     SurfaceDataType,
     ZoneType,
+    _get_connectivity_csr,
+    _get_mesh,
+    _get_surface_ids,
 )
+from ansys.fluent.core.services.interceptors import AsyncErrorStateInterceptor
 
 HOT_INLET_TEMPERATURE = 313.15
 
@@ -200,6 +214,12 @@ def test_field_data_objects_3d(new_solver_session) -> None:
     assert abs_press_data["cold-inlet"].shape == (241,)
     assert abs_press_data["cold-inlet"][120] == 101325.0
 
+    scalar_fields_data = field_data.get_scalar_fields_data(
+        field_names=["absolute-pressure", "temperature"], surfaces=["cold-inlet"]
+    )
+    assert scalar_fields_data["cold-inlet"].shape == (241, 2)
+    assert scalar_fields_data["cold-inlet"][120][0] == 101325.0
+
     vertices_data = field_data.get_surface_data(
         data_types=[SurfaceDataType.Vertices], surfaces=["cold-inlet"]
     )
@@ -261,6 +281,16 @@ def test_field_data_objects_3d(new_solver_session) -> None:
         == [12, 13, 17, 16]
     ).all()
 
+    faces_connectivity_csr = field_data.get_surface_data(
+        data_types=[SurfaceDataType.FacesConnectivity],
+        surfaces=["cold-inlet"],
+        connectivity_format="csr",
+    )["cold-inlet"][SurfaceDataType.FacesConnectivity]
+    assert len(faces_connectivity_csr) == len(
+        faces_connectivity_data["cold-inlet"][SurfaceDataType.FacesConnectivity]
+    )
+    assert (faces_connectivity_csr[5] == [12, 13, 17, 16]).all()
+
     velocity_vector_data = field_data.get_vector_field_data(
         field_name="velocity", surfaces=["cold-inlet"]
     )
@@ -489,6 +519,8 @@ def test_mesh_data_2d_standard(disk_case_session):
     mesh = solver.fields.field_data.get_mesh(zone="fluid-7")
     assert len(mesh.nodes) == 6351
     assert len(mesh.elements) == 6192
+    assert mesh.node_coordinates.shape == (6351, 3)
+    assert len(mesh.element_ids) == 6192
     assert mesh.elements[0].element_type == CellElementType.QUADRILATERAL
     assert len(mesh.elements[0].node_indices) == 4
     assert min(mesh.nodes, key=lambda x: x.x).x == pytest_approx(0.0)
@@ -510,6 +542,8 @@ def test_mesh_data_3d_poly(static_mixer_case_session):
     mesh = solver.fields.field_data.get_mesh(zone="fluid")
     assert len(mesh.nodes) == 82247
     assert len(mesh.elements) == 22771
+    assert mesh.node_coordinates.shape == (82247, 3)
+    assert mesh.element_facet_offsets[1] == 9
     assert mesh.elements[0].element_type == CellElementType.POLYHEDRON
     assert len(mesh.elements[0].node_indices) == 0
     assert len(mesh.elements[0].facets) == 9
@@ -520,3 +554,511 @@ def test_mesh_data_3d_poly(static_mixer_case_session):
     assert max(mesh.nodes, key=lambda x: x.y).y == pytest_approx(3.000000e-03)
     assert min(mesh.nodes, key=lambda x: x.z).z == pytest_approx(-2.000000e-03)
     assert max(mesh.nodes, key=lambda x: x.z).z == pytest_approx(2.500000e-03)
+
+
+def _scalar_field_chunks(surface_id, field_name, values, chunk_size=3):
+    values = np.asarray(values, dtype=np.float64)
+    header = FieldDataProtoModule.GetFieldsResponse()
+    header.payloadInfo.surfaceId = surface_id
+    header.payloadInfo.fieldName = field_name
+    header.payloadInfo.fieldType = FieldDataProtoModule.FieldType.DOUBLE_ARRAY
+    header.payloadInfo.fieldSize = values.size
+    header.payloadInfo.fieldRequestInfo.scalarFieldRequest.scalarFieldName = field_name
+    chunks = [header]
+    for i in range(0, values.size, chunk_size):
+        chunks.append(
+            FieldDataProtoModule.GetFieldsResponse(
+                bytePayload=values[i : i + chunk_size].tobytes()
+            )
+        )
+    return chunks
+
+
+@pytest.mark.parametrize("contiguous", [False, True])
+def test_chunk_parser_assembles_repeated_payloads(contiguous):
+    chunks = (
+        _scalar_field_chunks(1, "temperature", [1.0, 2.0, 3.0, 4.0])
+        + _scalar_field_chunks(2, "temperature", [10.0, 20.0])
+        + _scalar_field_chunks(1, "temperature", [5.0, 6.0, 7.0, 8.0, 9.0])
+    )
+    fields = ChunkParser(contiguous=contiguous).extract_fields(iter(chunks))
+    scalar_field_data = next(iter(fields.values()))
+    assert np.array_equal(
+        scalar_field_data[1]["temperature"], np.arange(1.0, 10.0, dtype=np.float64)
+    )
+    assert np.array_equal(scalar_field_data[2]["temperature"], [10.0, 20.0])
+    if contiguous:
+        assert not scalar_field_data[1]["temperature"].flags.writeable
+        assert (
+            scalar_field_data[1]["temperature"].base
+            is scalar_field_data[2]["temperature"].base
+        )
+
+
+def test_chunk_parser_iter_fields_assembles_consecutive_payloads():
+    chunks = (
+        _scalar_field_chunks(1, "temperature", [1.0, 2.0, 3.0, 4.0])
+        + _scalar_field_chunks(1, "temperature", [5.0, 6.0])
+        + _scalar_field_chunks(2, "temperature", [10.0, 20.0])
+    )
+    fields = [
+        (surface_id, field_name, data.tolist())
+        for _, surface_id, field_name, data in ChunkParser.iter_fields(iter(chunks))
+    ]
+    assert fields == [
+        (1, "temperature", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+        (2, "temperature", [10.0, 20.0]),
+    ]
+
+    chunks += _scalar_field_chunks(1, "temperature", [7.0])
+    with pytest.raises(RuntimeError):
+        list(ChunkParser.iter_fields(iter(chunks)))
+
+
+def test_chunk_parser_contiguous_arena_grows():
+    values = {
+        surface_id: np.arange(1000, dtype=np.float64) + surface_id
+        for surface_id in range(20)
+    }
+    chunks = []
+    for surface_id, surface_values in values.items():
+        chunks += _scalar_field_chunks(
+            surface_id, "temperature", surface_values[:600], chunk_size=256
+        )
+        chunks += _scalar_field_chunks(
+            surface_id, "temperature", surface_values[600:], chunk_size=256
+        )
+    fields = ChunkParser(contiguous=True).extract_fields(iter(chunks))
+    scalar_field_data = next(iter(fields.values()))
+    for surface_id, surface_values in values.items():
+        field = scalar_field_data[surface_id]["temperature"]
+        assert np.array_equal(field, surface_values)
+        assert field.base is scalar_field_data[0]["temperature"].base
+
+
+def test_columnar_mesh_from_solver_mesh_responses():
+    nodes_response = FieldDataProtoModule.GetSolverMeshNodesDoubleResponse()
+    for node_id, x in [(30, 0.0), (10, 1.0), (20, 2.0), (40, 3.0)]:
+        nodes_response.nodes.add(id=node_id, x=x, y=2 * x, z=0.0)
+    elements_response = FieldDataProtoModule.GetSolverMeshElementsResponse()
+    elements_response.elements.add(
+        id=1,
+        element_type=CellElementType.TETRAHEDRON.value,
+        node_ids=[10, 20, 30, 40],
+    )
+    polyhedron = elements_response.elements.add(
+        id=2, element_type=CellElementType.POLYHEDRON.value
+    )
+    polyhedron.facets.add(node=[40, 30, 20])
+    polyhedron.facets.add(node=[10, 20, 30, 40])
+
+    mesh = _get_mesh(nodes_response.nodes, elements_response.elements)
+    assert mesh.node_coordinates.shape == (4, 3)
+    assert mesh.node_ids.tolist() == [30, 10, 20, 40]
+    assert mesh.element_node_offsets.tolist() == [0, 4, 4]
+    assert mesh.element_node_indices.tolist() == [1, 2, 0, 3]
+    assert mesh.element_facet_offsets.tolist() == [0, 0, 2]
+    assert mesh.facet_node_offsets.tolist() == [0, 3, 7]
+    assert mesh.facet_node_indices.tolist() == [3, 0, 2, 1, 2, 0, 3]
+
+    assert len(mesh.nodes) == 4
+    assert mesh.nodes[1]._id == 10
+    assert mesh.nodes[1].y == pytest_approx(2.0)
+    assert mesh.elements[0].element_type == CellElementType.TETRAHEDRON
+    assert mesh.elements[0].node_indices == [1, 2, 0, 3]
+    assert mesh.elements[1].element_type == CellElementType.POLYHEDRON
+    assert len(mesh.elements[1].node_indices) == 0
+    assert [facet.node_indices for facet in mesh.elements[1].facets] == [
+        [3, 0, 2],
+        [1, 2, 0, 3],
+    ]
+
+
+def test_faces_connectivity_decoding():
+    mixed = np.array([3, 0, 1, 2, 4, 2, 3, 4, 5, 1, 6, 3, 7, 8, 9], dtype=np.int32)
+    connectivity = _get_connectivity_csr(mixed)
+    assert len(connectivity) == 4
+    assert connectivity.offsets.tolist() == [0, 3, 7, 8, 11]
+    assert connectivity.indices.tolist() == [0, 1, 2, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert connectivity[1].tolist() == [2, 3, 4, 5]
+    assert [face.tolist() for face in connectivity.to_list()] == [
+        [0, 1, 2],
+        [2, 3, 4, 5],
+        [6],
+        [7, 8, 9],
+    ]
+    with pytest.raises(ValueError):
+        connectivity.to_dense()
+
+    quads = np.array([4, 0, 1, 2, 3, 4, 3, 2, 5, 6], dtype=np.int32)
+    connectivity = _get_connectivity_csr(quads)
+    assert connectivity.offsets.tolist() == [0, 4, 8]
+    assert connectivity.to_dense().tolist() == [[0, 1, 2, 3], [3, 2, 5, 6]]
+
+    empty = _get_connectivity_csr(np.array([], dtype=np.int32))
+    assert len(empty) == 0
+    assert empty.to_list() == []
+
+    faces_without_vertices = _get_connectivity_csr(np.zeros(3, dtype=np.int32))
+    assert faces_without_vertices.offsets.tolist() == [0, 0, 0, 0]
+    assert faces_without_vertices.indices.tolist() == []
+    assert [face.tolist() for face in faces_without_vertices.to_list()] == [[]] * 3
+
+
+def test_field_data_cache_lru():
+    cache = FieldDataCache(max_size=2)
+    generation = cache.generation
+    cache.put("a", np.zeros(2), generation)
+    cache.put("b", np.ones(2), generation)
+    assert cache.get("a") is not None
+    cache.put("c", np.ones(3), generation)
+    assert cache.get("b") is None
+    assert not cache.get("c").flags.writeable
+    assert cache.get_statistics() == {"hits": 2, "misses": 1, "evictions": 1, "size": 2}
+    cache.clear()
+    cache.put("d", np.ones(3), generation)
+    assert len(cache) == 0
+
+
+class _MockFieldDataService:
+    def __init__(self):
+        self.requested_surface_ids = []
+        self.num_requests = 0
+
+    def get_fields(self, request):
+        self.num_requests += 1
+        chunks = []
+        for scalar_field_request in request.scalarFieldRequest:
+            surface_id = scalar_field_request.surfaceId
+            self.requested_surface_ids.append(surface_id)
+            chunks += _scalar_field_chunks(
+                surface_id, scalar_field_request.scalarFieldName, [surface_id] * 4
+            )
+        return iter(chunks)
+
+
+class _MockEventsManager:
+    _event_type = SolverEvent
+
+    def __init__(self):
+        self.callbacks = {}
+
+    def register_callback(self, event_name, callback):
+        self.callbacks[event_name] = callback
+        return event_name.name
+
+    def unregister_callback(self, callback_id):
+        del self.callbacks[SolverEvent[callback_id]]
+
+
+def test_field_data_cache_invalidated_by_solver_events(monkeypatch):
+    monkeypatch.setattr("ansys.fluent.core.services.field_data.validate_inputs", False)
+    service = _MockFieldDataService()
+    events_manager = _MockEventsManager()
+    field_data = FieldData(service, None, lambda: True, events_manager=events_manager)
+    field_data.enable_cache()
+    assert SolverEvent.ITERATION_ENDED in events_manager.callbacks
+
+    data = field_data.get_scalar_field_data("temperature", surfaces=[1, 2])
+    assert data[2].tolist() == [2.0] * 4
+    data = field_data.get_scalar_field_data("temperature", surfaces=[2, 3])
+    assert data[3].tolist() == [3.0] * 4
+    assert service.requested_surface_ids == [1, 2, 3]
+    assert field_data.cache.hits == 1
+
+    events_manager.callbacks[SolverEvent.ITERATION_ENDED](None, None)
+    field_data.get_scalar_field_data("temperature", surfaces=[1])
+    assert service.requested_surface_ids == [1, 2, 3, 1]
+
+    field_data.disable_cache()
+    assert events_manager.callbacks == {}
+    field_data.get_scalar_field_data("temperature", surfaces=[1])
+    assert service.requested_surface_ids == [1, 2, 3, 1, 1]
+
+
+def test_get_scalar_fields_data_in_single_request(monkeypatch):
+    monkeypatch.setattr("ansys.fluent.core.services.field_data.validate_inputs", False)
+    service = _MockFieldDataService()
+    field_data = FieldData(service, None, lambda: True)
+    field_data.enable_cache()
+    field_data.get_scalar_field_data("pressure", surfaces=[2])
+    data = field_data.get_scalar_fields_data(
+        ["temperature", "pressure"], surfaces=[1, 2, 3]
+    )
+    assert service.num_requests == 2
+    assert service.requested_surface_ids == [2, 1, 2, 3, 1, 3]
+    assert sorted(data) == [1, 2, 3]
+    assert data[3].shape == (4, 2)
+    assert data[3].tolist() == [[3.0, 3.0]] * 4
+
+
+class _MockFieldInfoService:
+    def __init__(self):
+        self.surfaces = {"inlet": 3, "outlet": 4}
+        self.rpc_count = 0
+        self.surfaces_rpc_count = 0
+
+    def get_scalar_fields_info(self, request):
+        self.rpc_count += 1
+        response = FieldDataProtoModule.GetFieldsInfoResponse()
+        response.fieldInfo.add(solverName="x-coordinate", section="Mesh...")
+        response.fieldInfo.add(solverName="temperature", section="Temperature...")
+        return response
+
+    def get_surfaces_info(self, request):
+        self.surfaces_rpc_count += 1
+        response = FieldDataProtoModule.GetSurfacesInfoResponse()
+        for surface_name, surface_id in self.surfaces.items():
+            response.surfaceInfo.add(surfaceName=surface_name).surfaceId.add(
+                id=surface_id
+            )
+        return response
+
+
+def test_field_info_metadata_cache():
+    service = _MockFieldInfoService()
+    events_manager = _MockEventsManager()
+    field_info = FieldInfo(service, lambda: False, events_manager=events_manager)
+    field_data = FieldData(service, field_info, lambda: False)
+    transaction = field_data.new_transaction()
+    for _ in range(3):
+        transaction.add_scalar_fields_request("x-coordinate", surfaces=["inlet"])
+    with pytest.raises(FieldUnavailable):
+        transaction.add_scalar_fields_request("temperature", surfaces=["outlet"])
+    assert service.rpc_count == 1
+
+    # The surfaces are not cached, as they can be created, deleted or redefined
+    # without any event.
+    service.surfaces["plane-1"] = 7
+    assert field_info.get_surfaces_info()["plane-1"]["surface_id"] == [7]
+    del service.surfaces["inlet"]
+    with pytest.raises(DisallowedValuesError):
+        transaction.add_scalar_fields_request("x-coordinate", surfaces=["inlet"])
+    service.surfaces["plane-1"] = 8
+    assert _get_surface_ids(
+        field_info, field_data._allowed_surface_names, ["plane-1"]
+    ) == [8]
+    assert service.rpc_count == 1
+
+    version = field_info.metadata_version
+    events_manager.callbacks[SolverEvent.CASE_LOADED](None, None)
+    assert field_info.metadata_version == version + 1
+    field_info.get_scalar_fields_info()["x-coordinate"]["section"] = "Other"
+    assert field_info.get_scalar_fields_info()["x-coordinate"]["section"] == "Mesh..."
+    assert service.rpc_count == 2
+
+
+def test_scalar_field_name_validated_without_surfaces():
+    service = _MockFieldInfoService()
+    field_info = FieldInfo(service, lambda: False)
+    field_data = FieldData(service, field_info, lambda: False)
+    assert field_data.get_scalar_field_data("x-coordinate", surfaces=[]) == {}
+    with pytest.raises(DisallowedValuesError):
+        field_data.get_scalar_field_data("pressure", surfaces=[])
+    with pytest.raises(DisallowedValuesError):
+        field_data.get_scalar_fields_data(["x-coordinate", "pressure"], surfaces=[])
+
+
+def test_field_transaction_with_multiple_streams(monkeypatch):
+    monkeypatch.setattr("ansys.fluent.core.services.field_data.validate_inputs", False)
+    service = _MockFieldDataService()
+    transaction = FieldData(service, None, lambda: True).new_transaction()
+    transaction.add_scalar_fields_request("temperature", surfaces=[1, 2, 3, 4, 5])
+    transaction.add_scalar_fields_request("pressure", surfaces=[5, 1])
+    fields = transaction.get_fields(num_streams=3)
+    assert service.num_requests == 3
+    assert sorted(service.requested_surface_ids) == [1, 1, 2, 3, 4, 5, 5]
+    scalar_field_data = next(iter(fields.values()))
+    assert sorted(scalar_field_data) == [1, 2, 3, 4, 5]
+    assert scalar_field_data[4]["temperature"].tolist() == [4.0] * 4
+    assert sorted(scalar_field_data[5]) == ["pressure", "temperature"]
+
+
+def test_field_data_iterators(monkeypatch):
+    monkeypatch.setattr("ansys.fluent.core.services.field_data.validate_inputs", False)
+    service = _MockFieldDataService()
+    field_data = FieldData(service, None, lambda: True)
+    transaction = field_data.new_transaction()
+    transaction.add_scalar_fields_request("temperature", surfaces=[1, 2])
+    fields = transaction.iter_fields()
+    tag, surface_id, field_name, data = next(fields)
+    assert tag[0] == ("type", "scalar-field")
+    assert (surface_id, field_name, data.tolist()) == (1, "temperature", [1.0] * 4)
+    assert [surface_id for _, surface_id, _, _ in fields] == [2]
+
+    data = field_data.iter_scalar_field_data("pressure", surfaces=[3, 4])
+    assert service.num_requests == 1
+    assert [(surface, data.tolist()) for surface, data in data] == [
+        (3, [3.0] * 4),
+        (4, [4.0] * 4),
+    ]
+    assert service.num_requests == 2
+
+
+@pytest.mark.parametrize("file_name", ["fields.h5", "fields.npz"])
+def test_field_transaction_export(file_name, tmp_path, monkeypatch):
+    if file_name.endswith(".h5"):
+        h5py = pytest.importorskip("h5py")
+    monkeypatch.setattr("ansys.fluent.core.services.field_data.validate_inputs", False)
+    service = _MockFieldDataService()
+    transaction = FieldData(service, None, lambda: True).new_transaction()
+    transaction.add_scalar_fields_request("temperature", surfaces=[1, 2, 1])
+    path = tmp_path / file_name
+    assert transaction.export(path) == "0"
+    assert transaction.export(path, group="time-1") == "time-1"
+    with pytest.raises(ValueError):
+        transaction.export(path, group="time-1")
+
+    tag_name = "type=scalar-field,dataLocation=0,boundaryValues=False"
+    if file_name.endswith(".h5"):
+        with h5py.File(path) as f:
+            assert sorted(f) == ["0", "time-1"]
+            assert f["0"][tag_name].attrs["type"] == "scalar-field"
+            assert f["time-1"][tag_name]["1"]["temperature"][:].tolist() == [1.0] * 8
+            assert f["0"][tag_name]["2"]["temperature"][:].tolist() == [2.0] * 4
+    else:
+        with np.load(path) as data:
+            assert sorted(data) == [
+                f"0/{tag_name}/1/temperature",
+                f"0/{tag_name}/2/temperature",
+                f"time-1/{tag_name}/1/temperature",
+                f"time-1/{tag_name}/2/temperature",
+            ]
+            assert data[f"time-1/{tag_name}/1/temperature"].tolist() == [1.0] * 8
+            assert data[f"0/{tag_name}/2/temperature"].tolist() == [2.0] * 4
+
+
+@pytest.mark.parametrize("file_name", ["fields.h5", "fields.npz"])
+def test_field_transaction_export_group_names(file_name, tmp_path, monkeypatch):
+    if file_name.endswith(".h5"):
+        pytest.importorskip("h5py")
+    monkeypatch.setattr("ansys.fluent.core.services.field_data.validate_inputs", False)
+    service = _MockFieldDataService()
+    transaction = FieldData(service, None, lambda: True).new_transaction()
+    transaction.add_scalar_fields_request("temperature", surfaces=[1])
+    path = tmp_path / file_name
+    assert transaction.export(path, group="1") == "1"
+    assert transaction.export(path) == "0"
+    assert transaction.export(path) == "2"
+
+
+def test_field_transaction_export_failure_removes_group(tmp_path, monkeypatch):
+    h5py = pytest.importorskip("h5py")
+    monkeypatch.setattr("ansys.fluent.core.services.field_data.validate_inputs", False)
+
+    class _FailingFieldDataService(_MockFieldDataService):
+        def get_fields(self, request):
+            chunks = super().get_fields(request)
+            yield next(chunks)
+            raise RuntimeError("stream failed")
+
+    transaction = FieldData(
+        _FailingFieldDataService(), None, lambda: True
+    ).new_transaction()
+    transaction.add_scalar_fields_request("temperature", surfaces=[1, 2])
+    path = tmp_path / "fields.h5"
+    with pytest.raises(RuntimeError, match="stream failed"):
+        transaction.export(path, group="partial")
+    with h5py.File(path) as f:
+        assert list(f) == []
+
+
+class _MockAsyncFieldDataService(_MockFieldDataService):
+    def get_fields(self, request):
+        chunks = super().get_fields(request)
+
+        async def _chunk_iterator():
+            for chunk in chunks:
+                await asyncio.sleep(0)
+                yield chunk
+
+        return _chunk_iterator()
+
+
+def test_async_field_data(monkeypatch):
+    monkeypatch.setattr("ansys.fluent.core.services.field_data.validate_inputs", False)
+    service = _MockAsyncFieldDataService()
+    field_data = FieldData(service, None, lambda: True)
+    async_field_data = AsyncFieldData(service, field_data)
+
+    async def _get_data():
+        transaction = async_field_data.new_transaction()
+        transaction.add_scalar_fields_request("temperature", surfaces=[1, 2, 3])
+        return await asyncio.gather(
+            async_field_data.get_scalar_field_data("pressure", surfaces=[4, 5]),
+            transaction.get_fields(num_streams=2),
+        )
+
+    async def _iter_data():
+        transaction = async_field_data.new_transaction()
+        transaction.add_scalar_fields_request("temperature", surfaces=[6, 7])
+        return [surface_id async for _, surface_id, _, _ in transaction.iter_fields()]
+
+    assert asyncio.run(_iter_data()) == [6, 7]
+    data, fields = asyncio.run(_get_data())
+    assert data[5].tolist() == [5.0] * 4
+    assert service.num_requests == 4
+    scalar_field_data = next(iter(fields.values()))
+    assert sorted(scalar_field_data) == [1, 2, 3]
+    assert scalar_field_data[3]["temperature"].tolist() == [3.0] * 4
+
+
+def test_async_field_data_validates_off_the_event_loop(monkeypatch):
+    monkeypatch.setattr("ansys.fluent.core.services.field_data.validate_inputs", False)
+    service = _MockAsyncFieldDataService()
+    async_field_data = AsyncFieldData(service, FieldData(service, None, lambda: True))
+    get_surface_ids = async_field_data._get_surface_ids
+    validation_threads = []
+
+    def _get_surface_ids(surfaces):
+        validation_threads.append(threading.get_ident())
+        return get_surface_ids(surfaces)
+
+    monkeypatch.setattr(async_field_data, "_get_surface_ids", _get_surface_ids)
+
+    async def _get_data():
+        data = await async_field_data.get_scalar_field_data("pressure", surfaces=[4])
+        return data, threading.get_ident()
+
+    data, loop_thread = asyncio.run(_get_data())
+    assert data[4].tolist() == [4.0] * 4
+    assert validation_threads and loop_thread not in validation_threads
+
+
+def test_async_vector_field_data_checks_surfaces(monkeypatch):
+    monkeypatch.setattr("ansys.fluent.core.services.field_data.validate_inputs", False)
+    service = _MockAsyncFieldDataService()
+    check_threads = []
+
+    class _MockSchemeEval:
+        def string_eval(self, expression):
+            check_threads.append(threading.get_ident())
+            raise RuntimeError(f"{expression} failed")
+
+    field_data = FieldData(service, None, lambda: True, scheme_eval=_MockSchemeEval())
+    async_field_data = AsyncFieldData(service, field_data)
+
+    async def _get_data():
+        with pytest.raises(RuntimeError, match=r"\(surface\? 4\) failed"):
+            await async_field_data.get_vector_field_data("velocity", surfaces=[4])
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(_get_data())
+    assert check_threads and loop_thread not in check_threads
+    assert service.num_requests == 0
+
+
+def test_async_error_state_interceptor():
+    error_state = ErrorState()
+    interceptor = AsyncErrorStateInterceptor(error_state)
+
+    async def _continuation(client_call_details, request):
+        return request
+
+    async def _call():
+        return await interceptor.intercept_unary_stream(_continuation, None, "request")
+
+    assert asyncio.run(_call()) == "request"
+    error_state.set("fatal", "server crashed")
+    with pytest.raises(RuntimeError, match="server crashed"):
+        asyncio.run(_call())
@@ -1,5 +1,6 @@
 """Unit tests for flobject module."""
 
+import collections
 from collections.abc import MutableMapping
 import io
 import weakref
@@ -7,6 +8,7 @@ import weakref
 import pytest
 from test_utils import count_key_recursive
 
+import ansys.fluent.core as pyfluent
 from ansys.fluent.core.examples import download_file
 from ansys.fluent.core.solver import flobject
 from ansys.fluent.core.solver.flobject import (
@@ -382,6 +384,9 @@ class Proxy:
     def get_var(self, path):
         return self.get_obj(path).get_state()
 
+    def get_vars(self, paths):
+        return [self.get_obj(path).get_state() for path in paths]
+
     def set_var(self, path, value):
         return self.get_obj(path).set_state(value)
 
@@ -407,8 +412,25 @@ class Proxy:
         return self.get_obj(path).get_command(command)(**kwds)
 
     def get_attrs(self, path, attrs, recursive=False):
+        if recursive:
+            return self._get_recursive_attrs(self.get_obj(path), attrs)
         return self.get_obj(path).get_attrs(attrs)
 
+    def _get_recursive_attrs(self, obj, attrs):
+        ret = {"attrs": obj.get_attrs(attrs)}
+        if isinstance(obj, Group):
+            ret["group_children"] = {
+                c: self._get_recursive_attrs(v, attrs) for c, v in obj.objs.items()
+            }
+        return ret
+
+    def get_attrs_many(self, paths, attrs, recursive=False):
+        if recursive:
+            return [
+                self._get_recursive_attrs(self.get_obj(path), attrs) for path in paths
+            ]
+        return [self.get_obj(path).get_attrs(attrs) for path in paths]
+
     @classmethod
     def get_static_info(cls):
         return cls.root.get_static_info()
@@ -499,6 +521,229 @@ def test_list_object():
     assert r.l_1() == [{"il_1": [3], "bl_1": [True, False]}]
 
 
+def test_prefetch():
+    proxy = Proxy()
+    r = flobject.get_root(proxy)
+    r.g_1 = {"r_1": 3.2, "i_2": -3, "b_3": False, "s_4": "foo"}
+    r.n_1["n1"] = {"rl_1": [1.2, 3.4], "sl_1": ["foo", "bar"]}
+    r.l_1 = [{"il_1": [3], "bl_1": [True, False]}]
+    calls = []
+    for name in ["get_var", "get_vars", "get_attrs", "get_attrs_many"]:
+        method = getattr(proxy, name)
+        setattr(
+            proxy,
+            name,
+            lambda *args, _name=name, _method=method, **kwds: calls.append(_name)
+            or _method(*args, **kwds),
+        )
+
+    def reads():
+        return [call for call in calls if call in ["get_var", "get_vars"]]
+
+    g_1, n_1, l_1 = r.g_1, r.n_1, r.l_1
+    calls.clear()
+    with r.prefetch(g_1, n_1, l_1) as prefetch:
+        assert calls == []
+        assert r.g_1.r_1() == 3.2
+        assert r.g_1() == {"r_1": 3.2, "i_2": -3, "b_3": False, "s_4": "foo"}
+        assert r.n_1["n1"].sl_1() == ["foo", "bar"]
+        assert r.l_1[0].il_1() == [3]
+        assert reads() == ["get_vars"]
+        # The served values are copies.
+        r.g_1().clear()
+        assert r.g_1.s_4() == "foo"
+        # A write discards the prefetched values.
+        r.g_1.s_4 = "bar"
+        assert r.g_1.s_4() == "bar"
+        assert reads() == ["get_vars", "get_var"]
+        # Nested blocks add to the current prefetch.
+        with r.g_1.prefetch():
+            assert r.g_1.i_2() == -3
+        assert reads() == ["get_vars", "get_var", "get_vars"]
+        r_1 = r.g_1.r_1
+        calls.clear()
+        prefetch.add(r, g_1, r_1, attrs=["active?", "webui-release-active?"])
+        assert r.g_1.r_1.get_attrs(["active?"]) == {"active?": True}
+        assert r.g_1.r_1.is_active()
+        assert calls == ["get_attrs_many"]
+    assert r.flproxy is proxy
+    calls.clear()
+    assert g_1.r_1() == 3.2
+    assert reads() == ["get_var"]
+
+
+def test_snapshot():
+    proxy = Proxy()
+    r = flobject.get_root(proxy)
+    r.g_1 = {"r_1": 3.2, "i_2": -3, "b_3": False, "s_4": "foo"}
+    for i in range(5):
+        r.n_1[f"n{i}"] = {"rl_1": [i, 1.0], "sl_1": [f"s{i}"]}
+    calls = collections.Counter()
+    for name in [
+        "get_var",
+        "get_attrs",
+        "get_attrs_many",
+        "get_object_names",
+        "get_list_size",
+    ]:
+        method = getattr(proxy, name)
+        setattr(
+            proxy,
+            name,
+            lambda *args, _name=name, _method=method, **kwds: calls.update([_name])
+            or _method(*args, **kwds),
+        )
+
+    # The mirror is only fetched within a with block.
+    snapshot = r.snapshot()
+    assert not snapshot.is_valid
+    assert not calls and r.flproxy is proxy
+
+    with r.snapshot() as snapshot:
+        assert snapshot.is_valid
+        assert calls == {"get_var": 1, "get_attrs": 1, "get_attrs_many": 1}
+        calls.clear()
+        assert {name: obj.sl_1() for name, obj in r.n_1.items()} == {
+            f"n{i}": [f"s{i}"] for i in range(5)
+        }
+        assert r.g_1.r_1() == 3.2
+        assert r.g_1.b_3.is_active()
+        assert not calls
+        # A change discards the mirror.
+        r.g_1.r_1 = 4.5
+        assert not snapshot.is_valid
+        assert r.flproxy is proxy
+        assert r.g_1.r_1() == 4.5
+        assert calls["get_var"] == 1
+
+    # The mirror is discarded when the settings are changed by Fluent, for example,
+    # when a case file is read.
+    with r.g_1.snapshot() as snapshot:
+        flobject._clear_local_state(r)
+        assert not snapshot.is_valid
+        assert r.flproxy is proxy
+
+    with r.n_1.snapshot(recursive=False, attrs=[]) as snapshot:
+        calls.clear()
+        assert r.n_1.get_object_names() == [f"n{i}" for i in range(5)]
+        assert r.n_1["n3"].rl_1() == [3, 1.0]
+        assert not calls["get_var"] and not calls["get_object_names"]
+        assert calls["get_attrs"]
+    assert not snapshot.is_valid
+    assert r.flproxy is proxy
+
+
+def test_deferred():
+    proxy = Proxy()
+    r = flobject.get_root(proxy)
+    r.g_1 = {"r_1": 3.2, "i_2": -3, "b_3": False, "s_4": "foo"}
+    r.n_1["n1"] = {"rl_1": [1.2, 3.4], "sl_1": ["foo", "bar"]}
+    r.n_1["n2"] = {"rl_1": [5.6], "sl_1": ["baz"]}
+    r.l_1 = [{"il_1": [3], "bl_1": [True, False]}]
+    set_var = proxy.set_var
+    calls = []
+    proxy.set_var = lambda path, value: calls.append((path, value)) or set_var(
+        path, value
+    )
+
+    with r.deferred():
+        r.g_1.r_1 = 4.5
+        r.g_1.i_2 = 2
+        r.g_1 = {"s_4": "bar", "i_2": 3}
+        r.n_1["n1"].rl_1 = [7.8]
+        r.n_1["n2"].sl_1 = ["qux"]
+        r.l_1[0].il_1 = [4]
+        assert calls == []
+        assert r.g_1.r_1() == 3.2
+    assert calls == [
+        ("g-1", {"r-1": 4.5, "i-2": 3, "s-4": "bar"}),
+        ("n-1", {"n1": {"rl-1": [7.8]}, "n2": {"sl-1": ["qux"]}}),
+        ("l-1/0/il-1", [4]),
+    ]
+    assert r.g_1() == {"r_1": 4.5, "i_2": 3, "b_3": False, "s_4": "bar"}
+    assert r.n_1() == {
+        "n1": {"rl_1": [7.8], "sl_1": ["foo", "bar"]},
+        "n2": {"rl_1": [5.6], "sl_1": ["qux"]},
+    }
+    assert r.l_1() == [{"il_1": [4], "bl_1": [True, False]}]
+
+    # Commands apply the deferred writes first.
+    calls.clear()
+    with r.deferred():
+        r.g_1.r_1 = 2.4
+        r.c_1()
+        assert calls == [("g-1/r-1", 2.4)]
+    assert r.g_1.r_1() == 2.4 + 2.3
+
+    # The deferred writes are discarded if the block raises.
+    calls.clear()
+    with pytest.raises(ZeroDivisionError):
+        with r.deferred():
+            r.g_1.r_1 = 1.0
+            1 / 0
+    assert calls == []
+    assert r.flproxy is proxy
+
+    # The errors are reported at the paths of the writes.
+    def failing_set_var(path, value):
+        calls.append((path, value))
+        if path == "g-1/i-2" or isinstance(value, dict):
+            raise RuntimeError("Failed")
+        return set_var(path, value)
+
+    proxy.set_var = failing_set_var
+    calls.clear()
+    with pytest.raises(flobject.DeferredWriteError) as ex:
+        with r.deferred():
+            r.g_1.r_1 = 1.0
+            r.g_1.i_2 = 1
+    assert list(ex.value.errors) == ["g-1/i-2"]
+    assert [path for path, _ in calls] == ["g-1", "g-1/r-1", "g-1/i-2"]
+    assert r.g_1.r_1() == 1.0
+
+
+def test_static_info_cache(monkeypatch, tmp_path, caplog):
+    monkeypatch.setattr(flobject, "_root_cls_by_hash", {})
+    monkeypatch.setattr("ansys.fluent.core.utils.get_user_data_dir", lambda: tmp_path)
+    monkeypatch.setattr(pyfluent, "__version__", "1.0")
+    calls = []
+
+    class CountingProxy(Proxy):
+        def get_static_info(self):
+            calls.append("get_static_info")
+            return super().get_static_info()
+
+    caplog.set_level("INFO", logger="pyfluent.settings_api")
+    r = flobject.get_root(CountingProxy(), get_build_id=lambda: "1.2/3")
+    assert calls == ["get_static_info"]
+    assert "Static info cache miss" in caplog.text
+    cache_file = tmp_path / "settings_static_info" / "settings__1.2_3_1.0.pickle"
+    assert cache_file.is_file()
+
+    caplog.clear()
+    r2 = flobject.get_root(CountingProxy(), get_build_id=lambda: "1.2/3")
+    assert calls == ["get_static_info"]
+    assert "Static info cache hit" in caplog.text
+    assert type(r2) is type(r)
+    r2.g_1.r_1 = 2.0
+    assert r2.g_1.r_1() == 2.0
+
+    # A corrupted cache file is ignored and rewritten.
+    cache_file.write_bytes(b"corrupted")
+    flobject.get_root(CountingProxy(), get_build_id=lambda: "1.2/3")
+    assert calls == ["get_static_info"] * 2
+    # The cache file of another PyFluent version is not used.
+    monkeypatch.setattr(pyfluent, "__version__", "2.0")
+    flobject.get_root(CountingProxy(), get_build_id=lambda: "1.2/3")
+    assert calls == ["get_static_info"] * 3
+    cache_file.rename(tmp_path / "settings_static_info" / "settings__1.2_3_2.0.pickle")
+    flobject.get_root(CountingProxy(), get_build_id=lambda: "1.2/3")
+    assert calls == ["get_static_info"] * 4
+    # The static info is not cached without a build id.
+    flobject.get_root(CountingProxy())
+    assert calls == ["get_static_info"] * 5
+
+
 def test_command():
     r = flobject.get_root(Proxy())
     r.g_1.r_1 = 2.4
@@ -0,0 +1,114 @@
+import pytest
+
+from ansys.api.fluent.v0 import batch_ops_pb2, settings_pb2
+import ansys.fluent.core as pyfluent
+from ansys.fluent.core.services import settings
+from ansys.fluent.core.services.batch_ops import BatchOps
+
+
+class _FakeSettingsServiceImpl:
+    def __init__(self):
+        self.active = True
+        self.calls = []
+
+    def _get_attrs_response(self, request):
+        response = settings_pb2.GetAttrsResponse()
+        response.values.value_map.m["active?"].boolean = self.active
+        return response
+
+    def get_attrs(self, request):
+        self.calls.append(("get_attrs", request.path_info.path))
+        return self._get_attrs_response(request)
+
+    def set_var(self, request):
+        self.calls.append(("set_var", request.path_info.path))
+        self.active = request.value.boolean
+        return settings_pb2.SetVarResponse()
+
+    def execute_batch(self, requests):
+        requests = list(requests)
+        self.calls.append(("execute_batch", len(requests)))
+        for request in requests:
+            response = self._get_attrs_response(
+                settings_pb2.GetAttrsRequest.FromString(request.request_body)
+            )
+            yield batch_ops_pb2.ExecuteResponse(
+                status=batch_ops_pb2.STATUS_SUCCESSFUL,
+                response_body=response.SerializeToString(),
+            )
+
+
+@pytest.fixture
+def service_impl(monkeypatch):
+    service_impl = _FakeSettingsServiceImpl()
+    monkeypatch.setattr(settings, "_SettingsServiceImpl", lambda *args: service_impl)
+    return service_impl
+
+
+def test_attr_cache_is_disabled_by_default(service_impl):
+    service = settings.SettingsService(None, None, None, None, None)
+    assert service.get_attrs("a", ["active?"]) == {"active?": True}
+    assert service.get_attrs("a", ["active?"]) == {"active?": True}
+    assert service_impl.calls == [("get_attrs", "a"), ("get_attrs", "a")]
+
+
+def test_attr_cache(service_impl, monkeypatch):
+    monkeypatch.setattr(pyfluent, "SETTINGS_USE_ATTR_CACHE", True)
+    service = settings.SettingsService(None, None, None, None, None)
+    for _ in range(3):
+        assert service.get_attrs("a", ["active?"]) == {"active?": True}
+    assert service_impl.calls == [("get_attrs", "a")]
+    # The cached values are not shared with the callers.
+    service.get_attrs("a", ["active?"])["active?"] = False
+    assert service.get_attrs("a", ["active?"]) == {"active?": True}
+
+    service_impl.calls.clear()
+    assert (
+        service.get_attrs_many(["a", "b", "c"], ["active?"]) == [{"active?": True}] * 3
+    )
+    assert service.get_attrs_many(["b", "c"], ["active?"]) == [{"active?": True}] * 2
+    assert service_impl.calls == [("execute_batch", 2)]
+
+    # A change made through the service clears the cache.
+    service_impl.calls.clear()
+    service.set_var("a", False)
+    assert service.get_attrs("a", ["active?"]) == {"active?": False}
+    assert service.get_attrs("b", ["active?"]) == {"active?": False}
+    assert service_impl.calls == [
+        ("set_var", "a"),
+        ("get_attrs", "a"),
+        ("get_attrs", "b"),
+    ]
+    # So does an event callback.
+    service_impl.active = True
+    service.clear_attr_cache(session=None, event_info=None)
+    assert service.get_attrs("a", ["active?"]) == {"active?": True}
+
+    statistics = service.get_attr_cache_statistics()
+    assert (statistics.hits, statistics.misses) == (7, 6)
+    assert statistics.invalidations == 2
+    assert statistics.hit_rate == 7 / 13
+    service.reset_attr_cache_statistics()
+    assert service.get_attr_cache_statistics() == settings.AttrCacheStatistics()
+
+
+def test_attr_cache_is_cleared_after_batch_ops(service_impl, monkeypatch):
+    monkeypatch.setattr(pyfluent, "SETTINGS_USE_ATTR_CACHE", True)
+    service = settings.SettingsService(None, None, None, None, None)
+
+    class FakeBatchOpsService:
+        def execute(self, requests):
+            # The queued set_var is executed on exit.
+            service_impl.active = False
+            return []
+
+    class FakeSession:
+        _batch_ops_service = FakeBatchOpsService()
+
+    with BatchOps(FakeSession()):
+        service.set_var("a", True)
+        assert service.get_attrs("a", ["active?"]) == {"active?": True}
+        assert service.get_attrs("a", ["active?"]) == {"active?": True}
+    assert service.get_attrs("a", ["active?"]) == {"active?": False}
+    statistics = service.get_attr_cache_statistics()
+    assert (statistics.hits, statistics.misses) == (1, 2)
@@ -1,8 +1,17 @@
 import numpy as np
 import pytest
 
-from ansys.fluent.core import examples
+from ansys.api.fluent.v0 import field_data_pb2 as FieldDataProtoModule
+from ansys.api.fluent.v0 import svar_pb2 as SvarProtoModule
+from ansys.fluent.core import SolverEvent, examples
 from ansys.fluent.core.examples.downloads import download_file
+from ansys.fluent.core.services.field_data import FieldDataCache
+from ansys.fluent.core.services.solution_variables import (
+    SolutionVariableData,
+    SolutionVariableInfo,
+    ZoneError,
+    ZoneSizeError,
+)
 
 
 @pytest.mark.fluent_version(">=23.2")
@@ -239,3 +248,240 @@ def test_solution_variable_udm_data(mixing_elbow_case_session_t4):
         zone_names=["wall-elbow"],
     )["wall-elbow"]
     np.testing.assert_array_equal(new_array, udm_data)
+
+
+class _MockSolutionVariableService:
+    def __init__(self):
+        self.zones = {"fluid": (2, 5), "wall": (3, 2)}
+        self.rpc_count = 0
+        self.data_requests = []
+        self.set_data_requests = []
+        # Number of values streamed in addition to the zone count
+        self.extra_values = 0
+
+    def get_zones_info(self, request):
+        self.rpc_count += 1
+        response = SvarProtoModule.GetZonesInfoResponse()
+        response.domainsInfo.add(name="mixture", domainId=1)
+        for zone_name, (zone_id, count) in self.zones.items():
+            response.zonesInfo.add(name=zone_name, zoneId=zone_id).partitionsInfo.add(
+                count=count, startIndex=0, endIndex=count - 1
+            )
+        return response
+
+    def get_variables_info(self, request):
+        self.rpc_count += 1
+        response = SvarProtoModule.GetSvarsInfoResponse()
+        for name in ["SV_P", "SV_T"]:
+            response.svarsInfo.add(
+                name=name,
+                dimension=1,
+                fieldType=FieldDataProtoModule.FieldType.DOUBLE_ARRAY,
+            )
+        return response
+
+    def set_data(self, requests):
+        self.set_data_requests = list(requests)
+
+    def get_data(self, request):
+        self.data_requests.append(request)
+        zone_counts = {zone_id: count for zone_id, count in self.zones.values()}
+        for zone_id in request.zones:
+            values = np.full(
+                zone_counts[zone_id] + self.extra_values,
+                zone_id + (100.0 if request.name == "SV_P" else 0.0),
+            )
+            yield SvarProtoModule.GetSvarDataResponse(
+                payloadInfo=SvarProtoModule.Info(
+                    fieldType=FieldDataProtoModule.FieldType.DOUBLE_ARRAY,
+                    fieldSize=values.size,
+                    zone=zone_id,
+                )
+            )
+            yield SvarProtoModule.GetSvarDataResponse(
+                payload=SvarProtoModule.Payload(bytePayload=values.tobytes())
+            )
+
+
+class _MockEventsManager:
+    _event_type = SolverEvent
+
+    def __init__(self):
+        self.callbacks = {}
+
+    def register_callback(self, event_name, callback):
+        self.callbacks[event_name] = callback
+
+
+def test_solution_variable_info_metadata_cache():
+    service = _MockSolutionVariableService()
+    events_manager = _MockEventsManager()
+    solution_variable_info = SolutionVariableInfo(
+        service, events_manager=events_manager
+    )
+    solution_variable_data = SolutionVariableData(service, solution_variable_info)
+    for _ in range(3):
+        data = solution_variable_data.get_data("SV_T", zone_names=["fluid", "wall"])
+    assert data["wall"].tolist() == [3.0, 3.0]
+    # One zones info and one solution variables info per zone
+    assert service.rpc_count == 3
+
+    # A new zone is found by refreshing the cached information.
+    service.zones["wall-shadow"] = (4, 2)
+    solution_variable_data.get_data("SV_T", zone_names=["wall-shadow"])
+    assert service.rpc_count == 5
+    with pytest.raises(ZoneError):
+        solution_variable_data.get_data("SV_T", zone_names=["outlet"])
+
+    version = solution_variable_info.metadata_version
+    events_manager.callbacks[SolverEvent.SOLUTION_INITIALIZED](None, None)
+    assert solution_variable_info.metadata_version == version + 1
+    rpc_count = service.rpc_count
+    solution_variable_data.get_data("SV_T", zone_names=["fluid"])
+    assert service.rpc_count == rpc_count + 2
+
+
+def test_solution_variable_data_bulk():
+    service = _MockSolutionVariableService()
+    solution_variable_data = SolutionVariableData(
+        service, SolutionVariableInfo(service)
+    )
+    bulk_data = solution_variable_data.get_data_bulk(
+        ["SV_T", "SV_P"], zone_names=["fluid", "wall"], num_streams=2
+    )
+    assert bulk_data.data.shape == (2, 7)
+    assert bulk_data.zones == ["fluid", "wall"]
+    assert bulk_data.zone_slice("wall") == slice(5, 7)
+    assert bulk_data["SV_T"].tolist() == [2.0] * 5 + [3.0] * 2
+    assert bulk_data.get("SV_P", "wall").tolist() == [103.0] * 2
+    assert len(service.data_requests) == 2
+
+    out = bulk_data.data
+    bulk_data = solution_variable_data.get_data_bulk(
+        ["SV_P", "SV_T"], zone_names=["fluid", "wall"], out=out
+    )
+    assert bulk_data.data is out
+    assert bulk_data.get("SV_P", "fluid").tolist() == [102.0] * 5
+    with pytest.raises(ValueError):
+        solution_variable_data.get_data_bulk(["SV_T"], zone_names=["fluid"], out=out)
+
+    for extra_values in [1, -1]:
+        service.extra_values = extra_values
+        with pytest.raises(ZoneSizeError):
+            solution_variable_data.get_data_bulk(["SV_T"], zone_names=["fluid", "wall"])
+
+
+def test_solution_variable_zone_counts_refreshed_after_mesh_change():
+    service = _MockSolutionVariableService()
+    solution_variable_info = SolutionVariableInfo(
+        service, events_manager=_MockEventsManager()
+    )
+    solution_variable_data = SolutionVariableData(service, solution_variable_info)
+    assert solution_variable_data.create_empty_array("SV_T", "wall").size == 2
+
+    # The zone counts change, for example, after the mesh is adapted.
+    service.zones["wall"] = (3, 4)
+    bulk_data = solution_variable_data.get_data_bulk(
+        ["SV_T"], zone_names=["fluid", "wall"]
+    )
+    assert bulk_data.data.shape == (1, 9)
+    assert bulk_data.get("SV_T", "wall").tolist() == [3.0] * 4
+
+    service.zones["wall"] = (3, 3)
+    version = solution_variable_info.metadata_version
+    data = solution_variable_data.get_data("SV_T", zone_names=["wall"])
+    assert data["wall"].tolist() == [3.0] * 3
+    assert solution_variable_info.metadata_version == version + 1
+    assert solution_variable_data.create_empty_array("SV_T", "wall").size == 3
+
+
+def test_solution_variable_set_data_from_memory_mapped_array(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "ansys.fluent.core.services.field_data._FieldDataConstants.chunk_size", 16
+    )
+    service = _MockSolutionVariableService()
+    solution_variable_data = SolutionVariableData(
+        service, SolutionVariableInfo(service)
+    )
+    np.save(tmp_path / "sv_t.npy", np.arange(5.0))
+    fluid_data = np.load(tmp_path / "sv_t.npy", mmap_mode="r")
+    solution_variable_data.set_data(
+        "SV_T", {"fluid": fluid_data, "wall": np.array([1, 2], dtype=np.int32)}
+    )
+    header, fluid_info, *requests = service.set_data_requests
+    assert header.header.name == "SV_T"
+    assert (fluid_info.payloadInfo.zone, fluid_info.payloadInfo.fieldSize) == (2, 5)
+    fluid_chunks = [request.payload.bytePayload for request in requests[:3]]
+    assert [len(chunk) for chunk in fluid_chunks] == [16, 16, 8]
+    assert np.frombuffer(b"".join(fluid_chunks)).tolist() == fluid_data.tolist()
+    assert requests[3].payloadInfo.zone == 3
+    assert np.frombuffer(requests[4].payload.bytePayload, np.int32).tolist() == [1, 2]
+
+
+def test_solution_variable_set_changed_zones_data():
+    service = _MockSolutionVariableService()
+    events_manager = _MockEventsManager()
+    solution_variable_data = SolutionVariableData(
+        service, SolutionVariableInfo(service, events_manager=events_manager)
+    )
+
+    def _sent_zones():
+        return [
+            request.payloadInfo.zone
+            for request in service.set_data_requests
+            if request.WhichOneof("array") == "payloadInfo"
+        ]
+
+    # Changes to data not uploaded yet are applied to the data read from Fluent.
+    sent = solution_variable_data.set_changed_zones_data(
+        "SV_T", {"fluid": ([0, 4], 7.0), "wall": (np.array([False, False]), 1.0)}
+    )
+    assert sent == ["fluid"]
+    assert len(service.data_requests) == 1
+    fluid_request = service.set_data_requests[2]
+    assert np.frombuffer(fluid_request.payload.bytePayload).tolist() == [
+        7.0,
+        2.0,
+        2.0,
+        2.0,
+        7.0,
+    ]
+
+    assert (
+        solution_variable_data.set_changed_zones_data(
+            "SV_T", {"fluid": np.array([7.0, 2.0, 2.0, 2.0, 7.0])}
+        )
+        == []
+    )
+    assert solution_variable_data.set_changed_zones_data(
+        "SV_T",
+        {
+            "fluid": (np.array([False, True, False, False, False]), 8.0),
+            "wall": np.array([1.0, 1.0]),
+        },
+    ) == ["fluid", "wall"]
+    assert _sent_zones() == [2, 3]
+    assert len(service.data_requests) == 1
+
+    # The uploaded data is discarded when the solution is initialized.
+    events_manager.callbacks[SolverEvent.SOLUTION_INITIALIZED](None, None)
+    assert solution_variable_data.set_changed_zones_data(
+        "SV_T", {"wall": np.array([1.0, 1.0])}
+    ) == ["wall"]
+
+
+def test_solution_variable_set_data_invalidates_field_data_cache():
+    service = _MockSolutionVariableService()
+    solution_variable_data = SolutionVariableData(
+        service, SolutionVariableInfo(service)
+    )
+    field_data_cache = FieldDataCache()
+    solution_variable_data._add_data_set_callback(field_data_cache.clear)
+    generation = field_data_cache.generation
+    solution_variable_data.set_data("SV_T", {"wall": np.zeros(2)})
+    assert field_data_cache.generation == generation + 1
+    solution_variable_data.set_changed_zones_data("SV_T", {"wall": np.ones(2)})
+    assert field_data_cache.generation == generation + 2
+    # Nothing is sent, so the cache is kept.
+    solution_variable_data.set_changed_zones_data("SV_T", {"wall": np.ones(2)})
+    assert field_data_cache.generation == generation + 2